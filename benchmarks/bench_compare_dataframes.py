@@ -0,0 +1,87 @@
+"""
+compare_dataframes: hash tabanlı vektörel motor ile eski yöntem (astype
+döngüleri + outer merge + iterrows) karşılaştırması, 1k - 1M satır.
+
+Kullanım:
+    python benchmarks/bench_compare_dataframes.py
+    python benchmarks/bench_compare_dataframes.py --sizes 1000 100000 --legacy-limit 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.excel_handler import compare_dataframes
+from benchmarks.synthetic import make_snapshot, mutate
+
+
+def compare_dataframes_legacy(old_df: pd.DataFrame, new_df: pd.DataFrame):
+    """Önceki sürüm (yalnızca karşılaştırma için)."""
+    if old_df.empty:
+        return True, "İlk veri toplama işlemi. Fiyat listesi oluşturuldu."
+
+    key_columns = [col for col in new_df.columns if col != 'Fiyat']
+
+    for df in [old_df, new_df]:
+        for col in df.columns:
+            df[col] = df[col].astype(str).str.strip()
+
+    merged_df = pd.merge(old_df, new_df, on=key_columns, how='outer', suffixes=('_eski', '_yeni'))
+    changed_prices = merged_df[merged_df['Fiyat_eski'] != merged_df['Fiyat_yeni']].dropna(subset=['Fiyat_eski', 'Fiyat_yeni'])
+    added_cars = merged_df[merged_df['Fiyat_eski'].isna()]
+    removed_cars = merged_df[merged_df['Fiyat_yeni'].isna()]
+
+    if changed_prices.empty and added_cars.empty and removed_cars.empty:
+        return False, ""
+
+    summary = ""
+    if not changed_prices.empty:
+        summary += "FİYATI DEĞİŞEN ARAÇLAR:\n"
+        for _, row in changed_prices.iterrows():
+            summary += f"- {row['Marka']} {row['Model']} ({row.get('Donanım', row.get('Yakıt/Donanım'))}): {row['Fiyat_eski']} -> {row['Fiyat_yeni']}\n"
+        summary += "\n"
+    if not added_cars.empty:
+        summary += "LİSTEYE YENİ EKLENEN ARAÇLAR:\n"
+        for _, row in added_cars.iterrows():
+            summary += f"- {row['Marka']} {row['Model']} ({row.get('Donanım', row.get('Yakıt/Donanım'))}): {row['Fiyat_yeni']}\n"
+        summary += "\n"
+    if not removed_cars.empty:
+        summary += "LİSTEDEN KALDIRILAN ARAÇLAR:\n"
+        for _, row in removed_cars.iterrows():
+            summary += f"- {row['Marka']} {row['Model']} ({row.get('Donanım', row.get('Yakıt/Donanım'))}): {row['Fiyat_eski']}\n"
+    return True, summary.strip()
+
+
+def timed(func, old, new):
+    start = time.perf_counter()
+    result = func(old.copy(), new.copy())
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--change-ratio', type=float, default=0.01)
+    parser.add_argument('--legacy-limit', type=int, default=1_000_000,
+                        help='Bu boyuttan büyük setlerde eski yöntem çalıştırılmaz')
+    args = parser.parse_args()
+
+    print(f"{'satır':>10}{'durum':>12}{'yeni (s)':>10}{'eski (s)':>10}{'hızlanma':>10}  aynı")
+    for size in args.sizes:
+        old = make_snapshot(size)
+        for label, new in (('değişmedi', old.sample(frac=1, random_state=0)), ('değişti', mutate(old, args.change_ratio))):
+            fast, fast_time = timed(compare_dataframes, old, new)
+            if size <= args.legacy_limit:
+                legacy, legacy_time = timed(compare_dataframes_legacy, old, new)
+                same = fast == legacy
+                print(f"{size:>10}{label:>12}{fast_time:>10.3f}{legacy_time:>10.3f}{legacy_time / fast_time:>9.1f}x  {same}")
+            else:
+                print(f"{size:>10}{label:>12}{fast_time:>10.3f}{'-':>10}{'-':>10}  -")
+
+
+if __name__ == '__main__':
+    main()
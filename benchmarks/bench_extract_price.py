@@ -0,0 +1,77 @@
+"""
+extract_price (tek tarayıcı çağrısı) ile extract_price_legacy (element başına
+WebDriver çağrısı) karşılaştırması.
+
+Kullanım:
+    python benchmarks/bench_extract_price.py --nodes 500 --repeat 5
+
+Yerel bir HTML sayfası oluşturulur ve headless Chrome ile açılır; canlı sitelere
+istek atılmaz.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from car_price_tracker import CarPriceTracker
+
+
+def build_page(nodes: int) -> str:
+    """'TL' geçen çok sayıda node içeren, gerçek sayfalara benzer bir HTML üretir."""
+    rows = []
+    for i in range(nodes):
+        if i % 3 == 0:
+            rows.append(f'<li>Aylık ödeme {1000 + i}.000 TL x 36 taksit</li>')
+        else:
+            rows.append(f'<li>Aksesuar paketi {i} - {5 + i % 40}.500 TL</li>')
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><title>Fiyat</title></head>
+<body>
+  <ul>{''.join(rows)}</ul>
+  <strong class="fiyat">Tavsiye edilen anahtar teslim fiyatı 1.234.567 TL</strong>
+</body></html>"""
+
+
+def timed(func, driver, repeat: int):
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(driver)
+        durations.append(time.perf_counter() - start)
+    return result, min(durations), sum(durations) / len(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=500, help="Sayfadaki 'TL' içeren node sayısı")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    tracker = CarPriceTracker(None, None, None)
+    with tempfile.NamedTemporaryFile('w', suffix='.html', delete=False, encoding='utf-8') as f:
+        f.write(build_page(args.nodes))
+        page_path = f.name
+
+    driver = tracker.setup_driver()
+    try:
+        driver.get('file://' + page_path)
+
+        legacy_price, legacy_min, legacy_avg = timed(tracker.extract_price_legacy, driver, args.repeat)
+        fast_price, fast_min, fast_avg = timed(tracker.extract_price, driver, args.repeat)
+    finally:
+        driver.quit()
+        os.remove(page_path)
+
+    print(f"Node sayısı: {args.nodes} | Tekrar: {args.repeat}")
+    print(f"{'Yöntem':<22}{'min (s)':>10}{'ort (s)':>10}  Sonuç")
+    print(f"{'extract_price_legacy':<22}{legacy_min:>10.3f}{legacy_avg:>10.3f}  {legacy_price}")
+    print(f"{'extract_price':<22}{fast_min:>10.3f}{fast_avg:>10.3f}  {fast_price}")
+    print(f"Hızlanma: {legacy_avg / fast_avg:.1f}x | Aynı sonuç: {legacy_price == fast_price}")
+
+
+if __name__ == '__main__':
+    main()
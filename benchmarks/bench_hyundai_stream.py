@@ -0,0 +1,99 @@
+"""
+Hyundai fiyat JSON'u için akışlı ayrıştırıcı (iter_price_records +
+ColumnarBuilder) ile eski yöntem (json.loads + iç içe döngüler + liste
+listesi) karşılaştırması. Büyük sentetik bir besleme üretilir; her yöntem ayrı
+bir süreçte çalıştırılarak ayrıştırma süresi ve en yüksek RSS ölçülür.
+
+Kullanım:
+    python benchmarks/bench_hyundai_stream.py --models 20000 --specs 25
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import write_hyundai_feed
+
+
+def parse_legacy(path: str):
+    import pandas as pd
+
+    with open(path, 'rb') as f:
+        json_data = json.loads(f.read())
+    price_data = []
+    for model_category in json_data.get('data', []):
+        for model in model_category.get('models', []):
+            model_name = model.get('modelName')
+            for spec in model.get('specs', []):
+                donanim = spec.get('specName')
+                fiyat = spec.get('price')
+                if model_name and donanim and fiyat:
+                    price_data.append([model_name, donanim, fiyat])
+    return pd.DataFrame(price_data, columns=['Model', 'Donanım', 'Fiyat'])
+
+
+def parse_stream(path: str):
+    from scrapers.hyundai_scraper import iter_price_records
+    from scrapers.streaming import ColumnarBuilder
+
+    def chunks():
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(64 * 1024)
+                if not chunk:
+                    return
+                yield chunk
+
+    return ColumnarBuilder(['Model', 'Donanım', 'Fiyat']).extend(iter_price_records(chunks())).to_frame()
+
+
+def worker(mode: str, path: str):
+    import pandas  # noqa: F401 - içe aktarma maliyeti ölçüme dahil olmasın
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    df = (parse_legacy if mode == 'legacy' else parse_stream)(path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'rows': len(df), 'seconds': elapsed, 'peak_mb': peak_kb / 1024,
+                      'delta_mb': (peak_kb - baseline_kb) / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=20000)
+    parser.add_argument('--specs', type=int, default=25)
+    parser.add_argument('--worker', choices=['legacy', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.path)
+        return
+
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        write_hyundai_feed(path, args.models, args.specs)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"Besleme: {args.models} model x {args.specs} donanım ({size_mb:.0f} MB)")
+        print(f"{'Yöntem':<8}{'satır':>10}{'süre (s)':>10}{'tepe RSS (MB)':>15}{'artış (MB)':>12}")
+        for mode in ('legacy', 'stream'):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', mode, '--path', path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            stats = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<8}{stats['rows']:>10}{stats['seconds']:>10.2f}{stats['peak_mb']:>15.0f}{stats['delta_mb']:>12.0f}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
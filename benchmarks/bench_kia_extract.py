@@ -0,0 +1,46 @@
+"""
+Kia fiyat listesi sayfasından gtmModelPriceData çıkarma: bayt tarayıcı +
+raw_decode (extract_gtm_price_data) ile BeautifulSoup yolu
+(extract_gtm_price_data_soup) karşılaştırması.
+
+Kullanım:
+    python benchmarks/bench_kia_extract.py --repeat 50
+    python benchmarks/bench_kia_extract.py --fixture kaydedilmis_sayfa.html
+"""
+import argparse
+import os
+import sys
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from scrapers.kia_scraper import extract_gtm_price_data, extract_gtm_price_data_soup
+
+DEFAULT_FIXTURE = os.path.join(BENCH_DIR, 'fixtures', 'kia_fiyat_listesi.html')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    with open(args.fixture, 'rb') as f:
+        content = f.read()
+
+    fast = extract_gtm_price_data(content)
+    soup = extract_gtm_price_data_soup(content)
+
+    fast_time = min(timeit.repeat(lambda: extract_gtm_price_data(content), number=1, repeat=args.repeat))
+    soup_time = min(timeit.repeat(lambda: extract_gtm_price_data_soup(content), number=1, repeat=args.repeat))
+
+    print(f"Sayfa: {args.fixture} ({len(content) / 1024:.0f} KB) | Tekrar: {args.repeat}")
+    print(f"{'Yöntem':<14}{'min (ms)':>10}")
+    print(f"{'raw_decode':<14}{fast_time * 1000:>10.2f}")
+    print(f"{'BeautifulSoup':<14}{soup_time * 1000:>10.2f}")
+    print(f"Hızlanma: {soup_time / fast_time:.0f}x | Aynı sonuç: {fast == soup}")
+
+
+if __name__ == '__main__':
+    main()
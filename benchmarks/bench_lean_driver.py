@@ -0,0 +1,74 @@
+"""
+Tam ve hafif (lean) Chrome modlarında sayfa yükleme süresi ve aktarılan bayt
+karşılaştırması.
+
+Kullanım:
+    python benchmarks/bench_lean_driver.py --limit 4
+    python benchmarks/bench_lean_driver.py --url https://www.kia.com/tr/modeller/ev3/satin-al.html
+
+Varsayılan olarak CarPriceTracker'daki model sayfalarını canlı olarak açar.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from car_price_tracker import CarPriceTracker
+from utils.lean_browser import apply_lean_rules
+from utils.model_catalog import ModelCatalog
+
+
+def measure(lean: bool, urls: list) -> dict:
+    tracker = CarPriceTracker(None, None, None, lean=lean, http_tier=False)
+    mode = 'lean' if lean else 'full'
+    driver = tracker.setup_driver()
+    try:
+        for url in urls:
+            if lean:
+                apply_lean_rules(driver)
+            start = time.perf_counter()
+            try:
+                driver.get(url)
+                tracker.page_waiter.wait_for_price(driver, url)
+                price = tracker.extract_price(driver)
+            except Exception as e:
+                print(f"   ✗ {url}: {str(e)[:60]}")
+                continue
+            tracker.page_stats.record(driver, mode, time.perf_counter() - start)
+            print(f"   [{mode}] {url} -> {price}")
+            driver.delete_all_cookies()
+    finally:
+        driver.quit()
+    return tracker.page_stats.summary().get(mode)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', action='append', help='Ölçülecek URL (birden fazla verilebilir)')
+    parser.add_argument('--limit', type=int, default=4, help='--url verilmezse marka başına model sayısı')
+    args = parser.parse_args()
+
+    catalog = ModelCatalog.load()
+    urls = args.url or [
+        model['url']
+        for brand in catalog.brands
+        for model in catalog.models(brand)[:args.limit]
+    ]
+
+    results = {'full': measure(False, urls), 'lean': measure(True, urls)}
+
+    print(f"\n{'Mod':<6}{'sayfa':>7}{'ort (s)':>10}{'ort KB':>10}{'istek':>8}")
+    for mode, stats in results.items():
+        if stats:
+            print(f"{mode:<6}{stats['pages']:>7}{stats['avg_seconds']:>10.2f}{stats['avg_kb']:>10.0f}{stats['avg_requests']:>8.0f}")
+
+    if results['full'] and results['lean']:
+        full, lean = results['full'], results['lean']
+        print(f"\nSüre kazancı: %{(1 - lean['avg_seconds'] / full['avg_seconds']) * 100:.0f} | "
+              f"Bayt kazancı: %{(1 - lean['avg_kb'] / max(full['avg_kb'], 1e-9)) * 100:.0f}")
+
+
+if __name__ == '__main__':
+    main()
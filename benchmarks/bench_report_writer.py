@@ -0,0 +1,83 @@
+"""
+CarPriceTracker.save_to_excel: akış halinde yazan StreamingReportWriter ile
+eski yöntem (DataFrame + pd.ExcelWriter + Durum sütununu hücre hücre boyama)
+karşılaştırması. Süre ve tracemalloc tepe belleği ölçülür.
+
+Kullanım:
+    python benchmarks/bench_report_writer.py
+    python benchmarks/bench_report_writer.py --sizes 1000 50000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from car_price_tracker import CarPriceTracker
+from benchmarks.synthetic import REPORT_COLUMNS as COLUMNS, make_report_rows
+
+
+def save_to_excel_legacy(data, filename):
+    """Önceki sürüm (yalnızca karşılaştırma için)."""
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    df = pd.DataFrame(data)[COLUMNS]
+    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Fiyatlar', index=False)
+        worksheet = writer.sheets['Fiyatlar']
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF")
+        for cell in worksheet[1]:
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+        for row in range(2, len(df) + 2):
+            status_cell = worksheet[f'E{row}']
+            if 'Başarılı' in str(status_cell.value):
+                status_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+            elif 'Başarısız' in str(status_cell.value):
+                status_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+
+
+def measure(func):
+    # Süre tracemalloc'un yükü olmadan, bellek ayrı bir çalıştırmada ölçülür
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 20_000])
+    args = parser.parse_args()
+
+    tracker = CarPriceTracker.__new__(CarPriceTracker)
+    tracker.success_count = tracker.fail_count = 0
+
+    print(f"{'satır':>8}{'yeni (s)':>10}{'yeni (MB)':>11}{'eski (s)':>10}{'eski (MB)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            rows = make_report_rows(size)
+            tracker.excel_filename = os.path.join(tmp, 'yeni.xlsx')
+            with open(os.devnull, 'w') as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    new_time, new_mem = measure(lambda: tracker.save_to_excel(rows))
+                finally:
+                    sys.stdout = stdout
+            old_time, old_mem = measure(lambda: save_to_excel_legacy(rows, os.path.join(tmp, 'eski.xlsx')))
+            print(f"{size:>8}{new_time:>10.2f}{new_mem:>11.1f}{old_time:>10.2f}{old_mem:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Kayıtlı sayfaları canlı sitelerin yerine sunan yerel HTTP sunucusu.
+
+Gecikme ve hata oranı ayarlanabilir; ETag / If-None-Match desteklenir, böylece
+koşullu GET yolu da ölçülebilir. Sunucu bir thread'de çalışır ve rastgele
+boş bir portu dinler.
+
+Elle çalıştırmak için:
+    python benchmarks/fixture_server.py --port 8000 --latency 0.2 --error-rate 0.1
+"""
+import argparse
+import hashlib
+import os
+import random
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Canlı sitelerdeki yol -> fixture dosyası
+DEFAULT_ROUTES = {
+    '/content/dam/hyundai/tr/tr/json/satin-al/fiyat-listesi-binek.json': 'hyundai_fiyat_listesi.json',
+    '/tr/satis-merkezi/fiyat-listesi.html': 'kia_fiyat_listesi.html',
+    '/tr/tr/modeller/tucson/satinal': 'hyundai_satinal.html',
+    '/tr/modeller/sportage-nq5/satin-al.html': 'kia_satin_al.html',
+}
+
+CONTENT_TYPES = {
+    '.json': 'application/json; charset=utf-8',
+    '.html': 'text/html; charset=utf-8',
+}
+
+
+class FixtureServer:
+    """
+    `with FixtureServer(latency=0.05, error_rate=0.1) as server:` ile başlatılır;
+    `server.url(yol)` sunucudaki tam adresi verir.
+
+    routes: yol -> fixture dosya adı ya da bayt içerik
+    latency: her yanıt öncesi bekleme (sn); jitter kadar rastgele ek süre eklenir
+    error_rate: 503 (Retry-After ile) dönen isteklerin oranı
+    """
+
+    def __init__(self, routes: dict = None, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 seed: int = 0, host: str = '127.0.0.1', port: int = 0):
+        self.routes = {}
+        for path, source in (routes or DEFAULT_ROUTES).items():
+            self.add_route(path, source)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.stats = {'requests': 0, 'errors': 0, 'not_modified': 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def add_route(self, path: str, source, content_type: str = None):
+        """
+        `source` fixtures/ altındaki bir dosya adı, başka bir dosyanın tam yolu
+        ya da doğrudan bayt içerik olabilir. Dosyalar belleğe alınmadan parça
+        parça gönderilir (büyük sentetik beslemeler için).
+        """
+        if isinstance(source, bytes):
+            etag = '"' + hashlib.sha1(source).hexdigest() + '"'
+            self.routes[path] = (source, content_type or CONTENT_TYPES['.html'], etag)
+            return
+        filename = source if os.path.isabs(source) else os.path.join(FIXTURE_DIR, source)
+        stat = os.stat(filename)
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        content_type = content_type or CONTENT_TYPES.get(os.path.splitext(filename)[1], 'application/octet-stream')
+        self.routes[path] = (filename, content_type, etag)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def _decide(self):
+        """(bekleme süresi, hata dönülsün mü)"""
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate > 0 and self.rng.random() < self.error_rate
+            if failed:
+                self.stats['errors'] += 1
+        return delay, failed
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                delay, failed = server._decide()
+                if delay:
+                    time.sleep(delay)
+                route = server.routes.get(self.path.split('?')[0])
+                if failed:
+                    self._respond(503, b'Service Unavailable', 'text/plain', {'Retry-After': '1'})
+                elif route is None:
+                    self._respond(404, b'Not Found', 'text/plain')
+                else:
+                    body, content_type, etag = route
+                    if self.headers.get('If-None-Match') == etag:
+                        with server._lock:
+                            server.stats['not_modified'] += 1
+                        self._respond(304, b'', content_type, {'ETag': etag})
+                    elif isinstance(body, str):
+                        self._respond_file(body, content_type, {'ETag': etag})
+                    else:
+                        self._respond(200, body, content_type, {'ETag': etag})
+
+            def _send_headers(self, status, length, content_type, headers):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(length))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+
+            def _respond(self, status, body, content_type, headers=None):
+                self._send_headers(status, len(body), content_type, headers)
+                if body:
+                    self.wfile.write(body)
+
+            def _respond_file(self, filename, content_type, headers=None):
+                self._send_headers(200, os.path.getsize(filename), content_type, headers)
+                with open(filename, 'rb') as f:
+                    shutil.copyfileobj(f, self.wfile, 256 * 1024)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help="Yanıt başına gecikme (sn)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Gecikmeye eklenecek en fazla rastgele süre (sn)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 dönen isteklerin oranı (0-1)")
+    args = parser.parse_args()
+
+    server = FixtureServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, port=args.port)
+    server.start()
+    print(f"🌐 Fixture sunucusu: {server.base_url}")
+    for path in server.routes:
+        print(f"   {server.url(path)}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
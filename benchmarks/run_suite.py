@@ -0,0 +1,447 @@
+"""
+Canlı sitelere istek atmadan çalışan benchmark takımı.
+
+Scraper'lar kayıtlı fixture'ları sunan yerel bir HTTP sunucusuna yönlendirilir
+(gecikme ve hata oranı ayarlanabilir); diğer ölçümler sentetik veri setleriyle
+yapılır. Sonuçlar benchmarks/baseline.json'daki kayıtla karşılaştırılır:
+süre toleranstan fazla uzadıysa ya da sonuç özeti değiştiyse işaretlenir.
+
+Kullanım:
+    python benchmarks/run_suite.py                        # small ölçek, baseline ile karşılaştır
+    python benchmarks/run_suite.py --scale large          # milyonlarca satır
+    python benchmarks/run_suite.py --only kia_scrape compare_dataframes
+    python benchmarks/run_suite.py --latency 0.05 --error-rate 0.1
+    python benchmarks/run_suite.py --save-baseline        # mevcut sonuçları baseline olarak kaydet
+    python benchmarks/run_suite.py --check                # regresyonda çıkış kodu 1
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+# Yerel sunucuya yapılan istekler host hız sınırına takılmasın
+os.environ.setdefault('HOST_RATE', '1000')
+os.environ.setdefault('HOST_MAX_RATE', '1000')
+
+from benchmarks.fixture_server import FixtureServer, DEFAULT_ROUTES, FIXTURE_DIR
+from benchmarks import synthetic
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+SCALES = {
+    'small': {
+        'hyundai_models': 500, 'hyundai_specs': 20,
+        'kia_models': 500, 'kia_trims': 20,
+        'pages': 20,
+        'prices': 100_000,
+        'snapshot_rows': 100_000,
+        'excel_rows': 10_000,
+        'repeat': 3,
+    },
+    'large': {
+        'hyundai_models': 100_000, 'hyundai_specs': 20,
+        'kia_models': 50_000, 'kia_trims': 20,
+        'pages': 200,
+        'prices': 2_000_000,
+        'snapshot_rows': 2_000_000,
+        'excel_rows': 1_000_000,
+        'repeat': 1,
+    },
+}
+
+HYUNDAI_PATH = '/content/dam/hyundai/tr/tr/json/satin-al/fiyat-listesi-binek.json'
+KIA_PATH = '/tr/satis-merkezi/fiyat-listesi.html'
+MODEL_PAGE_PATHS = ['/tr/tr/modeller/tucson/satinal', '/tr/modeller/sportage-nq5/satin-al.html']
+
+
+def frame_fingerprint(df) -> str:
+    import pandas as pd
+
+    if df is None or df.empty:
+        return 'empty'
+    hashes = pd.util.hash_pandas_object(df.reset_index(drop=True), index=False)
+    return hashlib.sha1(hashes.values.tobytes()).hexdigest()[:12]
+
+
+def text_fingerprint(values) -> str:
+    digest = hashlib.sha1()
+    for value in values:
+        digest.update(str(value).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:12]
+
+
+class Context:
+    """Bir çalıştırmadaki ortak kaynaklar: sunucu, ölçek ve geçici dizin."""
+
+    def __init__(self, server: FixtureServer, scale: dict, tmp: str):
+        self.server = server
+        self.scale = scale
+        self.tmp = tmp
+        self._tracker = None
+        # Çalıştırma sonunda çağrılacak kapatma fonksiyonları (ör. Chrome)
+        self.cleanup = []
+
+    def tracker(self):
+        # Selenium yalnızca tracker gerektiren ölçümlerde yüklenir
+        if self._tracker is None:
+            from car_price_tracker import CarPriceTracker
+
+            self._tracker = CarPriceTracker(None, None, None, http_tier=False)
+            self._tracker.excel_filename = os.path.join(self.tmp, 'rapor.xlsx')
+        return self._tracker
+
+    def fresh_cache(self):
+        from scrapers.http_cache import HttpCache
+
+        return HttpCache(tempfile.mkdtemp(dir=self.tmp))
+
+
+def _scrape(scraper_class, ctx, path, cache=None):
+    scraper = scraper_class()
+    scraper.url = ctx.server.url(path)
+    scraper.http_cache = cache or ctx.fresh_cache()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = scraper.scrape()
+    return len(df), frame_fingerprint(df)
+
+
+# Her ölçüm bir kez hazırlanır (setup), sonra `repeat` kez çalıştırılır.
+# setup(ctx) -> run() ; run() -> (satır sayısı, sonuç özeti)
+
+def setup_hyundai_scrape(ctx):
+    from scrapers.hyundai_scraper import HyundaiScraper
+
+    return lambda: _scrape(HyundaiScraper, ctx, HYUNDAI_PATH)
+
+
+def setup_hyundai_scrape_synthetic(ctx):
+    from scrapers.hyundai_scraper import HyundaiScraper
+
+    path = os.path.join(ctx.tmp, 'hyundai_feed.json')
+    synthetic.write_hyundai_feed(path, ctx.scale['hyundai_models'], ctx.scale['hyundai_specs'])
+    ctx.server.add_route('/synthetic/hyundai.json', path)
+    return lambda: _scrape(HyundaiScraper, ctx, '/synthetic/hyundai.json')
+
+
+def setup_kia_scrape(ctx):
+    from scrapers.kia_scraper import KiaScraper
+
+    return lambda: _scrape(KiaScraper, ctx, KIA_PATH)
+
+
+def setup_kia_scrape_synthetic(ctx):
+    from scrapers.kia_scraper import KiaScraper
+
+    with open(os.path.join(FIXTURE_DIR, DEFAULT_ROUTES[KIA_PATH]), 'rb') as f:
+        template = f.read()
+    page = synthetic.kia_price_page(template, ctx.scale['kia_models'], ctx.scale['kia_trims'])
+    ctx.server.add_route('/synthetic/kia.html', page)
+    return lambda: _scrape(KiaScraper, ctx, '/synthetic/kia.html')
+
+
+def setup_kia_scrape_not_modified(ctx):
+    """Koşullu GET: sunucu 304 döner, önbellekteki DataFrame kullanılır."""
+    from scrapers.kia_scraper import KiaScraper
+
+    cache = ctx.fresh_cache()
+    _scrape(KiaScraper, ctx, KIA_PATH, cache)
+    return lambda: _scrape(KiaScraper, ctx, KIA_PATH, cache)
+
+
+def setup_extract_price_http(ctx):
+    from utils.http_fetcher import HttpPriceFetcher
+
+    fetcher = HttpPriceFetcher()
+    urls = [ctx.server.url(MODEL_PAGE_PATHS[i % len(MODEL_PAGE_PATHS)]) for i in range(ctx.scale['pages'])]
+
+    def run():
+        prices = []
+        for url in urls:
+            try:
+                prices.append(fetcher.fetch_price(url)[0])
+            except Exception as e:
+                prices.append(f'hata: {type(e).__name__}')
+        return len(prices), text_fingerprint(prices)
+
+    return run
+
+
+def setup_extract_price_browser(ctx):
+    """Chrome gerektirir; --browser ile etkinleşir."""
+    tracker = ctx.tracker()
+    driver = tracker.setup_driver()
+    ctx.cleanup.append(driver.quit)
+    urls = [ctx.server.url(MODEL_PAGE_PATHS[i % len(MODEL_PAGE_PATHS)]) for i in range(ctx.scale['pages'])]
+
+    def run():
+        prices = []
+        for url in urls:
+            driver.get(url)
+            prices.append(tracker.extract_price(driver, url))
+        return len(prices), text_fingerprint(prices)
+
+    return run
+
+
+# Onay verilene kadar çerez banner'ı gösteren model sayfası (onay çerezde tutulur)
+CONSENT_PAGE_PATH = '/consent/model.html'
+CONSENT_PAGE = """<!DOCTYPE html><html><body>
+<div class="price">1.234.567 TL</div>
+<div id="banner" style="display:none">Çerezleri kullanıyoruz
+<button onclick="document.cookie='cookieconsent_status=allow; max-age=31536000; path=/';
+document.getElementById('banner').remove()">Tümünü kabul et</button></div>
+<script>if (document.cookie.indexOf('cookieconsent_status=') < 0) {
+document.getElementById('banner').style.display = 'block'; }</script>
+</body></html>""".encode('utf-8')
+
+
+def _consent_page_driver(ctx):
+    tracker = ctx.tracker()
+    driver = tracker.setup_driver()
+    ctx.cleanup.append(driver.quit)
+    ctx.server.add_route(CONSENT_PAGE_PATH, CONSENT_PAGE)
+    return tracker, driver, ctx.server.url(CONSENT_PAGE_PATH)
+
+
+def setup_close_popups_legacy_browser(ctx):
+    """Chrome gerektirir. Eski yol: her sayfada banner çıkar, XPath sorgularıyla kapatılır."""
+    tracker, driver, url = _consent_page_driver(ctx)
+
+    def run():
+        banners = []
+        for _ in range(ctx.scale['pages']):
+            driver.delete_all_cookies()
+            driver.get(url)
+            banners.append(driver.execute_script("return !!document.getElementById('banner')"))
+            tracker.close_popups_legacy(driver)
+        return len(banners), text_fingerprint(banners)
+
+    return run
+
+
+def setup_close_popups_browser(ctx):
+    """
+    Chrome gerektirir. Yeni yol: boş kayıtla başlar; ilk banner tek script'le
+    kapatılıp onay yakalanır, sonraki sayfalarda gezinmeden önce yüklenir.
+    """
+    from utils.consent import ConsentStore
+
+    tracker, driver, url = _consent_page_driver(ctx)
+
+    def run():
+        tracker.consent = ConsentStore(os.path.join(ctx.tmp, 'consent_state.json'))
+        seeded_hosts = set()
+        banners = []
+        for _ in range(ctx.scale['pages']):
+            # Havuzun marka değişiminde yaptığı gibi çerezler silinir
+            driver.delete_all_cookies()
+            tracker.consent.seed(driver, url, seeded_hosts)
+            driver.get(url)
+            banners.append(driver.execute_script("return !!document.getElementById('banner')"))
+            tracker.close_popups(driver, url)
+        return len(banners), text_fingerprint(banners)
+
+    return run
+
+
+def setup_clean_price(ctx):
+    # Tarayıcıdan gelen her fiyat için çağrılan tek değer yolu; toplu yol parse_prices
+    tracker = ctx.tracker()
+    texts = synthetic.price_texts(ctx.scale['prices'])
+
+    def run():
+        cleaned = [tracker.clean_price(text) for text in texts]
+        return len(cleaned), text_fingerprint(cleaned)
+
+    return run
+
+
+def setup_parse_prices(ctx):
+    from utils.price_normalize import parse_prices
+
+    texts = synthetic.price_texts(ctx.scale['prices'])
+
+    def run():
+        kurus = parse_prices(texts)
+        return len(kurus), text_fingerprint(kurus.tolist())
+
+    return run
+
+
+def setup_compare_dataframes(ctx):
+    from utils.excel_handler import compare_dataframes
+
+    old = synthetic.make_snapshot(ctx.scale['snapshot_rows'])
+    new = synthetic.mutate(old, 0.01)
+
+    def run():
+        has_changed, summary = compare_dataframes(old.copy(), new.copy())
+        return len(new), text_fingerprint([has_changed, summary])
+
+    return run
+
+
+def setup_excel_write(ctx):
+    tracker = ctx.tracker()
+    size = ctx.scale['excel_rows']
+
+    def run():
+        # run() ile aynı yol: satırlar geldikçe ana ve marka sayfalarına akar
+        writer = tracker.open_report(['Hyundai', 'Kia'])
+        try:
+            for row in synthetic.iter_report_rows(size):
+                tracker.write_report_row(writer, row)
+        finally:
+            writer.close()
+        return size, str(size)
+
+    return run
+
+
+CASES = {
+    'hyundai_scrape': setup_hyundai_scrape,
+    'hyundai_scrape_synthetic': setup_hyundai_scrape_synthetic,
+    'kia_scrape': setup_kia_scrape,
+    'kia_scrape_synthetic': setup_kia_scrape_synthetic,
+    'kia_scrape_not_modified': setup_kia_scrape_not_modified,
+    'extract_price_http': setup_extract_price_http,
+    'extract_price_browser': setup_extract_price_browser,
+    'close_popups_legacy_browser': setup_close_popups_legacy_browser,
+    'close_popups_browser': setup_close_popups_browser,
+    'clean_price': setup_clean_price,
+    'parse_prices': setup_parse_prices,
+    'compare_dataframes': setup_compare_dataframes,
+    'excel_write': setup_excel_write,
+}
+
+# Chrome gerektiren ölçümler varsayılan olarak çalıştırılmaz
+BROWSER_CASES = {'extract_price_browser', 'close_popups_legacy_browser', 'close_popups_browser'}
+
+
+def run_case(setup, ctx, repeat: int) -> dict:
+    run = setup(ctx)
+    durations = []
+    rows = fingerprint = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows, fingerprint = run()
+        durations.append(time.perf_counter() - start)
+    return {'seconds': min(durations), 'median': statistics.median(durations), 'rows': rows,
+            'fingerprint': fingerprint}
+
+
+def load_baseline(filename: str = BASELINE_FILE) -> dict:
+    try:
+        with open(filename, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(results: dict, scale_name: str, settings: dict, filename: str = BASELINE_FILE):
+    """Ölçeğin baseline'ını günceller; diğer ölçeklerin kayıtları korunur."""
+    baseline = load_baseline(filename)
+    section = baseline.setdefault(scale_name, {'settings': settings, 'cases': {}})
+    section['settings'] = settings
+    for name, result in results.items():
+        section['cases'][name] = {'seconds': round(result['seconds'], 4), 'rows': result['rows'],
+                                  'fingerprint': result['fingerprint']}
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(result: dict, expected: dict, tolerance: float):
+    """(durum, oran) döndürür; durum 'ok', 'yavaş', 'sonuç farklı' ya da 'yeni'."""
+    if not expected:
+        return 'yeni', None
+    ratio = result['seconds'] / expected['seconds'] if expected['seconds'] else None
+    if result['fingerprint'] != expected['fingerprint'] or result['rows'] != expected['rows']:
+        return 'sonuç farklı', ratio
+    if ratio is not None and ratio > 1 + tolerance:
+        return 'yavaş', ratio
+    return 'ok', ratio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--only', nargs='+', choices=sorted(CASES), help="Yalnızca bu ölçümleri çalıştır")
+    parser.add_argument('--browser', action='store_true', help="Chrome gerektiren ölçümleri de çalıştır")
+    parser.add_argument('--repeat', type=int, help="Tekrar sayısı (varsayılan ölçeğe göre)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Sunucu yanıt gecikmesi (sn)")
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Sunucunun 503 döndüğü isteklerin oranı")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Baseline'a göre kabul edilen yavaşlama oranı (0.25 = %%25)")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--check', action='store_true', help="Regresyon varsa 1 ile çık")
+    parser.add_argument('--output', help="Sonuçları JSON olarak bu dosyaya yaz")
+    args = parser.parse_args()
+
+    scale = SCALES[args.scale]
+    repeat = args.repeat or scale['repeat']
+    names = args.only or [name for name in CASES if args.browser or name not in BROWSER_CASES]
+    settings = {'latency': args.latency, 'jitter': args.jitter, 'error_rate': args.error_rate}
+
+    expected_section = load_baseline(args.baseline).get(args.scale, {})
+    if expected_section and expected_section.get('settings') != settings:
+        print(f"⚠️  Baseline farklı sunucu ayarlarıyla kaydedilmiş: {expected_section.get('settings')}")
+    expected_cases = expected_section.get('cases', {})
+
+    print(f"📏 Ölçek: {args.scale} | Tekrar: {repeat} | Sunucu: gecikme {args.latency}s, "
+          f"jitter {args.jitter}s, hata oranı %{args.error_rate * 100:.0f}")
+    print(f"{'Ölçüm':<26}{'satır':>10}{'min (s)':>10}{'medyan (s)':>11}{'baseline':>10}{'oran':>7}  Durum")
+
+    results = {}
+    regressions = 0
+    with tempfile.TemporaryDirectory() as tmp, \
+            FixtureServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate) as server:
+        ctx = Context(server, scale, tmp)
+        try:
+            for name in names:
+                try:
+                    result = run_case(CASES[name], ctx, repeat)
+                except Exception as e:
+                    print(f"{name:<26}{'-':>10}{'-':>10}{'-':>11}{'-':>10}{'-':>7}  ❌ {type(e).__name__}: {str(e)[:60]}")
+                    regressions += 1
+                    continue
+                results[name] = result
+                expected = expected_cases.get(name)
+                status, ratio = compare(result, expected, args.tolerance)
+                if status in ('yavaş', 'sonuç farklı'):
+                    regressions += 1
+                icon = {'ok': '✅', 'yeni': '🆕', 'yavaş': '⚠️ ', 'sonuç farklı': '❌'}[status]
+                print(f"{name:<26}{result['rows']:>10}{result['seconds']:>10.3f}{result['median']:>11.3f}"
+                      f"{(expected['seconds'] if expected else float('nan')):>10.3f}"
+                      f"{(f'{ratio:.2f}x' if ratio else '-'):>7}  {icon} {status}")
+        finally:
+            for cleanup in ctx.cleanup:
+                cleanup()
+        print(f"🌐 Sunucu: {server.stats['requests']} istek | {server.stats['errors']} hata (503) | "
+              f"{server.stats['not_modified']} 304")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'scale': args.scale, 'settings': settings, 'results': results}, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        save_baseline(results, args.scale, settings, args.baseline)
+        print(f"💾 Baseline kaydedildi: {args.baseline} ({args.scale})")
+    elif regressions:
+        print(f"⚠️  {regressions} ölçümde regresyon ya da hata var")
+    return 1 if args.check and regressions and not args.save_baseline else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark'ların ortak kullandığı sentetik veri üreticileri.
+
+Her üretici deterministiktir (aynı parametre -> aynı çıktı); böylece sonuçlar
+kayıtlı baseline ile karşılaştırılabilir.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+REPORT_COLUMNS = ['Marka', 'Model', 'Fiyat', 'Fiyat (Temiz)', 'Durum', 'Tarih', 'URL']
+
+
+def tl(value: int) -> str:
+    return f"{value:,} TL".replace(',', '.')
+
+
+def write_hyundai_feed(path: str, models: int, specs: int):
+    """data -> models -> specs yapısında sentetik Hyundai beslemesi yazar (bellekte tutmadan)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"data": [')
+        per_category = max(1, models // 10)
+        for category in range(0, models, per_category):
+            if category:
+                f.write(',')
+            f.write(json.dumps({'categoryName': f'Kategori {category}'})[:-1] + ', "models": [')
+            for i in range(category, min(models, category + per_category)):
+                if i != category:
+                    f.write(',')
+                model = {
+                    'modelName': f'Model {i}',
+                    'modelCode': f'M{i:06d}',
+                    'specs': [
+                        {'specName': f'1.6 T-GDI Donanım {j}', 'price': tl(1_000_000 + i * 37 + j * 1000),
+                         'options': [{'name': 'Paket', 'price': 25_000}]}
+                        for j in range(specs)
+                    ],
+                }
+                f.write(json.dumps(model, ensure_ascii=False))
+            f.write(']}')
+        f.write(']}')
+
+
+def kia_price_page(template: bytes, models: int, trims: int) -> bytes:
+    """
+    Kayıtlı Kia fiyat listesi sayfasındaki gtmModelPriceData dizisini
+    `models` x `trims` boyutunda sentetik bir diziyle değiştirir.
+    """
+    marker = b'gtmModelPriceData: '
+    start = template.index(marker) + len(marker)
+    end = template.index(b';\n', start)
+    data = [
+        {'modelName': f'Model {i}', 'modelCode': f'M{i:06d}',
+         'trim': [{'name': f'1.6 T-GDI Donanım {j}', 'price': 1_000_000 + i * 37 + j * 1000,
+                   'campaignPrice': None, 'currency': 'TRY'} for j in range(trims)]}
+        for i in range(models)
+    ]
+    return template[:start] + json.dumps(data, ensure_ascii=False).encode('utf-8') + template[end:]
+
+
+def price_texts(size: int, seed: int = 0) -> list:
+    """Sitelerde görülen biçimlerde fiyat metinleri (tekrarlı, birkaç bozuk değerle)."""
+    rng = np.random.default_rng(seed)
+    values = rng.integers(800, 5000, size) * 1000
+    formats = ['{} TL', '₺{}', '{},00 TL', 'Tavsiye edilen fiyat: {} TL']
+    texts = [formats[i % len(formats)].format(tl(int(v))[:-3]) for i, v in enumerate(values)]
+    for i in range(0, size, 997):
+        texts[i] = 'Fiyat sitede bulunamadı'
+    return texts
+
+
+def make_snapshot(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Model / Donanım / Fiyat / Marka sütunlarında sentetik fiyat snapshot'ı."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows)
+    prices = rng.integers(800, 5000, rows) * 1000
+    return pd.DataFrame({
+        'Model': pd.Series(ids // 20).map('Model {}'.format),
+        'Donanım': pd.Series(ids % 20).map('Donanım {}'.format),
+        'Fiyat': pd.Series(prices).map(lambda p: f"{p:,} TL".replace(',', '.')),
+        'Marka': np.where(ids % 2 == 0, 'Hyundai', 'Kia'),
+    })
+
+
+def mutate(df: pd.DataFrame, change_ratio: float, seed: int = 1) -> pd.DataFrame:
+    """Fiyatların bir kısmını değiştirir, birkaç satır ekler ve çıkarır."""
+    rng = np.random.default_rng(seed)
+    new = df.copy()
+    changed = rng.random(len(new)) < change_ratio
+    new.loc[changed, 'Fiyat'] = new.loc[changed, 'Fiyat'].str.replace(' TL', '.5 TL', regex=False)
+    drop = max(1, len(new) // 1000)
+    new = new.iloc[drop:]
+    extra = df.head(drop).assign(Model=lambda d: d['Model'] + ' Yeni')
+    return pd.concat([new, extra], ignore_index=True)
+
+
+def iter_report_rows(size: int):
+    """CarPriceTracker rapor satırları (liste oluşturmadan)."""
+    for i in range(size):
+        yield {
+            'Marka': 'Hyundai' if i % 2 else 'Kia',
+            'Model': f'Model {i % 50}',
+            'Fiyat': tl(1_000_000 + i * 1000),
+            'Fiyat (Temiz)': tl(1_000_000 + i * 1000),
+            'Durum': 'Başarılı' if i % 10 else 'Başarısız - Hata',
+            'Tarih': '2026-10-18 09:00:00',
+            'URL': f'https://example.com/model/{i}',
+        }
+
+
+def make_report_rows(size: int) -> list:
+    return list(iter_report_rows(size))
@@ -2,24 +2,77 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import pandas as pd
+from selenium.common.exceptions import TimeoutException
 from datetime import datetime
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email.mime.text import MIMEText
-from email import encoders
 import time
 import os
-import re
 import sys
 import traceback
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from utils.driver_pool import DriverPool
+from utils.page_wait import PageWaiter
+from utils.scrape_cache import ScrapeCache
+from utils.price_rules import PRICE_SELECTORS, EXCLUDED_PRICE_WORDS, is_price_text, pick_best_price
+from utils.price_normalize import parse_price, format_price, PRICE_KURUS_COLUMN, PRICE_INVALID_COLUMN
+from utils.report_writer import StreamingReportWriter, SUCCESS_FILL, FAILURE_FILL
+from utils.pipeline import bounded, in_order
+from utils.checkpoint import CheckpointJournal
+from utils.retry_scheduler import RetryScheduler, CircuitBreaker
+from utils.rate_limiter import get_rate_limiter
+from utils.metrics import get_metrics
+from utils.model_catalog import (ModelCatalog, shard_jobs, shard_filename, shard_cache_filename, find_shard_files,
+                                 DEFAULT_PAGE_COST, DEFAULT_SHARD_DIR)
+from utils.lean_browser import configure_lean_options, apply_lean_rules, PageLoadStats
+from utils.consent import ConsentStore, DEFAULT_CONSENT_FILE
+
+# Sayfa başlığında bunlar varsa site isteği engellemiş / hız sınırına takılmışızdır
+BLOCKED_PAGE_TITLES = ('Access Denied', 'Too Many Requests', '429', 'Just a moment')
+
+# Tüm selector'ları ve filtreleri tek seferde tarayıcıda çalıştırır.
+# İlk eşleşen selector'ın adaylarını, extract_price_legacy'deki max() ile aynı
+# sırayla (uzunluğa göre, eşitlikte sayfa sırası) döndürür.
+EXTRACT_PRICE_SCRIPT = """
+var selectors = arguments[0], excluded = arguments[1];
+function visibleText(node) {
+    if (!node.getClientRects || node.getClientRects().length === 0) { return ''; }
+    return (node.innerText || '').trim();
+}
+for (var i = 0; i < selectors.length; i++) {
+    var snapshot;
+    try {
+        snapshot = document.evaluate(selectors[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    } catch (e) { continue; }
+    var found = [];
+    for (var j = 0; j < snapshot.snapshotLength; j++) {
+        var text = visibleText(snapshot.snapshotItem(j));
+        if (!text || !/\\d/.test(text)) { continue; }
+        if (text.indexOf('TL') < 0 && text.indexOf('₺') < 0 && text.indexOf('.000') < 0) { continue; }
+        var lower = text.toLowerCase();
+        if (excluded.some(function (word) { return lower.indexOf(word) >= 0; })) { continue; }
+        found.push(text);
+    }
+    if (found.length) {
+        var ranked = found.map(function (text, index) {
+            return {text: text, index: index, score: text.length < 100 ? text.length : 0};
+        });
+        ranked.sort(function (a, b) { return b.score - a.score || a.index - b.index; });
+        return {selector: i, candidates: ranked.map(function (c) { return c.text; })};
+    }
+}
+return {selector: -1, candidates: []};
+"""
+
 
 class CarPriceTracker:
-    def __init__(self, gmail_user, gmail_app_password, recipient_email, max_retries=3):
+    def __init__(self, gmail_user, gmail_app_password, recipient_email, max_retries=3,
+                 pool_size=1, max_pages_per_driver=20, workers=1, executor='thread',
+                 site_timeouts=None, http_tier=True, lean=False,
+                 smtp_host='smtp.gmail.com', smtp_port=587, smtp_starttls=True, resume=False,
+                 retry_base_delay=2.0, breaker_threshold=3, breaker_reset=120, catalog=None, shard=None,
+                 profile_dir=None, consent_file=None):
         """
         GitHub Actions için optimize edilmiş tracker
 
@@ -28,17 +81,78 @@ class CarPriceTracker:
             gmail_app_password: Gmail App Password
             recipient_email: Raporun gönderileceği email
             max_retries: Hata durumunda maksimum deneme sayısı
+            pool_size: Havuzda tutulacak Chrome driver sayısı
+            max_pages_per_driver: Bir driver yenilenmeden önce açılacak sayfa sayısı
+            workers: Aynı anda çekilecek model sayısı (1 = sıralı)
+            executor: 'thread' (ortak driver havuzu) veya 'process' (her işlem kendi Chrome'u)
+            site_timeouts: Site bazında fiyat bekleme üst sınırı, ör. {'www.kia.com': 20}
+            http_tier: Chrome'dan önce düz HTTP + lxml ile fiyat aransın mı
+            lean: Resim, font, medya ve takip script'lerini engelleyen hafif Chrome modu
+            smtp_host, smtp_port, smtp_starttls: Raporun gönderileceği SMTP sunucusu
+                (yerel test sunucusu için starttls kapatılabilir)
+            resume: Checkpoint günlüğünde başarılı sonucu olan modelleri tekrar çekme
+            retry_base_delay: Başarısız model kuyruğun sonuna bu sürenin üstel katları kadar ertelenir
+            breaker_threshold, breaker_reset: Bir sitede art arda bu kadar zaman aşımı/ağ hatası
+                olursa o siteye breaker_reset saniye boyunca sayfa açılmaz
+            catalog: Taranacak modeller (varsayılan: model_catalog.json)
+            shard: (i, N) verilirse yalnızca N parçadan i. parçadaki modeller çekilir;
+                sonuçlar birleştirme için SHARD_OUTPUT_DIR altına yazılır
+            profile_dir: Kalıcı Chrome profil dizini; her havuz slotu kendi alt dizinini
+                kullanır, çerez onayı kaydı da bu dizinde tutulur (None = geçici profil)
+            consent_file: Çerez onayı kaydı (varsayılan: profil dizininde ya da CONSENT_STATE_FILE)
         """
+        if executor not in ('thread', 'process'):
+            raise ValueError("executor 'thread' veya 'process' olmalı.")
         self.gmail_user = gmail_user
         self.gmail_app_password = gmail_app_password
         self.recipient_email = recipient_email
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.smtp_starttls = smtp_starttls
+        self.outbox_sender = None
         self.max_retries = max_retries
-        self.excel_filename = f'arac_fiyatlari_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+        shard_suffix = f'_parca{shard[0]}of{shard[1]}' if shard else ''
+        self.excel_filename = f'arac_fiyatlari_{datetime.now().strftime("%Y%m%d_%H%M%S")}{shard_suffix}.xlsx'
         self.success_count = 0
         self.fail_count = 0
-
-    def setup_driver(self):
-        """GitHub Actions için Chrome WebDriver yapılandırması"""
+        self.workers = max(1, workers)
+        self.executor = executor
+        self._count_lock = threading.Lock()
+        if executor == 'thread':
+            pool_size = max(pool_size, self.workers)
+        self.driver_pool = DriverPool(self.setup_driver, size=pool_size, max_pages=max_pages_per_driver)
+        self.catalog = catalog or ModelCatalog.load()
+        self.shard = shard
+        self.page_waiter = PageWaiter(dict(self.catalog.site_timeouts(), **(site_timeouts or {})))
+        self.scrape_cache = ScrapeCache()
+        self.http_tier = http_tier
+        self.http_fetcher = None
+        if http_tier:
+            # requests/lxml yalnızca HTTP katmanı açıkken yüklenir
+            from utils.http_fetcher import HttpPriceFetcher
+            self.http_fetcher = HttpPriceFetcher(pool_size=self.workers)
+        self.lean = lean
+        self.page_stats = PageLoadStats()
+        self.profile_dir = profile_dir
+        if consent_file is None:
+            consent_file = os.path.join(profile_dir, 'consent_state.json') if profile_dir else DEFAULT_CONSENT_FILE
+        self.consent = ConsentStore(consent_file)
+        self.rate_limiter = get_rate_limiter()
+        self.metrics = get_metrics()
+        self.retry_scheduler = RetryScheduler(
+            max_attempts=max_retries, base_delay=retry_base_delay,
+            breaker=CircuitBreaker(failure_threshold=breaker_threshold, reset_timeout=breaker_reset)
+        )
+        self.resume = resume
+        self.checkpoint = CheckpointJournal()
+        self._resumed = {}
+        # Modelin bu çalıştırmadaki tüm denemelerinin süresi (sayfa maliyeti)
+        self._job_costs = {}
+        # Parça modunda sonuçların birleştirme için yazıldığı günlük
+        self.shard_output = None
+
+    def setup_driver(self, slot=0):
+        """GitHub Actions için Chrome WebDriver yapılandırması (slot: havuzdaki yeri)"""
         chrome_options = Options()
 
         # GitHub Actions için gerekli ayarlar
@@ -53,46 +167,91 @@ class CarPriceTracker:
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option("prefs", {
+        prefs = {
             "profile.default_content_setting_values.notifications": 2
-        })
+        }
+
+        if self.lean:
+            # Hafif mod: resim/font/medya yok, DOM hazır olunca devam et
+            configure_lean_options(chrome_options)
+            prefs["profile.managed_default_content_settings.images"] = 2
+            prefs["profile.managed_default_content_settings.media_stream"] = 2
+
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        if self.profile_dir:
+            chrome_options.add_argument(f'--user-data-dir={self.prepare_profile(slot)}')
 
         # Loglama seviyesini azalt
         chrome_options.add_argument('--log-level=3')
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(30)
-            return driver
-        except Exception as e:
-            print(f"❌ ChromeDriver hatası: {e}")
-            print("Alternatif yol deneniyor...")
-            service = Service('/usr/local/bin/chromedriver')
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(30)
-            return driver
+        with self.metrics.span('driver.start'):
+            try:
+                driver = webdriver.Chrome(options=chrome_options)
+                driver.set_page_load_timeout(30)
+                return driver
+            except Exception as e:
+                print(f"❌ ChromeDriver hatası: {e}")
+                print("Alternatif yol deneniyor...")
+                service = Service('/usr/local/bin/chromedriver')
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+                driver.set_page_load_timeout(30)
+                return driver
+
+    def prepare_profile(self, slot):
+        """
+        Slotun profil dizinini hazırlar. Cache'ten geri yüklenen profilde başka
+        bir makinenin kilit dosyaları kalmış olabilir; slot bu süreçte tek bir
+        driver'a ait olduğundan silinmeleri güvenlidir.
+        """
+        path = os.path.abspath(os.path.join(self.profile_dir, f'slot-{slot}'))
+        os.makedirs(path, exist_ok=True)
+        for name in ('SingletonLock', 'SingletonCookie', 'SingletonSocket'):
+            lock = os.path.join(path, name)
+            if os.path.lexists(lock):
+                os.remove(lock)
+        return path
+
+    def _count_result(self, success):
+        """Başarılı/başarısız sayaçlarını iş parçacığı güvenli şekilde günceller"""
+        with self._count_lock:
+            if success:
+                self.success_count += 1
+            else:
+                self.fail_count += 1
 
     def clean_price(self, price_text):
-        """Fiyat metnini temizler ve formatlar"""
+        """Fiyat metnini sayıya çevirip '1.234.567 TL' biçiminde formatlar"""
         if not price_text or price_text == "Fiyat sitede bulunamadı":
             return None
 
-        # Sadece rakamları al
-        numbers = re.sub(r'[^\d]', '', price_text)
+        kurus = parse_price(price_text)
+        if kurus is None:
+            # Okunamayan metin olduğu gibi bırakılır
+            return price_text
 
-        if numbers:
-            # Binlik ayraç ekle
-            try:
-                formatted = "{:,}".format(int(numbers)).replace(',', '.')
-                return formatted + ' TL'
-            except:
-                return numbers
+        return format_price(kurus)
 
-        return price_text
+    def close_popups(self, driver, url=None):
+        """
+        Çerez ve diğer popup'ları tek bir sayfa içi script ile kapat. Onay
+        durumu gezinmeden önce yüklendiyse banner hiç çıkmaz ve script bir şey
+        tıklamaz; banner yine de kapatıldıysa `url` sitesinin yeni onay durumu
+        kaydedilir.
+        """
+        try:
+            dismissed, clicked = self.consent.dismiss(driver)
+        except Exception:
+            return self.close_popups_legacy(driver)
+
+        for element in clicked:
+            self.page_waiter.wait_until_gone(driver, element)
+        if dismissed and url:
+            self.consent.capture(driver, url)
 
-    def close_popups(self, driver):
-        """Çerez ve diğer popup'ları kapat"""
+    def close_popups_legacy(self, driver):
+        """Çerez ve diğer popup'ları kapat - selector başına WebDriver çağrısı (karşılaştırma için)"""
         popup_selectors = [
             "//button[contains(text(), 'Kabul')]",
             "//button[contains(text(), 'Accept')]",
@@ -107,251 +266,402 @@ class CarPriceTracker:
             try:
                 element = driver.find_element(By.XPATH, selector)
                 element.click()
-                time.sleep(0.5)
+                self.page_waiter.wait_until_gone(driver, element)
             except:
                 pass
 
-    def extract_price(self, driver):
-        """Sayfadan fiyat bilgisini çıkar - gelişmiş selector'lar"""
-        price_selectors = [
-            # Fiyat div/span'leri
-            "//div[contains(@class, 'price') and contains(text(), 'TL')]",
-            "//span[contains(@class, 'price') and contains(text(), 'TL')]",
-            "//p[contains(@class, 'price') and contains(text(), 'TL')]",
-
-            # TL içeren elementler
-            "//*[contains(text(), 'TL') and not(contains(text(), 'İletişim'))]",
-            "//*[contains(text(), '₺')]",
-
-            # Binlik ayraç olanlar
-            "//*[contains(text(), '.000')]",
-            "//*[contains(text(), '.500')]",
-            "//*[contains(text(), '.999')]",
-
-            # Model price class'ları
-            "//div[contains(@class, 'model-price')]",
-            "//div[contains(@class, 'vehicle-price')]",
-            "//div[contains(@class, 'car-price')]",
-
-            # Data attribute'lar
-            "//*[@data-price]",
-            "//*[@data-vehicle-price]",
-        ]
+    def price_selectors(self, url):
+        """Önce önbellekte eşleşen selector, sonra katalogdaki site ipuçları, sonra genel liste"""
+        return self.scrape_cache.order_selectors(url, self.catalog.order_selectors(url, PRICE_SELECTORS))
+
+    def extract_price(self, driver, url=None):
+        """
+        Sayfadan fiyat bilgisini tek bir WebDriver çağrısıyla çıkar.
+        Tüm selector'lar ve filtreleme tarayıcı içinde çalışır; sonuç
+        extract_price_legacy ile aynı fiyatı seçer. `url` verilirse o sayfada
+        daha önce eşleşen selector önce denenir.
+        """
+        selectors = self.price_selectors(url) if url else PRICE_SELECTORS
+        try:
+            result = driver.execute_script(EXTRACT_PRICE_SCRIPT, selectors, EXCLUDED_PRICE_WORDS)
+        except Exception:
+            return self.extract_price_legacy(driver)
+
+        if url and result:
+            matched = selectors[result['selector']] if result['selector'] >= 0 else None
+            self.scrape_cache.record_selector(url, matched)
+
+        if result and result['candidates']:
+            # Adaylar tarayıcıda en iyiden kötüye sıralanmış gelir
+            return result['candidates'][0]
+
+        return None
 
+    def extract_price_legacy(self, driver):
+        """Sayfadan fiyat bilgisini çıkar - element başına WebDriver çağrısı (karşılaştırma için)"""
         found_prices = []
 
-        for selector in price_selectors:
+        for selector in PRICE_SELECTORS:
             try:
                 elements = driver.find_elements(By.XPATH, selector)
                 for elem in elements:
                     text = elem.text.strip()
 
                     # Fiyat gibi görünen metin mi?
-                    if text and any(c.isdigit() for c in text):
-                        if 'TL' in text or '₺' in text or '.000' in text:
-                            # İstenmeyen metinleri filtrele
-                            if not any(x in text.lower() for x in ['ödeme', 'taksit', 'ay', 'kredi', 'iletişim']):
-                                found_prices.append(text)
+                    if is_price_text(text):
+                        found_prices.append(text)
 
                 if found_prices:
                     break
 
-            except Exception as e:
+            except Exception:
                 continue
 
-        if found_prices:
-            # En uzun ve en bilgilendirici olanı seç
-            best_price = max(found_prices, key=lambda x: len(x) if len(x) < 100 else 0)
-            return best_price
+        return pick_best_price(found_prices)
 
-        return None
+    def _success_result(self, model_info, brand, price_text):
+        kurus = parse_price(price_text)
+        return {
+            'Marka': brand,
+            'Model': model_info['name'],
+            'Fiyat': price_text,
+            'Fiyat (Temiz)': self.clean_price(price_text),
+            PRICE_KURUS_COLUMN: kurus,
+            # Fiyat bulundu ama sayıya çevrilemedi
+            PRICE_INVALID_COLUMN: kurus is None,
+            'Tarih': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'Durum': 'Başarılı',
+            'URL': model_info['url']
+        }
 
-    def scrape_model_with_retry(self, model_info, brand):
-        """Tek bir modeli retry mekanizması ile çek"""
-        for attempt in range(self.max_retries):
-            driver = None
-            try:
-                driver = self.setup_driver()
+    def scrape_model_http(self, model_info, brand):
+        """Hızlı katman: Chrome açmadan HTTP + lxml ile fiyatı bulmaya çalış"""
+        try:
+            price_text, _ = self.http_fetcher.fetch_price(model_info['url'], self.price_selectors(model_info['url']))
+        except Exception as e:
+            print(f"      ⚠️  HTTP katmanı hatası: {str(e)[:50]}")
+            return None
+
+        if not price_text:
+            return None
 
-                print(f"   → {model_info['name']} (Deneme {attempt + 1}/{self.max_retries})")
+        print(f"   → {model_info['name']} (HTTP)")
+        print(f"      ✓ Başarılı: {price_text[:50]}")
+        return self._success_result(model_info, brand, price_text)
 
+    def scrape_model_attempt(self, job, attempt):
+        """
+        Bir modeli tek bir kez dener (ilk denemede önce HTTP, gerekirse Chrome).
+        (sonuç, hata) döndürür; hata 'host' (site yanıt vermiyor), 'not_found'
+        (sayfa açıldı, fiyat yok) ya da 'error' olabilir. Bekleme ve tekrar
+        deneme RetryScheduler tarafından yapılır.
+        """
+        model_info, brand = job
+        with self.metrics.span('model', brand=brand, model=model_info['name'], attempt=attempt + 1) as span:
+            result, error = self._scrape_model_attempt(model_info, brand, attempt)
+            span['labels']['outcome'] = 'ok' if result else error
+        return result, error
+
+    def _scrape_model_attempt(self, model_info, brand, attempt):
+        tier = self.scrape_cache.get_tier(model_info['url'])
+        http_enabled = self.http_tier and tier != 'browser'
+        http_result = None
+        if http_enabled and attempt == 0:
+            with self.metrics.span('http'):
+                http_result = self.scrape_model_http(model_info, brand)
+            if http_result and tier == 'http':
+                # Doğrulanmış katman; kontrol tarihi yenilenmez, süresi dolunca tekrar doğrulanır
+                self.scrape_cache.record_tier(model_info['url'], 'http', http_probed=False)
+                return http_result, None
+            if http_result:
+                print("      🔎 HTTP sonucu doğrulanmamış, tarayıcıyla karşılaştırılıyor")
+
+        result, error = self._scrape_model_browser(model_info, brand, attempt, http_enabled, http_result)
+        if result is None and http_result is not None:
+            # Tarayıcı doğrulayamadı: HTTP sonucu kullanılır ama katman yükseltilmez
+            return http_result, None
+        return result, error
+
+    def _scrape_model_browser(self, model_info, brand, attempt, http_probed, http_result=None):
+        """
+        Modeli Chrome ile çeker. `http_result` verilirse tarayıcının bulduğu
+        fiyatla aynıysa URL HTTP katmanına yükseltilir.
+        """
+        pooled = None
+        broken = False
+        try:
+            with self.metrics.span('driver.acquire'):
+                pooled = self.driver_pool.acquire(brand)
+            driver = pooled.driver
+
+            print(f"   → {model_info['name']} (Deneme {attempt + 1}/{self.max_retries})")
+
+            if self.lean:
+                apply_lean_rules(driver, self.catalog.lean_allowlist(model_info['url']))
+
+            # Kayıtlı çerez onayı: banner hiç çıkmasın
+            with self.metrics.span('consent.seed'):
+                self.consent.seed(driver, model_info['url'], pooled.seeded_hosts)
+
+            # HTTP katmanıyla ortak host bazlı hız sınırı
+            waited = self.rate_limiter.acquire(model_info['url'])
+            self.metrics.inc('rate_limit_wait_seconds', waited, host=urlparse(model_info['url']).netloc)
+            load_start = time.perf_counter()
+            with self.metrics.span('driver.get'):
                 driver.get(model_info['url'])
-                time.sleep(4)
-
-                # Popup'ları kapat
-                self.close_popups(driver)
-
-                # Sayfanın tamamen yüklenmesini bekle
-                WebDriverWait(driver, 10).until(
-                    lambda d: d.execute_script('return document.readyState') == 'complete'
-                )
-
-                # Fiyat çıkar
-                price_text = self.extract_price(driver)
-
-                if price_text:
-                    self.success_count += 1
-                    print(f"      ✓ Başarılı: {price_text[:50]}")
-
-                    return {
-                        'Marka': brand,
-                        'Model': model_info['name'],
-                        'Fiyat': price_text,
-                        'Fiyat (Temiz)': self.clean_price(price_text),
-                        'Tarih': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'Durum': 'Başarılı',
-                        'URL': model_info['url']
-                    }
-                else:
-                    if attempt < self.max_retries - 1:
-                        print(f"      ⚠️  Fiyat bulunamadı, tekrar deneniyor...")
-                        time.sleep(2)
-                        continue
+            pooled.pages += 1
+            if any(marker in (driver.title or '') for marker in BLOCKED_PAGE_TITLES):
+                # Bot koruması / hız sınırı sayfası: host'u yavaşlat ve tekrar dene
+                self.rate_limiter.record(model_info['url'], status=429)
+                print(f"      🚫 Site isteği engelledi: {driver.title[:50]}")
+                return None, 'host'
+            self.rate_limiter.record(model_info['url'], elapsed=time.perf_counter() - load_start)
+
+            # Fiyat benzeri bir element görünene kadar bekle (site üst sınırı ile)
+            with self.metrics.span('page.wait'):
+                self.page_waiter.wait_for_price(driver, model_info['url'])
+            self.page_stats.record(driver, 'lean' if self.lean else 'full', time.perf_counter() - load_start)
+
+            # Popup'ları kapat
+            with self.metrics.span('close_popups'):
+                self.close_popups(driver, model_info['url'])
+
+            # Fiyat çıkar
+            with self.metrics.span('extract_price'):
+                price_text = self.extract_price(driver, model_info['url'])
+
+            if price_text:
+                print(f"      ✓ Başarılı: {price_text[:50]}")
+                if self.http_tier:
+                    http_price = parse_price(http_result['Fiyat']) if http_result else None
+                    if http_price is not None and http_price == parse_price(price_text):
+                        print("      ⚡ HTTP sonucu doğrulandı, sonraki çalıştırmalarda Chrome açılmayacak")
+                        self.scrape_cache.record_tier(model_info['url'], 'http')
                     else:
-                        print(f"      ✗ Fiyat bulunamadı (Tüm denemeler tükendi)")
-                        self.fail_count += 1
-                        return {
-                            'Marka': brand,
-                            'Model': model_info['name'],
-                            'Fiyat': 'Fiyat sitede bulunamadı',
-                            'Fiyat (Temiz)': 'N/A',
-                            'Tarih': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'Durum': 'Başarısız - Fiyat Bulunamadı',
-                            'URL': model_info['url']
-                        }
-
-            except TimeoutException:
-                print(f"      ⏱️  Timeout - Sayfa yüklenemedi")
-                if attempt < self.max_retries - 1:
-                    time.sleep(3)
-                    continue
+                        self.scrape_cache.record_tier(model_info['url'], 'browser', http_probed=http_probed)
+                return self._success_result(model_info, brand, price_text), None
 
-            except Exception as e:
-                print(f"      ✗ Hata: {str(e)[:50]}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
-                    continue
+            print("      ⚠️  Fiyat bulunamadı")
+            return None, 'not_found'
 
-            finally:
-                if driver:
-                    driver.quit()
-                time.sleep(2)
+        except TimeoutException:
+            print("      ⏱️  Timeout - Sayfa yüklenemedi")
+            self.rate_limiter.record(model_info['url'], error=True)
+            return None, 'host'
 
-        # Tüm denemeler başarısız
-        self.fail_count += 1
+        except Exception as e:
+            print(f"      ✗ Hata: {str(e)[:50]}")
+            # Çökmüş driver havuza geri konmaz
+            broken = pooled is not None and not self.driver_pool.is_healthy(pooled)
+            # Chrome'un ağ hataları (DNS, bağlantı reddi vb.) sitenin erişilemediğini gösterir
+            if 'net::ERR_' in str(e):
+                self.rate_limiter.record(model_info['url'], error=True)
+                return None, 'host'
+            return None, 'error'
+
+        finally:
+            if pooled:
+                self.driver_pool.release(pooled, broken=broken)
+
+    def _failure_result(self, job, error):
+        """Deneme hakkı biten (ya da sitesi devre dışı kalan) modelin sonucu"""
+        model_info, brand = job
+        if error == 'not_found':
+            print(f"      ✗ {model_info['name']}: Fiyat bulunamadı (Tüm denemeler tükendi)")
+            price, status = 'Fiyat sitede bulunamadı', 'Başarısız - Fiyat Bulunamadı'
+        elif error == 'circuit_open':
+            print(f"      ⛔ {model_info['name']}: Site erişilemiyor, sayfa açılmadı")
+            price, status = 'Hata: Site erişilemiyor', 'Başarısız - Site Erişilemiyor'
+        elif error == 'shard_missing':
+            print(f"      ⚠️  {model_info['name']}: Parça sonuçlarında yok")
+            price, status = 'Hata: Parça sonucu eksik', 'Başarısız - Parça Eksik'
+        else:
+            print(f"      ✗ {model_info['name']}: Tüm denemeler başarısız")
+            price, status = 'Hata: Tüm denemeler başarısız', 'Başarısız - Hata'
         return {
             'Marka': brand,
             'Model': model_info['name'],
-            'Fiyat': 'Hata: Tüm denemeler başarısız',
+            'Fiyat': price,
             'Fiyat (Temiz)': 'N/A',
+            PRICE_KURUS_COLUMN: None,
+            PRICE_INVALID_COLUMN: False,
             'Tarih': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'Durum': 'Başarısız - Hata',
+            'Durum': status,
             'URL': model_info['url']
         }
 
-    def scrape_hyundai_prices(self):
-        """Hyundai fiyatları - retry mekanizmalı"""
-        print("🚗 Hyundai fiyatları çekiliyor...")
-        print("="*60)
-
-        models_info = [
-            {'name': 'i10', 'url': 'https://www.hyundai.com/tr/tr/modeller/i10/satinal'},
-            {'name': 'i20', 'url': 'https://www.hyundai.com/tr/tr/modeller/i20/satinal'},
-            {'name': 'Bayon', 'url': 'https://www.hyundai.com/tr/tr/modeller/bayon/satinal'},
-            {'name': 'Kona', 'url': 'https://www.hyundai.com/tr/tr/modeller/kona/satinal'},
-            {'name': 'Kona Electric', 'url': 'https://www.hyundai.com/tr/tr/modeller/kona-electric/satinal'},
-            {'name': 'Tucson', 'url': 'https://www.hyundai.com/tr/tr/modeller/tucson/satinal'},
-            {'name': 'Santa Fe', 'url': 'https://www.hyundai.com/tr/tr/modeller/santa-fe/satinal'},
-            {'name': 'Ioniq 5', 'url': 'https://www.hyundai.com/tr/tr/modeller/ioniq-5/satinal'},
-            {'name': 'Ioniq 6', 'url': 'https://www.hyundai.com/tr/tr/modeller/ioniq-6/satinal'},
-        ]
-
-        hyundai_data = []
-        for model in models_info:
-            result = self.scrape_model_with_retry(model, 'Hyundai')
-            hyundai_data.append(result)
-
-        print("="*60)
-        print(f"✅ Hyundai tamamlandı: {len(hyundai_data)} model işlendi\n")
-        return hyundai_data
-
-    def scrape_kia_prices(self):
-        """Kia fiyatları - retry mekanizmalı"""
-        print("🚗 Kia fiyatları çekiliyor...")
+    def iter_models(self, jobs):
+        """
+        (model_info, marka) çiftlerini çeker ve sonuçları `jobs` sırasıyla
+        üretir. workers > 1 ise modeller eşzamanlı işlenir ve başarısız
+        modeller kuyruğun sonuna ertelenir; önündeki model bekleyen sonuç
+        tamponda tutulur, havuz bu sırada diğer modellere devam eder.
+        """
+        yield from in_order(self._iter_model_results(jobs))
+
+    def _iter_model_results(self, jobs):
+        """Her modelin (jobs içindeki sırası, sonuç) çiftini tamamlanır tamamlanmaz üretir."""
+        # Devam modunda önceki denemede başarılı olan modeller günlükten gelir
+        pending = []
+        for index, (model, brand) in enumerate(jobs):
+            result = self._resumed.get(CheckpointJournal.key(brand, model['url']))
+            if result is not None:
+                self._count_result(True)
+                self.metrics.inc('models', brand=brand, status='resumed')
+                print(f"   ↩ {model['name']} (checkpoint)")
+                if self.shard_output:
+                    self.shard_output.record(CheckpointJournal.key(brand, model['url']), result)
+                yield index, result
+            else:
+                pending.append((index, (model, brand)))
+
+        for position, result in self._scrape_jobs([job for _, job in pending]):
+            success = result['Durum'] == 'Başarılı'
+            self._count_result(success)
+            self.metrics.inc('models', brand=result['Marka'], status='success' if success else 'failure')
+            cost = self._job_costs.pop(result['URL'], None)
+            # Parça modunda maliyetler birleştirme adımında işlenir; aksi halde sonraki
+            # parçalar farklı maliyetlerle farklı bir bölme hesaplayabilir
+            if cost is not None and not self.shard:
+                self.scrape_cache.record_cost(result['URL'], cost)
+            # Sonuç sıra beklemeden günlüğe yazılır
+            key = CheckpointJournal.key(result['Marka'], result['URL'])
+            self.checkpoint.record(key, result, cost=cost)
+            if self.shard_output:
+                self.shard_output.record(key, result, cost=cost)
+            yield pending[position][0], result
+
+    def _add_cost(self, job, seconds):
+        with self._count_lock:
+            url = job[0]['url']
+            self._job_costs[url] = self._job_costs.get(url, 0.0) + seconds
+
+    def _scrape_jobs(self, jobs):
+        if not jobs:
+            return
+
+        def host_of(job):
+            return urlparse(job[0]['url']).netloc
+
+        process_mode = self.executor == 'process' and self.workers > 1
+        if process_mode:
+            import multiprocessing
+
+            # Her worker kalıcı bir numara alır (profil dizini ve önbellek dosyası için)
+            worker_ids = multiprocessing.Queue()
+            for worker_id in range(self.workers):
+                worker_ids.put(worker_id)
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_process_worker,
+                                       initargs=(self._worker_settings(), worker_ids))
+            attempt = _attempt_in_process
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+            attempt = self.scrape_model_attempt
+
+        with pool:
+            yield from self.retry_scheduler.run(jobs, pool, attempt, host_of, self._failure_result,
+                                                workers=self.workers, on_attempt=self._add_cost)
+
+        if process_mode:
+            # Worker'lar kapanırken önbellek ve çerez onayı güncellemelerini kendi dosyalarına yazdı
+            for worker_id in range(self.workers):
+                filename = _worker_file(self.scrape_cache.filename, worker_id)
+                if os.path.exists(filename):
+                    self.scrape_cache.merge_file(filename)
+                filename = _worker_file(self.consent.filename, worker_id)
+                if os.path.exists(filename):
+                    self.consent.merge_file(filename)
+
+    def _worker_settings(self):
+        """Process worker'larının tracker'ı bu tracker ile aynı ayarlarla kurması için"""
+        return dict(
+            max_retries=self.max_retries,
+            max_pages_per_driver=self.driver_pool.max_pages,
+            site_timeouts=dict(self.page_waiter.site_timeouts),
+            http_tier=self.http_tier,
+            lean=self.lean,
+            catalog=self.catalog,
+            profile_dir=self.profile_dir,
+            # Worker'lar ana sürecin onay kaydını okur, yeni kayıtları kendi dosyalarına yazar
+            consent_file=self.consent.filename,
+        )
+
+    def scrape_brand_prices(self, brand, jobs=None):
+        """Bir markanın fiyatları - retry mekanizmalı, her model hazır olunca üretilir"""
+        jobs = self.catalog.jobs([brand]) if jobs is None else jobs
+        print(f"🚗 {brand} fiyatları çekiliyor...")
         print("="*60)
 
-        models_info = [
-            {'name': 'Picanto', 'url': 'https://www.kia.com/tr/modeller/yeni-picanto/satin-al.html'},
-            {'name': 'Stonic', 'url': 'https://www.kia.com/tr/modeller/stonic/satin-al.html'},
-            {'name': 'Ceed', 'url': 'https://www.kia.com/tr/modeller/ceed-hb/satin-al.html'},
-            {'name': 'XCeed', 'url': 'https://www.kia.com/tr/modeller/xceed/satin-al.html'},
-            {'name': 'Sportage', 'url': 'https://www.kia.com/tr/modeller/sportage-nq5/satin-al.html'},
-            {'name': 'Sorento', 'url': 'https://www.kia.com/tr/modeller/sorento/satin-al.html'},
-            {'name': 'EV3', 'url': 'https://www.kia.com/tr/modeller/ev3/satin-al.html'},
-            {'name': 'EV6', 'url': 'https://www.kia.com/tr/modeller/ev6/satin-al.html'},
-            {'name': 'EV9', 'url': 'https://www.kia.com/tr/modeller/ev9/satin-al.html'},
-        ]
-
-        kia_data = []
-        for model in models_info:
-            result = self.scrape_model_with_retry(model, 'Kia')
-            kia_data.append(result)
+        count = 0
+        for result in self.iter_models(jobs):
+            count += 1
+            yield result
 
         print("="*60)
-        print(f"✅ Kia tamamlandı: {len(kia_data)} model işlendi\n")
-        return kia_data
+        print(f"✅ {brand} tamamlandı: {count} model işlendi\n")
+
+    def selected_jobs(self):
+        """Katalogdaki modeller; parça modunda yalnızca bu parçaya düşenler"""
+        jobs = self.catalog.jobs()
+        if self.shard:
+            index, count = self.shard
+            jobs = shard_jobs(jobs, index, count,
+                              lambda job: self.scrape_cache.get_cost(job[0]['url'], DEFAULT_PAGE_COST))
+        return jobs
+
+    def iter_results(self, jobs=None):
+        """Tüm markaların sonuçlarını tek bir akış olarak üretir"""
+        jobs = self.selected_jobs() if jobs is None else jobs
+        if self.workers > 1:
+            # Tüm markaların modelleri aynı iş havuzunda birlikte çekilir
+            print(f"⚡ Eşzamanlı mod: {self.workers} worker ({self.executor})\n")
+            yield from self.iter_models(jobs)
+        else:
+            for brand in dict.fromkeys(brand for _, brand in jobs):
+                yield from self.scrape_brand_prices(brand, [job for job in jobs if job[1] == brand])
+
+    # Rapor sütun sıralaması ve genişlikleri
+    REPORT_COLUMNS = ['Marka', 'Model', 'Fiyat', 'Fiyat (Temiz)', PRICE_KURUS_COLUMN, PRICE_INVALID_COLUMN,
+                      'Durum', 'Tarih', 'URL']
+    REPORT_WIDTHS = {
+        'Marka': 12,
+        'Model': 18,
+        'Fiyat': 35,
+        'Fiyat (Temiz)': 20,
+        PRICE_KURUS_COLUMN: 16,
+        PRICE_INVALID_COLUMN: 16,
+        'Durum': 25,
+        'Tarih': 20,
+        'URL': 60,
+    }
+
+    def open_report(self, brands):
+        """Ana sayfa ve marka sayfalarıyla akış halinde yazılan Excel raporunu açar"""
+        writer = StreamingReportWriter(self.excel_filename)
+        for sheet in ['Fiyatlar'] + list(brands):
+            writer.add_sheet(sheet, self.REPORT_COLUMNS, self.REPORT_WIDTHS)
+            # Durum sütunu renklendirme
+            writer.highlight_text(sheet, 'Durum', 'Başarılı', SUCCESS_FILL)
+            writer.highlight_text(sheet, 'Durum', 'Başarısız', FAILURE_FILL)
+            writer.highlight_text(sheet, PRICE_INVALID_COLUMN, 'TRUE', FAILURE_FILL)
+        return writer
+
+    def write_report_row(self, writer, row):
+        writer.write_records('Fiyatlar', [row])
+        writer.write_records(row['Marka'], [row])
 
     def save_to_excel(self, data):
-        """Excel'e kaydet - gelişmiş formatlama"""
+        """Excel'e kaydet - satırlar akış halinde yazılır, renkler koşullu biçimlendirme ile"""
         if not data:
             print("⚠️  Kaydedilecek veri yok!")
             return False
 
         try:
-            df = pd.DataFrame(data)
-
-            # Sütun sıralaması
-            columns_order = ['Marka', 'Model', 'Fiyat', 'Fiyat (Temiz)', 'Durum', 'Tarih', 'URL']
-            df = df[columns_order]
-
-            with pd.ExcelWriter(self.excel_filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Fiyatlar', index=False)
-
-                workbook = writer.book
-                worksheet = writer.sheets['Fiyatlar']
-
-                # Sütun genişlikleri
-                column_widths = {
-                    'A': 12,  # Marka
-                    'B': 18,  # Model
-                    'C': 35,  # Fiyat
-                    'D': 20,  # Fiyat (Temiz)
-                    'E': 25,  # Durum
-                    'F': 20,  # Tarih
-                    'G': 60,  # URL
-                }
-
-                for col, width in column_widths.items():
-                    worksheet.column_dimensions[col].width = width
-
-                # Başlık formatı
-                from openpyxl.styles import Font, PatternFill, Alignment
-
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF")
-
-                for cell in worksheet[1]:
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-
-                # Durum sütunu renklendirme
-                for row in range(2, len(df) + 2):
-                    status_cell = worksheet[f'E{row}']
-                    if 'Başarılı' in str(status_cell.value):
-                        status_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                    elif 'Başarısız' in str(status_cell.value):
-                        status_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            brands = list(dict.fromkeys(row['Marka'] for row in data))
+            with self.open_report(brands) as writer:
+                writer.write_records('Fiyatlar', data)
+                for brand in brands:
+                    writer.write_records(brand, (row for row in data if row['Marka'] == brand))
 
             print(f"✅ Excel dosyası oluşturuldu: {self.excel_filename}")
             print(f"   📊 Başarılı: {self.success_count} | Başarısız: {self.fail_count}")
@@ -368,11 +678,20 @@ class CarPriceTracker:
             print("❌ Excel dosyası bulunamadı!")
             return False
 
+        # MIME modülleri yalnızca gönderim sırasında yüklenir
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.base import MIMEBase
+        from email.mime.text import MIMEText
+        from email import encoders
+
         try:
             msg = MIMEMultipart()
             msg['From'] = self.gmail_user
             msg['To'] = self.recipient_email
-            msg['Subject'] = f'🚗 Hyundai & Kia Fiyat Raporu - {datetime.now().strftime("%d.%m.%Y %H:%M")}'
+            brands = ' & '.join(self.catalog.brands)
+            msg['Subject'] = f'🚗 {brands} Fiyat Raporu - {datetime.now().strftime("%d.%m.%Y %H:%M")}'
+            brand_lines = '\n'.join(f"• {brand} modelleri ({len(models)} model)"
+                                    for brand, models in self.catalog.brands.items())
 
             # Başarı oranı hesapla
             total = self.success_count + self.fail_count
@@ -381,7 +700,7 @@ class CarPriceTracker:
             body = f"""
 Merhaba,
 
-{datetime.now().strftime("%d.%m.%Y %H:%M")} tarihli Hyundai ve Kia sıfır araç fiyat raporu ektedir.
+{datetime.now().strftime("%d.%m.%Y %H:%M")} tarihli {brands} sıfır araç fiyat raporu ektedir.
 
 📊 Özet:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -391,8 +710,7 @@ Merhaba,
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 📦 Rapor İçeriği:
-• Hyundai modelleri (9 model)
-• Kia modelleri (9 model)
+{brand_lines}
 • Güncel fiyatlar ve linkler
 • Durum bilgileri
 
@@ -415,26 +733,59 @@ GitHub Actions - Powered by Selenium
                 part.add_header('Content-Disposition', f'attachment; filename={self.excel_filename}')
                 msg.attach(part)
 
-            # Gmail SMTP
-            print("📧 Email gönderiliyor...")
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.set_debuglevel(0)
-            server.starttls()
-            server.login(self.gmail_user, self.gmail_app_password)
-            server.send_message(msg)
-            server.quit()
+            # Rapor outbox'a yazılır; gönderim arka planda tek SMTP bağlantısıyla yapılır
+            sender = self._get_outbox_sender()
+            sender.outbox.put(msg)
+            sender.start()
+            sender.notify()
 
-            print(f"✅ Email başarıyla gönderildi: {self.recipient_email}")
+            print(f"✅ Email gönderim kuyruğuna eklendi: {self.recipient_email}")
             return True
 
-        except smtplib.SMTPAuthenticationError:
-            print("❌ Gmail giriş hatası! App Password'ü kontrol edin.")
-            return False
         except Exception as e:
-            print(f"❌ Email gönderme hatası: {str(e)}")
+            print(f"❌ Email kuyruğa eklenemedi: {str(e)}")
             traceback.print_exc()
             return False
 
+    def _get_outbox_sender(self):
+        if self.outbox_sender is None:
+            from utils.outbox import Outbox, OutboxSender
+
+            self.outbox_sender = OutboxSender(
+                Outbox(), self.smtp_host, self.smtp_port,
+                self.gmail_user, self.gmail_app_password, starttls=self.smtp_starttls
+            )
+        return self.outbox_sender
+
+    def flush_outbox(self, timeout=60):
+        """Kuyruktaki e-postaları en fazla `timeout` saniye göndermeyi dener; kalanlar diskte bekler"""
+        if self.outbox_sender is None:
+            from utils.outbox import Outbox
+
+            # Önceki çalıştırmalardan kalan mesaj yoksa SMTP'ye hiç bağlanılmaz
+            if not self.gmail_user or not Outbox().pending_count():
+                return
+        sender = self._get_outbox_sender()
+        remaining = sender.stop(timeout)
+        stats = sender.stats
+        print(f"📧 Email: {stats['sent']} gönderildi | {stats['retried']} ertelendi | {stats['failed']} başarısız | "
+              f"{stats['connections']} SMTP bağlantısı | kuyrukta {remaining}")
+
+    def export_metrics(self):
+        """Span ve sayaçları Excel raporunun yanına JSONL ve Prometheus formatında yazar"""
+        retry_stats = self.retry_scheduler.stats
+        self.metrics.inc('attempts', retry_stats['attempts'])
+        self.metrics.inc('retries', retry_stats['retries'])
+        self.metrics.inc('short_circuited', retry_stats['short_circuited'])
+        self.metrics.inc('selector_cache_hits', self.scrape_cache.hits)
+        self.metrics.inc('selector_cache_misses', self.scrape_cache.misses)
+        self.metrics.inc('drivers_started', self.driver_pool.stats['created'])
+        try:
+            jsonl_path, prom_path = self.metrics.export(self.excel_filename)
+            print(f"📈 Metrikler yazıldı: {jsonl_path}, {prom_path}")
+        except OSError as e:
+            print(f"⚠️  Metrikler yazılamadı: {e}")
+
     def run(self):
         """Ana çalıştırma fonksiyonu"""
         print("\n" + "="*60)
@@ -446,28 +797,55 @@ GitHub Actions - Powered by Selenium
         start_time = time.time()
 
         try:
-            # Fiyatları çek
+            # Fiyatlar çekildikçe rapora yazılır; tarayıcı tarafı rapordan en fazla
+            # birkaç sonuç önde gider (backpressure)
             print("📥 Veri çekme işlemi başlıyor...\n")
-            hyundai_data = self.scrape_hyundai_prices()
-            kia_data = self.scrape_kia_prices()
-
-            # Birleştir
-            all_data = hyundai_data + kia_data
+            if self.resume:
+                self._resumed = self.checkpoint.successful()
+                print(f"↩ Devam modu: {len(self._resumed)} model checkpoint'ten alınacak ({self.checkpoint.filename})\n")
+            else:
+                self.checkpoint.reset()
+            jobs = self.selected_jobs()
+            if self.shard:
+                index, count = self.shard
+                self.shard_output = CheckpointJournal(shard_filename(index, count))
+                os.makedirs(os.path.dirname(self.shard_output.filename) or '.', exist_ok=True)
+                self.shard_output.reset()
+                # Boş parça da birleştirmede "tamamlandı" sayılsın diye dosya hemen oluşturulur
+                open(self.shard_output.filename, 'a', encoding='utf-8').close()
+                print(f"🧩 Parça {index}/{count}: {len(jobs)}/{len(self.catalog.jobs())} model "
+                      f"-> {self.shard_output.filename}\n")
+                if not jobs:
+                    print("ℹ️  Bu parçaya model düşmedi.")
+                    return
+            row_count = 0
+            writer = self.open_report(self.catalog.brands)
+            try:
+                with self.metrics.span('scrape'):
+                    for row in bounded(self.iter_results(jobs), maxsize=2 * self.workers, name='scrape'):
+                        self.write_report_row(writer, row)
+                        row_count += 1
+            finally:
+                with self.metrics.span('excel.save'):
+                    writer.close()
 
-            if not all_data:
+            if not row_count:
                 print("❌ Hiç veri çekilemedi!")
+                os.remove(self.excel_filename)
                 sys.exit(1)
 
-            # Excel'e kaydet
-            print("💾 Excel raporu oluşturuluyor...")
-            if not self.save_to_excel(all_data):
-                print("❌ Excel oluşturulamadı!")
-                sys.exit(1)
+            print(f"✅ Excel dosyası oluşturuldu: {self.excel_filename}")
+            print(f"   📊 Başarılı: {self.success_count} | Başarısız: {self.fail_count}")
 
-            # Email gönder
-            print("\n📧 Email gönderiliyor...")
-            if not self.send_email():
-                print("⚠️  Email gönderilemedi ama Excel oluşturuldu!")
+            if self.shard:
+                # Rapor e-postası tüm parçalar birleştirilince gönderilir
+                print(f"🧩 Parça sonuçları yazıldı: {self.shard_output.filename}")
+            else:
+                print("\n📧 Email gönderiliyor...")
+                with self.metrics.span('email.enqueue'):
+                    sent = self.send_email()
+                if not sent:
+                    print("⚠️  Email gönderilemedi ama Excel oluşturuldu!")
 
             elapsed = time.time() - start_time
 
@@ -475,13 +853,39 @@ GitHub Actions - Powered by Selenium
             print("✅ İŞLEM TAMAMLANDI!")
             print("="*60)
             print(f"⏱️  Toplam Süre: {elapsed:.1f} saniye")
+            pool_stats = self.driver_pool.stats
+            print(f"🌐 Chrome: {pool_stats['created']} açıldı | {pool_stats['reused']} tekrar kullanım | {pool_stats['recycled']} yenilendi")
+            for mode, page in self.page_stats.summary().items():
+                print(f"📦 Sayfa yükleme ({mode}): {page['pages']} sayfa | ort {page['avg_seconds']:.1f}s | "
+                      f"ort {page['avg_kb']:.0f} KB | toplam {page['total_mb']:.1f} MB")
+            hit_rate = self.scrape_cache.hit_rate()
+            if hit_rate is not None:
+                print(f"🎯 Selector önbelleği: %{hit_rate:.1f} isabet "
+                      f"({self.scrape_cache.hits} isabet | {self.scrape_cache.misses} ıska | {self.scrape_cache.cold} yeni URL)")
+            else:
+                print(f"🎯 Selector önbelleği: henüz kayıt yok ({self.scrape_cache.cold} yeni URL)")
+            consent_stats = self.consent.stats
+            print(f"🍪 Çerez onayı: {consent_stats['seeded']} sayfada önceden yüklendi | "
+                  f"{consent_stats['dismissed']} banner kapatıldı | {consent_stats['captured']} yeni kayıt")
+            for host, wait in self.page_waiter.summary().items():
+                print(f"⏳ {host}: {wait['count']} bekleme | ort {wait['avg']:.1f}s | p95 {wait['p95']:.1f}s | "
+                      f"max {wait['max']:.1f}s | zaman aşımı {wait['timeouts']} (sınır {wait['limit']}s)")
+            for host, rate in self.rate_limiter.summary().items():
+                print(f"🚦 {host}: {rate['requests']} istek | toplam bekleme {rate['waited']:.1f}s | "
+                      f"yavaşlatma {rate['throttled']} | yavaş yanıt {rate['slow']} | son hız {rate['rate']:.2f}/sn")
+            retry_stats = self.retry_scheduler.stats
+            open_hosts = self.retry_scheduler.breaker.open_hosts()
+            print(f"🔁 Denemeler: {retry_stats['attempts']} | ertelenen {retry_stats['retries']} | "
+                  f"devre kesici ile atlanan {retry_stats['short_circuited']}"
+                  + (f" | erişilemeyen: {', '.join(open_hosts)}" if open_hosts else ""))
             print(f"✅ Başarılı: {self.success_count}")
             print(f"❌ Başarısız: {self.fail_count}")
             print(f"📊 Başarı Oranı: %{(self.success_count/(self.success_count+self.fail_count)*100):.1f}")
+            self.metrics.print_summary()
             print("="*60 + "\n")
 
             # Exit code belirle
-            if self.fail_count > len(all_data) / 2:
+            if self.fail_count > row_count / 2:
                 print("⚠️  Çok fazla hata! Exit code: 1")
                 sys.exit(1)
 
@@ -494,19 +898,113 @@ GitHub Actions - Powered by Selenium
             traceback.print_exc()
             sys.exit(1)
 
+        finally:
+            self.driver_pool.close_all()
+            if self.http_fetcher:
+                self.http_fetcher.close()
+            self.scrape_cache.save()
+            if self.shard_output:
+                # Parçanın öğrendiği selector ve katmanlar birleştirme adımına taşınır
+                self.scrape_cache.save_touched(shard_cache_filename(self.shard_output.filename))
+            self.consent.save()
+            with self.metrics.span('email.flush'):
+                self.flush_outbox(float(os.getenv('OUTBOX_DRAIN_TIMEOUT', 60)))
+            self.export_metrics()
+
+    def merge_shards(self, directory=DEFAULT_SHARD_DIR):
+        """
+        `--shard i/N` çalıştırmalarının sonuçlarını tek raporda birleştirir,
+        parçaların önbellek güncellemelerini ve sayfa maliyetlerini önbelleğe
+        işler ve raporu e-postalar. Eksik parça
+        ya da modeller raporda başarısız olarak görünür.
+        """
+        shard_files, count = find_shard_files(directory)
+        if not shard_files:
+            print(f"❌ {directory} altında parça sonucu bulunamadı!")
+            return False
 
-if __name__ == "__main__":
+        missing_shards = [index for index in range(1, count + 1) if index not in shard_files]
+        print(f"🧩 {len(shard_files)}/{count} parça birleştiriliyor ({directory})")
+        if missing_shards:
+            print(f"⚠️  Eksik parçalar: {', '.join(map(str, missing_shards))}")
+
+        entries = {}
+        for index in sorted(shard_files):
+            entries.update(CheckpointJournal(shard_files[index]).entries())
+            cache_file = shard_cache_filename(shard_files[index])
+            if os.path.exists(cache_file):
+                self.scrape_cache.merge_file(cache_file)
+
+        rows = []
+        for model, brand in self.catalog.jobs():
+            entry = entries.get(CheckpointJournal.key(brand, model['url']))
+            if entry is None:
+                rows.append(self._failure_result((model, brand), 'shard_missing'))
+                continue
+            rows.append(entry['result'])
+            if entry.get('cost') is not None:
+                self.scrape_cache.record_cost(model['url'], entry['cost'])
+        self.scrape_cache.save()
+
+        for row in rows:
+            self._count_result(row['Durum'] == 'Başarılı')
+        if not self.save_to_excel(rows):
+            return False
 
-    print("🔧 GitHub Actions Car Price Tracker v2.0")
-    print("="*60 + "\n")
+        print("\n📧 Email gönderiliyor...")
+        if not self.send_email():
+            print("⚠️  Email gönderilemedi ama Excel oluşturuldu!")
+        self.flush_outbox(float(os.getenv('OUTBOX_DRAIN_TIMEOUT', 60)))
+        return not missing_shards
+
+
+# Process modunda her alt işlem kendi tracker'ını ve Chrome'unu kullanır
+_process_tracker = None
+
+
+def _worker_file(filename, worker_id):
+    """Process worker'ının ana süreçteki `filename` için yazdığı güncelleme dosyası"""
+    return f'{filename}.worker-{worker_id}'
+
+
+def _init_process_worker(settings, worker_ids):
+    global _process_tracker
+    from multiprocessing import util
 
+    worker_id = worker_ids.get()
+    settings = dict(settings)
+    if settings.get('profile_dir'):
+        # Her worker'ın kendi profil dizini olur
+        settings['profile_dir'] = os.path.join(settings['profile_dir'], f'worker-{worker_id}')
+    _process_tracker = CarPriceTracker(None, None, None, **settings)
+    tracker = _process_tracker
+    # İşlem kapanırken güncellemeleri worker dosyalarına yaz ve açık Chrome'u kapat.
+    # Ortak dosyaya yazılsaydı worker'lar birbirinin kaydını ezerdi; ana süreç birleştirir.
+    util.Finalize(None, tracker.scrape_cache.save_touched,
+                  args=(_worker_file(tracker.scrape_cache.filename, worker_id),), exitpriority=20)
+    util.Finalize(None, tracker.consent.save_captured,
+                  args=(_worker_file(tracker.consent.filename, worker_id),), exitpriority=20)
+    util.Finalize(None, tracker.driver_pool.close_all, exitpriority=10)
+
+
+def _attempt_in_process(job, attempt):
+    return _process_tracker.scrape_model_attempt(job, attempt)
+
+
+def _tracker_from_env(require_email=True, **kwargs):
+    """
+    Ortam değişkenlerinden tracker kurar; e-posta ayarları eksikse None döner.
+    require_email=False ise (e-posta göndermeyen parça modu) ayarlar zorunlu değildir.
+    """
     # GitHub Secrets'tan environment variables al
     GMAIL_USER = os.getenv('GMAIL_USER')
     GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD')
     RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL')
 
     # Kontrol et
-    if not all([GMAIL_USER, GMAIL_APP_PASSWORD, RECIPIENT_EMAIL]):
+    if not require_email:
+        print("ℹ️  Parça modu: e-posta birleştirme adımında gönderilecek\n")
+    elif not all([GMAIL_USER, GMAIL_APP_PASSWORD, RECIPIENT_EMAIL]):
         print("❌ HATA: GitHub Secrets ayarlanmamış!")
         print("\n📝 Yapılması gerekenler:")
         print("   1. Repository Settings > Secrets and variables > Actions")
@@ -515,18 +1013,63 @@ if __name__ == "__main__":
         print("      • GMAIL_APP_PASSWORD (16 haneli App Password)")
         print("      • RECIPIENT_EMAIL (Hedef email)")
         print("\n🔗 Gmail App Password: https://myaccount.google.com/apppasswords")
-        sys.exit(1)
-
-    print("✅ Environment variables yüklendi")
-    print(f"   Gmail: {GMAIL_USER}")
-    print(f"   Alıcı: {RECIPIENT_EMAIL}\n")
+        return None
+    else:
+        print("✅ Environment variables yüklendi")
+        print(f"   Gmail: {GMAIL_USER}")
+        print(f"   Alıcı: {RECIPIENT_EMAIL}\n")
 
-    # Tracker'ı başlat ve çalıştır
-    tracker = CarPriceTracker(
+    settings = dict(
         gmail_user=GMAIL_USER,
         gmail_app_password=GMAIL_APP_PASSWORD,
         recipient_email=RECIPIENT_EMAIL,
-        max_retries=3
+        max_retries=3,
+        pool_size=int(os.getenv('DRIVER_POOL_SIZE', 1)),
+        max_pages_per_driver=int(os.getenv('DRIVER_MAX_PAGES', 20)),
+        workers=int(os.getenv('SCRAPE_WORKERS', 1)),
+        executor=os.getenv('SCRAPE_EXECUTOR', 'thread'),
+        http_tier=os.getenv('HTTP_TIER', '1') != '0',
+        lean=os.getenv('LEAN_BROWSER', '0') == '1',
+        smtp_host=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
+        smtp_port=int(os.getenv('SMTP_PORT', 587)),
+        smtp_starttls=os.getenv('SMTP_STARTTLS', '1') != '0',
+        retry_base_delay=float(os.getenv('RETRY_BASE_DELAY', 2)),
+        breaker_threshold=int(os.getenv('BREAKER_THRESHOLD', 3)),
+        profile_dir=os.getenv('CHROME_PROFILE_DIR') or None
     )
+    settings.update(kwargs)
+    return CarPriceTracker(**settings)
 
-    tracker.run()
\ No newline at end of file
+
+def main(resume=False, shard=None):
+    """
+    Ortam değişkenlerinden ayarları okuyup tarayıcı tabanlı taramayı çalıştırır.
+    resume=True ise checkpoint günlüğündeki başarılı modeller tekrar çekilmez.
+    shard=(i, N) ise yalnızca i. parçadaki modeller çekilir (bkz. merge_main).
+    """
+    print("🔧 GitHub Actions Car Price Tracker v2.0")
+    print("="*60 + "\n")
+
+    # Tracker'ı başlat ve çalıştır
+    # Parçalar e-posta göndermez; secret'lar yalnızca merge-shards için gerekir
+    tracker = _tracker_from_env(require_email=shard is None, resume=resume, shard=shard)
+    if tracker is None:
+        return 1
+
+    tracker.run()
+    return 0
+
+
+def merge_main(directory=DEFAULT_SHARD_DIR):
+    """Parça sonuçlarını birleştirip tek rapor olarak e-postalar."""
+    print("🔧 GitHub Actions Car Price Tracker v2.0 - parça birleştirme")
+    print("="*60 + "\n")
+
+    tracker = _tracker_from_env(http_tier=False)
+    if tracker is None:
+        return 1
+    return 0 if tracker.merge_shards(directory) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(resume='--resume' in sys.argv[1:]))
@@ -0,0 +1,147 @@
+# cli.py
+#
+# Tek giriş noktası. Ağır bağımlılıklar (pandas, selenium, requests, smtplib)
+# yalnızca seçilen alt komutun ihtiyaç duyduğu yolda yüklenir:
+#
+#   python cli.py api-scrape                 # API tabanlı tarama (main.py)
+#   python cli.py browser-scrape [--resume]  # Selenium tabanlı tarama (car_price_tracker.py)
+#   python cli.py browser-scrape --shard 2/4 # modellerin 4 parçadan 2.'sini tara
+#   python cli.py merge-shards               # parça sonuçlarını tek rapor olarak birleştir
+#   python cli.py diff [--old N --new N]
+#   python cli.py report [--run N] [--output dosya.xlsx]
+#   python cli.py --import-report diff       # alt komutun import sürelerini ölçer
+
+import argparse
+import sys
+
+
+def _load_api_scrape():
+    from main import run
+
+    return lambda args: run()
+
+
+def _load_browser_scrape():
+    from car_price_tracker import main
+
+    return lambda args: main(resume=args.resume, shard=args.shard)
+
+
+def _load_merge_shards():
+    from car_price_tracker import merge_main
+
+    return lambda args: merge_main(args.input_dir)
+
+
+def _load_diff():
+    from utils.price_store import PriceStore
+    from utils.excel_handler import compare_dataframes
+
+    def diff(args):
+        store = PriceStore(args.db)
+        try:
+            run_ids = store.recent_run_ids(2)
+            new_id = args.new if args.new is not None else (run_ids[0] if run_ids else None)
+            old_id = args.old if args.old is not None else (run_ids[1] if len(run_ids) > 1 else None)
+            if new_id is None or old_id is None:
+                print("Karşılaştırılacak iki snapshot bulunamadı.")
+                return 1
+
+            has_changed, summary = compare_dataframes(store.snapshot(old_id), store.snapshot(new_id))
+            print(f"Snapshot #{old_id} -> #{new_id}")
+            print(summary if has_changed else "Fiyatlarda herhangi bir değişiklik bulunamadı.")
+            return 0
+        finally:
+            store.close()
+
+    return diff
+
+
+def _load_report():
+    from utils.price_store import PriceStore
+
+    def report(args):
+        store = PriceStore(args.db)
+        try:
+            store.export_excel(args.output, args.run)
+            return 0
+        finally:
+            store.close()
+
+    return report
+
+
+# Alt komut adı -> handler'ı (ve import'larını) yükleyen fonksiyon
+COMMANDS = {
+    'api-scrape': _load_api_scrape,
+    'browser-scrape': _load_browser_scrape,
+    'merge-shards': _load_merge_shards,
+    'diff': _load_diff,
+    'report': _load_report,
+}
+
+
+def _shard_arg(value):
+    from utils.model_catalog import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_parser():
+    # Varsayılanlar ağır modülleri yüklememek için burada tekrar okunur
+    import os
+
+    db_default = os.getenv("PRICE_DB_FILENAME", "fiyat_gecmisi.db")
+    excel_default = os.getenv("EXCEL_FILENAME", "otomobil_fiyatlari.xlsx")
+
+    parser = argparse.ArgumentParser(prog='cli.py', description="Otomobil fiyat takip aracı")
+    parser.add_argument('--import-report', action='store_true',
+                        help="Komutu çalıştırmadan import sürelerini ölç ve raporla")
+    parser.add_argument('--imports-only', action='store_true', help=argparse.SUPPRESS)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('api-scrape', help="Marka API'lerinden fiyatları çek, karşılaştır ve bildir")
+    browser_parser = subparsers.add_parser('browser-scrape', help="Model sayfalarını tarayıcıyla tara ve raporu e-postala")
+    browser_parser.add_argument('--resume', action='store_true',
+                                help="Checkpoint günlüğünde başarılı sonucu olan modelleri tekrar çekme")
+    browser_parser.add_argument('--shard', type=_shard_arg, metavar='i/N',
+                                help="Modelleri geçmiş sayfa maliyetine göre N dengeli parçaya böl, i. parçayı tara")
+
+    merge_parser = subparsers.add_parser('merge-shards', help="--shard çalıştırmalarının sonuçlarını tek raporda birleştir")
+    merge_parser.add_argument('--input-dir', default=os.getenv("SHARD_OUTPUT_DIR", "shards"),
+                              help="Parça dosyalarının (shard-i-of-N.jsonl) bulunduğu dizin")
+
+    diff_parser = subparsers.add_parser('diff', help="Fiyat geçmişindeki iki snapshot'ı karşılaştır")
+    diff_parser.add_argument('--old', type=int, help="Eski snapshot id'si (varsayılan: sondan bir önceki)")
+    diff_parser.add_argument('--new', type=int, help="Yeni snapshot id'si (varsayılan: son)")
+    diff_parser.add_argument('--db', default=db_default)
+
+    report_parser = subparsers.add_parser('report', help="Bir snapshot'ı Excel olarak dışa aktar")
+    report_parser.add_argument('--run', type=int, help="Snapshot id'si (varsayılan: son)")
+    report_parser.add_argument('--output', default=excel_default)
+    report_parser.add_argument('--db', default=db_default)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+
+    if args.import_report:
+        from utils.import_report import measure_imports, print_import_report
+
+        print(f"🔍 '{args.command}' komutunun import süreleri ölçülüyor...")
+        print_import_report(measure_imports([__file__, '--imports-only', args.command]))
+        return 0
+
+    handler = COMMANDS[args.command]()
+    if args.imports_only:
+        return 0
+    return handler(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
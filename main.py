@@ -1,58 +1,104 @@
 # main.py
 
-import pandas as pd
 from scrapers.hyundai_scraper import HyundaiScraper
 from scrapers.kia_scraper import KiaScraper
-from utils.excel_handler import save_to_excel, read_from_excel, compare_dataframes
-from utils.email_handler import send_email
+from scrapers.async_runner import iter_scrapes
+from utils.diff_engine import StreamingDiff
+from utils.excel_handler import summarize_diff, DEFAULT_EXCEL_FILENAME
+from utils.price_store import PriceStore, SNAPSHOT_COLUMNS
+from utils.rate_limiter import get_rate_limiter
+from utils.metrics import get_metrics
 from datetime import datetime
 
-EXCEL_FILENAME = "otomobil_fiyatlari.xlsx"
+EXCEL_FILENAME = DEFAULT_EXCEL_FILENAME
+
+def scrape_and_process(old_data):
+    """
+    Tüm markaların verilerini çeker ve birleştirir. Her marka geldiği anda
+    eski snapshot ile karşılaştırılır; diğer markalar bu sırada çekilmeye
+    devam eder. (yeni veri, değişti mi, özet) döndürür.
+    """
+    import pandas as pd
 
-def scrape_and_process():
-    """Tüm markaların verilerini çeker ve birleştirir."""
     scrapers = {
         "Hyundai": HyundaiScraper(),
         "Kia": KiaScraper(),
     }
 
+    key_columns = [col for col in SNAPSHOT_COLUMNS if col != 'Fiyat']
+    differ = StreamingDiff(old_data, key_columns) if not old_data.empty else None
+
+    # Scraper'lar ortak bağlantı havuzu ve genel bir süre sınırıyla eşzamanlı çalışır
     all_data = []
-    for brand, scraper_instance in scrapers.items():
-        try:
-            df = scraper_instance.scrape()
-            if not df.empty:
-                all_data.append(df)
-        except Exception as e:
-            print(f"HATA: {brand} scraper'ı çalıştırılırken bir hata oluştu: {e}")
+    for brand, df in iter_scrapes(scrapers):
+        if df.empty:
+            continue
+        all_data.append(df)
+        if differ is not None:
+            differ.update(df)
 
     if not all_data:
         print("Hiçbir markadan veri çekilemedi. İşlem sonlandırılıyor.")
-        return None
+        return None, False, ""
 
-    return pd.concat(all_data, ignore_index=True)
+    for host, rate in get_rate_limiter().summary().items():
+        print(f"🚦 {host}: {rate['requests']} istek | toplam bekleme {rate['waited']:.1f}s | son hız {rate['rate']:.2f}/sn")
 
-if __name__ == "__main__":
+    new_data = pd.concat(all_data, ignore_index=True)
+    if differ is None:
+        return new_data, True, "İlk veri toplama işlemi. Fiyat listesi oluşturuldu."
+    has_changed, changes_summary = summarize_diff(differ.finish())
+    return new_data, has_changed, changes_summary
+
+def run():
+    """API tabanlı taramayı çalıştırır; değişiklik varsa bildirir ve geçmişe ekler."""
     start_time = datetime.now()
     print(f"İşlem başladı: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-    old_data = read_from_excel(EXCEL_FILENAME)
-    new_data = scrape_and_process()
+    store = PriceStore()
+    # İlk çalıştırmada eski Excel durum dosyası geçmişe aktarılır
+    store.import_excel(EXCEL_FILENAME)
 
-    if new_data is not None and not new_data.empty:
-        has_changed, changes_summary = compare_dataframes(old_data, new_data)
+    metrics = get_metrics()
+    old_data = store.latest_snapshot()
+    with metrics.span('scrape'):
+        new_data, has_changed, changes_summary = scrape_and_process(old_data)
 
+    if new_data is not None and not new_data.empty:
         if has_changed:
             print("Fiyat listesinde değişiklik tespit edildi. Bildirim hazırlanıyor...")
             email_subject = "Otomobil Fiyatlarında Değişiklik Tespit Edildi!"
             email_body = f"Merhaba,\n\nAraç fiyat listelerinde aşağıdaki değişiklikler tespit edilmiştir:\n\n{changes_summary}"
 
-            send_email(email_subject, email_body)
-            save_to_excel(new_data, EXCEL_FILENAME)
+            from utils.email_handler import send_email
+            with metrics.span('email.enqueue'):
+                send_email(email_subject, email_body)
+            with metrics.span('store.append'):
+                run_id = store.append_snapshot(new_data)
+            with metrics.span('excel.save'):
+                store.export_excel(EXCEL_FILENAME, run_id)
         else:
             print("Fiyatlarda herhangi bir değişiklik bulunamadı.")
     else:
         print("Yeni veri alınamadığı için karşılaştırma yapılamadı.")
 
+    store.close()
+
+    # Bekleyen bildirimler (önceki çalıştırmalardan kalanlar dahil) gönderilir
+    from utils.email_handler import flush_outbox
+    with metrics.span('email.flush'):
+        flush_outbox()
+
+    metrics.print_summary(name='brand', key_labels=('brand',))
+    try:
+        jsonl_path, prom_path = metrics.export(EXCEL_FILENAME)
+        print(f"📈 Metrikler yazıldı: {jsonl_path}, {prom_path}")
+    except OSError as e:
+        print(f"⚠️  Metrikler yazılamadı: {e}")
+
     end_time = datetime.now()
     print(f"İşlem tamamlandı: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Toplam süre: {end_time - start_time}")
\ No newline at end of file
+    print(f"Toplam süre: {end_time - start_time}")
+
+if __name__ == "__main__":
+    run()
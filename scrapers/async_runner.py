@@ -0,0 +1,100 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from .http_cache import MAX_CONNECTIONS_PER_HOST
+from utils.metrics import get_metrics
+
+DEFAULT_DEADLINE = float(os.getenv("SCRAPE_DEADLINE", 120))
+
+
+async def _run_one(brand, scraper, host_limits, executor):
+    host = urlparse(scraper.url).netloc
+    async with host_limits.setdefault(host, asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)):
+        start = time.perf_counter()
+        with get_metrics().span('brand', brand=brand) as span:
+            df = await scraper.scrape_async(executor)
+            span['labels']['outcome'] = 'ok' if isinstance(df, pd.DataFrame) and not df.empty else 'empty'
+        print(f"⏱️  {brand}: {time.perf_counter() - start:.1f} sn")
+        return df
+
+
+async def run_scrapers(scrapers: dict, deadline: float = DEFAULT_DEADLINE, max_workers: int = 8,
+                       on_result=None) -> dict:
+    """
+    Scraper'ları eşzamanlı çalıştırır.
+
+    Her host için en fazla MAX_CONNECTIONS_PER_HOST scraper aynı anda çalışır;
+    bütün iş `deadline` saniyede bitmezse kalan scraper'lar iptal edilir.
+    {marka: DataFrame} döndürür; hata veren ya da süresi dolan markalar yer almaz.
+    on_result verilirse her marka biter bitmez on_result(marka, df) çağrılır.
+    """
+    host_limits = {}
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+    try:
+        tasks = {
+            asyncio.create_task(_run_one(brand, scraper, host_limits, executor)): brand
+            for brand, scraper in scrapers.items()
+        }
+        pending = set(tasks)
+        stop_at = time.monotonic() + deadline
+        while pending:
+            # Biten scraper'lar diğerlerini beklemeden işlenir
+            done, pending = await asyncio.wait(
+                pending, timeout=max(0, stop_at - time.monotonic()), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                brand = tasks[task]
+                try:
+                    results[brand] = task.result()
+                except Exception as e:
+                    print(f"HATA: {brand} scraper'ı çalıştırılırken bir hata oluştu: {e}")
+                    continue
+                if on_result is not None:
+                    on_result(brand, results[brand])
+
+        for task in pending:
+            task.cancel()
+            print(f"HATA: {tasks[task]} scraper'ı {deadline:.0f} sn içinde tamamlanamadı, atlanıyor.")
+    finally:
+        # Süresi dolan senkron scraper'ların thread'lerini bekleme
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+def iter_scrapes(scrapers: dict, deadline: float = DEFAULT_DEADLINE):
+    """
+    Scraper'ları arka planda eşzamanlı çalıştırır ve her markanın
+    DataFrame'ini biter bitmez (marka, df) olarak üretir. Tüketici bir
+    markayı işlerken diğer markaların çekilmesi sürer.
+    """
+    finished = object()
+    # Kuyruk en fazla marka sayısı kadar dolabilir; event loop hiç beklemez
+    results = queue.Queue()
+
+    def produce():
+        try:
+            asyncio.run(run_scrapers(scrapers, deadline, on_result=lambda brand, df: results.put((brand, df))))
+        finally:
+            results.put(finished)
+
+    thread = threading.Thread(target=produce, name='scrapers', daemon=True)
+    thread.start()
+    while True:
+        item = results.get()
+        if item is finished:
+            break
+        brand, df = item
+        if isinstance(df, pd.DataFrame):
+            yield brand, df
+    thread.join()
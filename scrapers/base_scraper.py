@@ -1,15 +1,135 @@
 from abc import ABC, abstractmethod
+from collections import namedtuple
+import asyncio
+import hashlib
+import tempfile
 import pandas as pd
 
+from .http_cache import HttpCache, get_session, body_digest
+from utils.rate_limiter import get_rate_limiter
+from utils.metrics import get_metrics
+
+# response: yeni içerik geldiyse requests.Response, aksi halde None
+# cached: içerik değişmediyse önbellekteki DataFrame, aksi halde None
+FetchResult = namedtuple('FetchResult', ['response', 'cached'])
+
+# Akış modunda gövde özetlenirken bu boyuta kadar bellekte, üstü diskte tutulur
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 class BaseScraper(ABC):
     """
     Tüm scraper sınıfları için bir temel (soyut) sınıf.
     Her scraper'ın bir URL'si olmalı ve 'scrape' metodunu içermelidir.
     """
-    def __init__(self, url: str):
+    def __init__(self, url: str, http_cache: HttpCache = None):
         if not url:
             raise ValueError("URL boş olamaz.")
         self.url = url
+        self.http_cache = http_cache or HttpCache()
+        self._pending_meta = None
+        self._spooled_body = None
+
+    def fetch(self, headers: dict = None, timeout: int = 20, stream: bool = False) -> FetchResult:
+        """
+        Koşullu GET isteği atar (If-None-Match / If-Modified-Since).
+        Sunucu 304 dönerse ya da gövde öncekiyle aynıysa ayrıştırma atlanır ve
+        önbellekteki DataFrame döndürülür.
+
+        `stream=True` ise çağıran taraf gövdeyi `iter_body` ile parça parça
+        tüketir. Önbellekte özeti bilinen bir veri varsa gövde önce ayrıştırılmadan
+        özetlenir (SPOOL_MAX_BYTES üstü geçici dosyaya); özet aynıysa ayrıştırma
+        hiç yapılmaz, farklıysa `iter_body` biriktirilen gövdeyi üretir.
+        """
+        meta = self.http_cache.load_meta(self.url)
+        cached_df = self.http_cache.load_frame(self.url) if meta else None
+
+        request_headers = dict(headers or {})
+        if cached_df is not None:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        # Host başına ortak hız sınırı (Selenium sayfa yüklemeleriyle paylaşılır)
+        limiter = get_rate_limiter()
+        metrics = get_metrics()
+        limiter.acquire(self.url)
+        try:
+            with metrics.span('http.fetch', url=self.url):
+                response = get_session().get(self.url, headers=request_headers, timeout=timeout, stream=stream)
+        except Exception:
+            limiter.record(self.url, error=True)
+            raise
+        limiter.record_response(self.url, response)
+        if response.status_code == 304 and cached_df is not None:
+            print(f"ℹ️  {self.url} değişmemiş (304), önbellekteki veri kullanılıyor.")
+            metrics.inc('http_cache_hits', reason='not_modified')
+            return FetchResult(None, cached_df)
+        response.raise_for_status()
+
+        new_meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        self._spooled_body = None
+        if stream:
+            if cached_df is None or not meta.get('digest'):
+                # Karşılaştırılacak özet yok: gövde okunurken özetlenir
+                self._pending_meta = new_meta
+                return FetchResult(response, None)
+            with response:
+                new_meta['digest'], spooled = self._spool_body(response)
+            if new_meta['digest'] != meta['digest']:
+                self._spooled_body = spooled
+            else:
+                spooled.close()
+        else:
+            new_meta['digest'] = body_digest(response.content)
+
+        if cached_df is not None and new_meta['digest'] == meta.get('digest'):
+            print(f"ℹ️  {self.url} içeriği aynı, önbellekteki veri kullanılıyor.")
+            metrics.inc('http_cache_hits', reason='same_digest')
+            self.http_cache.store(self.url, new_meta)
+            return FetchResult(None, cached_df)
+
+        self._pending_meta = new_meta
+        return FetchResult(response, None)
+
+    @staticmethod
+    def _spool_body(response, chunk_size: int = 64 * 1024):
+        """Gövdeyi özetleyerek geçici bir tampona yazar: (özet, tampon)"""
+        digest = hashlib.sha256()
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            digest.update(chunk)
+            spooled.write(chunk)
+        spooled.seek(0)
+        return digest.hexdigest(), spooled
+
+    def iter_body(self, response, chunk_size: int = 64 * 1024):
+        """Akış modundaki yanıt gövdesini parça parça üretir ve özetini hesaplar."""
+        if self._spooled_body is not None:
+            # Gövde fetch sırasında özetlenip biriktirildi
+            spooled, self._spooled_body = self._spooled_body, None
+            with spooled:
+                yield from iter(lambda: spooled.read(chunk_size), b'')
+            return
+        digest = hashlib.sha256()
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            digest.update(chunk)
+            yield chunk
+        if self._pending_meta is not None:
+            self._pending_meta['digest'] = digest.hexdigest()
+
+    def cache_parsed(self, df: pd.DataFrame):
+        """Başarıyla ayrıştırılan veriyi son yanıtın doğrulayıcılarıyla birlikte saklar."""
+        if self._pending_meta is None or df.empty:
+            return
+        try:
+            self.http_cache.store(self.url, self._pending_meta, df)
+        except OSError as e:
+            print(f"UYARI: HTTP önbelleği yazılamadı: {e}")
+        self._pending_meta = None
 
     @abstractmethod
     def scrape(self) -> pd.DataFrame:
@@ -17,4 +137,13 @@ class BaseScraper(ABC):
         Web sitesinden verileri çeker ve bir pandas DataFrame olarak döndürür.
         Bu metodun her alt scraper sınıfında override edilmesi zorunludur.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def scrape_async(self, executor=None) -> pd.DataFrame:
+        """
+        Asenkron çalıştırıcı için giriş noktası. Varsayılan olarak senkron
+        `scrape` metodunu bir executor'da çalıştırır; gerçek asenkron I/O
+        yapan scraper'lar bu metodu override edebilir.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.scrape)
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import threading
+from io import StringIO
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".http_cache")
+
+# Host başına açık tutulacak en fazla bağlantı sayısı
+MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", 4))
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Tüm scraper'ların paylaştığı requests oturumu (bağlantılar tekrar kullanılır)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=MAX_CONNECTIONS_PER_HOST, pool_block=True)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
+
+def body_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class HttpCache:
+    """
+    URL bazında HTTP doğrulayıcılarını (ETag, Last-Modified, gövde özeti) ve
+    son ayrıştırılan DataFrame'i diskte saklar.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_HTTP_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.{suffix}")
+
+    def load_meta(self, url: str) -> dict:
+        try:
+            with open(self._path(url, 'meta.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load_frame(self, url: str):
+        try:
+            with open(self._path(url, 'frame.json'), 'r', encoding='utf-8') as f:
+                return pd.read_json(StringIO(f.read()), orient='split', dtype=False)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, meta: dict, df: pd.DataFrame = None):
+        """Doğrulayıcıları ve (verildiyse) DataFrame'i atomik olarak yazar."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if df is not None:
+            self._write(self._path(url, 'frame.json'), df.to_json(orient='split', index=False, force_ascii=False))
+        self._write(self._path(url, 'meta.json'), json.dumps(meta, ensure_ascii=False))
+
+    @staticmethod
+    def _write(path: str, data: str):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -1,6 +1,31 @@
 from .base_scraper import BaseScraper
+from .streaming import iter_array_items, ColumnarBuilder
+from typing import NamedTuple
 import pandas as pd
-import requests
+
+
+class PriceRecord(NamedTuple):
+    model: str
+    donanim: str
+    fiyat: str
+
+
+def iter_price_records(chunks):
+    """
+    Hyundai fiyat JSON'unu (data -> models -> specs) akış halinde okur ve her
+    donanım için bir PriceRecord üretir. Her an yalnızca tek bir model nesnesi
+    bellekte tutulur.
+    """
+    for model in iter_array_items(chunks, 'models'):
+        if not isinstance(model, dict):
+            continue
+        model_name = model.get('modelName')
+        for spec in model.get('specs', []):
+            donanim = spec.get('specName')
+            fiyat = spec.get('price')
+            if model_name and donanim and fiyat:
+                yield PriceRecord(model_name, donanim, str(fiyat))
+
 
 class HyundaiScraper(BaseScraper):
     def __init__(self):
@@ -13,27 +38,23 @@ class HyundaiScraper(BaseScraper):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(self.url, headers=headers, timeout=20)
-            response.raise_for_status()
-
-            json_data = response.json()
-
-            price_data = []
-            for model_category in json_data.get('data', []):
-                for model in model_category.get('models', []):
-                    model_name = model.get('modelName')
-                    for spec in model.get('specs', []):
-                        donanim = spec.get('specName')
-                        fiyat = spec.get('price')
-                        if model_name and donanim and fiyat:
-                            price_data.append([model_name, donanim, fiyat])
-
-            if not price_data:
+            result = self.fetch(headers=headers, timeout=20, stream=True)
+            if result.cached is not None:
+                return result.cached
+            response = result.response
+
+            # Kayıtlar geldikçe doğrudan sütunlara eklenir
+            builder = ColumnarBuilder(['Model', 'Donanım', 'Fiyat'])
+            with response:
+                builder.extend(iter_price_records(self.iter_body(response)))
+
+            if not len(builder):
                 print("UYARI: Hyundai API'sinden veri alınamadı veya format değişmiş.")
                 return pd.DataFrame()
 
-            df = pd.DataFrame(price_data, columns=['Model', 'Donanım', 'Fiyat'])
+            df = builder.to_frame()
             df['Marka'] = 'Hyundai'
+            self.cache_parsed(df)
             print("✅ Hyundai verileri API'den başarıyla çekildi.")
             return df
 
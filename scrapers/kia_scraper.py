@@ -1,8 +1,49 @@
 from .base_scraper import BaseScraper
 import pandas as pd
-import requests
 import json
-from bs4 import BeautifulSoup
+
+GTM_MARKER = b'gtmModelPriceData'
+# Marker ile JSON değeri arasında atlanabilecek karakterler (tırnak, boşluk, ':' veya '=')
+_SEPARATOR_BYTES = b' \t\r\n"\':='
+_DECODER = json.JSONDecoder()
+
+
+def extract_gtm_price_data(content: bytes):
+    """
+    Sayfa baytlarında 'gtmModelPriceData' işaretini arar ve ardından gelen tek
+    bir dengeli JSON değerini (liste/nesne) raw_decode ile çözer. DOM
+    oluşturulmaz; boşluk ve satır sonu değişikliklerinden etkilenmez.
+    Bulunamazsa None döner.
+    """
+    index = content.find(GTM_MARKER)
+    while index != -1:
+        pos = index + len(GTM_MARKER)
+        while pos < len(content) and content[pos] in _SEPARATOR_BYTES:
+            pos += 1
+        if pos < len(content) and content[pos] in b'[{':
+            try:
+                value, _ = _DECODER.raw_decode(content[pos:].decode('utf-8', errors='replace'))
+                return value
+            except ValueError:
+                pass
+        index = content.find(GTM_MARKER, pos)
+    return None
+
+
+def extract_gtm_price_data_soup(content: bytes):
+    """Eski yöntem: BeautifulSoup ile script etiketini bulup metni böler."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+    script_tag = soup.find('script', string=lambda t: 'gtmModelPriceData' in str(t))
+
+    if not script_tag:
+        return None
+
+    script_content = script_tag.string
+    json_str = script_content.split('gtmModelPriceData: ')[1].split(';\n')[0]
+    return json.loads(json_str)
+
 
 class KiaScraper(BaseScraper):
     def __init__(self):
@@ -15,20 +56,20 @@ class KiaScraper(BaseScraper):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(self.url, headers=headers, timeout=20)
-            response.raise_for_status()
+            result = self.fetch(headers=headers, timeout=20)
+            if result.cached is not None:
+                return result.cached
+            response = result.response
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            script_tag = soup.find('script', string=lambda t: 'gtmModelPriceData' in str(t))
+            json_data = extract_gtm_price_data(response.content)
+            if json_data is None:
+                # Hızlı yol işareti bulamadı, tam HTML ayrıştırmaya düş
+                json_data = extract_gtm_price_data_soup(response.content)
 
-            if not script_tag:
+            if json_data is None:
                 print("UYARI: Kia sayfasında fiyat verisini içeren script etiketi bulunamadı.")
                 return pd.DataFrame()
 
-            script_content = script_tag.string
-            json_str = script_content.split('gtmModelPriceData: ')[1].split(';\n')[0]
-            json_data = json.loads(json_str)
-
             price_data = []
             for model_data in json_data:
                 model_name = model_data.get('modelName')
@@ -44,6 +85,7 @@ class KiaScraper(BaseScraper):
 
             df = pd.DataFrame(price_data, columns=['Model', 'Donanım', 'Fiyat'])
             df['Marka'] = 'Kia'
+            self.cache_parsed(df)
             print("✅ Kia verileri başarıyla çekildi.")
             return df
 
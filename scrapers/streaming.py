@@ -0,0 +1,103 @@
+import codecs
+import json
+import re
+
+import pandas as pd
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\r\n'
+
+
+def iter_array_items(chunks, key: str):
+    """
+    Bayt parçalarından (ör. response.iter_content) gelen JSON içinde `key`
+    anahtarına ait her dizinin elemanlarını tek tek çözerek üretir.
+
+    Gövdenin tamamı bellekte tutulmaz; tampon yalnızca o an çözülen eleman
+    kadar büyür. Aynı anahtar belgede birden fazla kez geçebilir
+    (ör. data[*].models).
+    """
+    array_start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    eof = False
+    in_array = False
+
+    def read_more():
+        nonlocal buffer, eof
+        try:
+            buffer += decoder.decode(next(chunks))
+        except StopIteration:
+            buffer += decoder.decode(b'', final=True)
+            eof = True
+
+    pos = 0
+    while True:
+        if not in_array:
+            match = array_start.search(buffer, pos)
+            if match is None:
+                if eof:
+                    return
+                # Parçalar arasında bölünmüş bir anahtarı kaçırmamak için sonu tut
+                buffer = buffer[max(pos, len(buffer) - len(key) - 64):]
+                pos = 0
+                read_more()
+                continue
+            in_array = True
+            pos = match.end()
+
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE + ',':
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError(f"JSON beklenmedik şekilde bitti ('{key}' dizisi kapanmadı).")
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+
+        if buffer[pos] == ']':
+            in_array = False
+            pos += 1
+            continue
+
+        try:
+            item, end = _DECODER.raw_decode(buffer, pos)
+            # Tamponun sonunda biten bir sayı eksik okunmuş olabilir
+            complete = end < len(buffer) or eof
+        except ValueError:
+            if eof:
+                raise
+            complete = False
+
+        if not complete:
+            # Eleman henüz tamamlanmadı; tüketilen kısmı at ve devamını oku
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+
+        yield item
+        pos = end
+
+
+class ColumnarBuilder:
+    """Kayıtları sütun listelerine ekleyip sonunda tek seferde DataFrame kurar."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._data = [[] for _ in self.columns]
+
+    def append(self, record):
+        for column, value in zip(self._data, record):
+            column.append(value)
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+        return self
+
+    def __len__(self):
+        return len(self._data[0]) if self._data else 0
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(dict(zip(self.columns, self._data)), columns=self.columns)
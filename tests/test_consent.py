@@ -0,0 +1,36 @@
+"""
+ConsentStore testleri; process worker'larının kayıtları ana süreçte birleştirilir.
+"""
+import json
+import os
+
+from utils.consent import ConsentStore
+
+
+class ConsentDriver:
+    """Onay çerezi döndüren sahte driver."""
+
+    def execute_cdp_cmd(self, command, params):
+        return {'cookies': [{'name': 'OptanonConsent', 'value': 'kabul', 'path': '/', 'session': True}]}
+
+    def execute_script(self, script, *args):
+        return {}
+
+
+def test_worker_captures_are_merged_without_clobbering(tmp_path):
+    filename = str(tmp_path / 'consent.json')
+    parent = ConsentStore(filename)
+    workers = [ConsentStore(filename), ConsentStore(filename)]
+
+    assert workers[0].capture(ConsentDriver(), 'https://www.hyundai.com/tr/i20')
+    assert workers[1].capture(ConsentDriver(), 'https://www.kia.com/tr/picanto')
+    for worker_id, worker in enumerate(workers):
+        worker.save_captured(f'{filename}.worker-{worker_id}')
+    for worker_id in range(len(workers)):
+        parent.merge_file(f'{filename}.worker-{worker_id}')
+    parent.save()
+
+    with open(filename, encoding='utf-8') as f:
+        assert sorted(json.load(f)) == ['www.hyundai.com', 'www.kia.com']
+    assert parent.stats['captured'] == 2
+    assert not os.path.exists(f'{filename}.worker-0')
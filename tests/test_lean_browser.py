@@ -0,0 +1,42 @@
+"""
+Hafif mod engelleme listesi ve site bazında izin listesi testleri.
+"""
+from utils.lean_browser import BLOCKED_PATTERNS, apply_lean_rules
+from utils.model_catalog import ModelCatalog
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+
+def blocked_urls(driver):
+    return [params['urls'] for command, params in driver.commands if command == 'Network.setBlockedURLs'][-1]
+
+
+def test_site_allowlist_is_not_blocked():
+    catalog = ModelCatalog(
+        {'Marka': [{'name': 'Model', 'url': 'https://www.ornek.com/model'}]},
+        {'www.ornek.com': {'lean_allow': ['*googletagmanager.com*', '*.svg']}},
+    )
+    driver = RecordingDriver()
+
+    apply_lean_rules(driver, catalog.lean_allowlist('https://www.ornek.com/model'))
+
+    blocked = blocked_urls(driver)
+    assert '*googletagmanager.com*' not in blocked
+    assert '*.svg' not in blocked
+    assert sorted(blocked + ['*googletagmanager.com*', '*.svg']) == sorted(BLOCKED_PATTERNS)
+
+
+def test_other_sites_keep_full_block_list():
+    catalog = ModelCatalog({}, {'www.ornek.com': {'lean_allow': ['*.svg']}})
+    driver = RecordingDriver()
+
+    apply_lean_rules(driver, catalog.lean_allowlist('https://www.baska.com/model'))
+
+    assert blocked_urls(driver) == BLOCKED_PATTERNS
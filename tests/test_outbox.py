@@ -0,0 +1,205 @@
+"""
+Outbox / OutboxSender testleri; e-postalar yerel bir sahte SMTP sunucusuna gider.
+"""
+import json
+import os
+import socket
+import socketserver
+import threading
+from email.message import EmailMessage
+
+import pytest
+
+from utils.outbox import Outbox, OutboxSender
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    En temel SMTP komutlarını konuşan sahte sunucu.
+
+    refused: alıcı adresi -> RCPT yanıt kodu (ör. 550 ya da 450)
+    auth_code: verilirse AUTH ilan edilir ve giriş bu kodla yanıtlanır
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, refused=None, auth_code=None):
+        self.refused = refused or {}
+        self.auth_code = auth_code
+        self.connections = 0
+        self.messages = []
+        super().__init__(('127.0.0.1', 0), FakeSMTPHandler)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply('220 fake ESMTP')
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                if server.auth_code:
+                    self.reply('250-fake')
+                    self.reply('250 AUTH PLAIN LOGIN')
+                else:
+                    self.reply('250 fake')
+            elif verb == 'AUTH':
+                self.reply(f'{server.auth_code} Authentication failed')
+            elif verb == 'MAIL':
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                address = command.split(':', 1)[1].strip().strip('<>')
+                code = server.refused.get(address)
+                if code:
+                    self.reply(f'{code} Recipient refused')
+                else:
+                    recipients.append(address)
+                    self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                body = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if data_line in (b'.\r\n', b''):
+                        break
+                    body.append(data_line)
+                server.messages.append((recipients, b''.join(body)))
+                self.reply('250 OK queued')
+            elif verb in ('RSET', 'NOOP'):
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(**kwargs):
+        server = FakeSMTPServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_message(recipient='alici@example.com', subject='Test'):
+    msg = EmailMessage()
+    msg['From'] = 'gonderen@example.com'
+    msg['To'] = recipient
+    msg['Subject'] = subject
+    msg.set_content('Fiyat raporu')
+    return msg
+
+
+def read_meta(directory, message_id):
+    with open(os.path.join(directory, message_id + '.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_messages_share_one_connection(tmp_path, smtp_server):
+    server = smtp_server()
+    outbox = Outbox(str(tmp_path))
+    for i in range(3):
+        outbox.put(make_message(subject=f'Rapor {i}'))
+    sender = OutboxSender(outbox, '127.0.0.1', server.port, starttls=False)
+
+    assert sender.flush() == 3
+    sender.stop(timeout=5)
+
+    assert len(server.messages) == 3
+    assert server.connections == 1
+    assert sender.stats['connections'] == 1
+    assert outbox.pending_count() == 0
+
+
+def test_refused_recipient_moves_to_failed(tmp_path, smtp_server):
+    server = smtp_server(refused={'yok@example.com': 550})
+    outbox = Outbox(str(tmp_path))
+    refused_id = outbox.put(make_message('yok@example.com'))
+    outbox.put(make_message())
+    sender = OutboxSender(outbox, '127.0.0.1', server.port, starttls=False)
+
+    assert sender.flush() == 1
+    sender.stop(timeout=5)
+
+    assert sorted(os.listdir(outbox.failed_dir)) == [refused_id + '.eml', refused_id + '.json']
+    assert read_meta(outbox.failed_dir, refused_id)['attempts'] == 1
+    assert outbox.pending_count() == 0
+    assert sender.stats['failed'] == 1
+
+
+def test_temporary_refusal_stays_pending(tmp_path, smtp_server):
+    server = smtp_server(refused={'dolu@example.com': 450})
+    outbox = Outbox(str(tmp_path))
+    message_id = outbox.put(make_message('dolu@example.com'))
+    sender = OutboxSender(outbox, '127.0.0.1', server.port, starttls=False)
+
+    assert sender.flush() == 0
+    sender.stop(timeout=5)
+
+    meta = read_meta(outbox.pending_dir, message_id)
+    assert meta['attempts'] == 1
+    assert meta['next_attempt'] > 0
+    assert os.listdir(outbox.failed_dir) == []
+
+
+def test_unreachable_server_keeps_message_pending(tmp_path):
+    outbox = Outbox(str(tmp_path))
+    message_id = outbox.put(make_message())
+    sender = OutboxSender(outbox, '127.0.0.1', unused_port(), starttls=False, timeout=2)
+
+    assert sender.flush() == 0
+
+    assert sorted(os.listdir(outbox.pending_dir)) == [message_id + '.eml', message_id + '.json']
+    meta = read_meta(outbox.pending_dir, message_id)
+    assert meta['attempts'] == 1
+    assert meta['last_error']
+    assert os.listdir(outbox.failed_dir) == []
+    # Ertelenen mesajın zamanı gelmediği için tekrar bağlanılmaz
+    assert sender.flush() == 0
+    assert read_meta(outbox.pending_dir, message_id)['attempts'] == 1
+
+
+def test_auth_failure_stops_sender(tmp_path, smtp_server):
+    server = smtp_server(auth_code=535)
+    outbox = Outbox(str(tmp_path))
+    message_id = outbox.put(make_message())
+    sender = OutboxSender(outbox, '127.0.0.1', server.port, user='kullanici', password='yanlis',
+                          starttls=False)
+
+    assert sender.flush() == 0
+    assert sender.auth_error is not None
+    assert sender.auth_error.smtp_code == 535
+    # Kimlik hatası kalıcıdır; sunucuya tekrar bağlanılmaz ve mesaj dokunulmadan bekler
+    assert sender.flush() == 0
+    assert server.connections == 1
+    assert read_meta(outbox.pending_dir, message_id)['attempts'] == 0
@@ -0,0 +1,36 @@
+"""
+parse_price (tek değer) ve parse_prices (vektörel) aynı kuralları uygulamalı.
+"""
+import pandas as pd
+import pytest
+
+from utils.price_normalize import parse_price, parse_prices
+
+CASES = [
+    ('1.234.567 TL', 123456700),
+    ('1.234.567,89 TL', 123456789),
+    ('₺1.234.567', 123456700),
+    ('₺ 1,234,567.5', 123456750),
+    ("Tavsiye edilen fiyat: 2.000.000 TL'den başlayan", 200000000),
+    ('1.250.000TL', 125000000),
+    ('1234567', 123456700),
+    ('1234567.0', 123456700),
+    (1234567, 123456700),
+    ('12,5', 1250),
+    ('Fiyat sitede bulunamadı', None),
+    ('1.2.3', None),
+    ('', None),
+    (None, None),
+    (float('nan'), None),
+]
+
+
+@pytest.mark.parametrize('text, expected', CASES)
+def test_parse_price(text, expected):
+    assert parse_price(text) == expected
+
+
+def test_scalar_matches_vectorized():
+    texts = [text for text, _ in CASES]
+    vectorized = [None if pd.isna(value) else int(value) for value in parse_prices(texts)]
+    assert vectorized == [parse_price(text) for text in texts]
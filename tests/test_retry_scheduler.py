@@ -0,0 +1,47 @@
+"""
+RetryScheduler / CircuitBreaker testleri.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.pipeline import in_order
+from utils.retry_scheduler import CircuitBreaker, RetryScheduler
+
+
+def test_error_during_half_open_probe_releases_host():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure('site')
+    time.sleep(0.06)
+    scheduler = RetryScheduler(max_attempts=1, base_delay=0.01, breaker=breaker)
+    outcomes = {'probe': (None, 'error'), 'next': ('ok', None)}
+
+    def attempt(job, attempt_no):
+        return outcomes[job]
+
+    # Yalnızca bir worker: 'probe' half-open denemesi olur ve beklenmedik hata ile biter
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        results = list(scheduler.run(['probe', 'next'], pool, attempt, lambda job: 'site',
+                                     lambda job, error: (job, error), workers=1))
+
+    assert results == [(0, ('probe', 'error')), (1, 'ok')]
+    assert not breaker.is_open('site')
+    assert scheduler.stats['short_circuited'] == 0
+
+
+def test_in_order_restores_job_order_after_retry():
+    scheduler = RetryScheduler(max_attempts=2, base_delay=0.01)
+    failed_once = set()
+
+    def attempt(job, attempt_no):
+        # 'a' ilk denemede geçici hata verir ve kuyruğun sonuna ertelenir
+        if job == 'a' and job not in failed_once:
+            failed_once.add(job)
+            return None, 'error'
+        return job.upper(), None
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        completed = list(scheduler.run(['a', 'b', 'c'], pool, attempt, lambda job: 'site',
+                                       lambda job, error: None, workers=1))
+
+    assert completed == [(1, 'B'), (2, 'C'), (0, 'A')]
+    assert list(in_order(iter(completed))) == ['A', 'B', 'C']
@@ -0,0 +1,68 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+DEFAULT_CHECKPOINT_FILE = os.getenv("CHECKPOINT_FILE", ".scrape_checkpoint.jsonl")
+DEFAULT_WINDOW_HOURS = float(os.getenv("CHECKPOINT_WINDOW_HOURS", 12))
+
+
+class CheckpointJournal:
+    """
+    Her model sonucunu üretildiği anda satır satır (JSON Lines) diske yazan
+    günlük. Her satır flush + fsync ile yazılır; Chrome çökse ya da iş
+    öldürülse de o ana kadarki sonuçlar kalır. Devam (resume) modunda
+    `window_hours` içindeki başarılı sonuçlar tekrar çekilmez.
+    """
+
+    def __init__(self, filename: str = DEFAULT_CHECKPOINT_FILE, window_hours: float = DEFAULT_WINDOW_HOURS):
+        self.filename = filename
+        self.window = timedelta(hours=window_hours)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(brand: str, url: str) -> str:
+        return f"{brand}|{url}"
+
+    def reset(self):
+        """Yeni bir çalıştırma penceresi başlatır (eski günlük silinir)."""
+        with self._lock:
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+
+    def record(self, key: str, result: dict, **extra):
+        """Sonucu günlüğe ekler; `extra` alanları (ör. cost) satıra olduğu gibi yazılır."""
+        entry = {'time': datetime.now().isoformat(timespec='seconds'), 'key': key, 'result': result}
+        entry.update(extra)
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.filename, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load(self) -> dict:
+        """Pencere içindeki her anahtarın en son sonucunu döndürür."""
+        return {key: entry['result'] for key, entry in self.entries().items()}
+
+    def entries(self) -> dict:
+        """Pencere içindeki her anahtarın en son satırını (tüm alanlarıyla) döndürür."""
+        if not os.path.exists(self.filename):
+            return {}
+        since = datetime.now() - self.window
+        latest = {}
+        with open(self.filename, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    recorded_at = datetime.fromisoformat(entry['time'])
+                except (ValueError, KeyError):
+                    # İş yazarken öldürüldüyse son satır yarım kalmış olabilir
+                    continue
+                if recorded_at >= since and 'result' in entry:
+                    latest[entry['key']] = entry
+        return latest
+
+    def successful(self) -> dict:
+        """Pencere içinde başarılı sonucu olan anahtarlar -> sonuç."""
+        return {key: result for key, result in self.load().items() if result.get('Durum') == 'Başarılı'}
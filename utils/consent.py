@@ -0,0 +1,253 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+DEFAULT_CONSENT_FILE = os.getenv("CONSENT_STATE_FILE", ".consent_state.json")
+
+# Consent yönetim platformlarının (OneTrust, Cookiebot, Didomi, IAB TCF vb.)
+# onay bilgisini tuttuğu çerez / localStorage anahtarları
+CONSENT_KEY_PATTERN = re.compile(
+    r'consent|optanon|cookielaw|cookiebot|didomi|euconsent|eupubconsent|gdpr|kvkk|cmp|'
+    r'cookie[-_]?(policy|notice|accept|banner|bar)',
+    re.IGNORECASE,
+)
+
+# Network.setCookie'nin kabul ettiği alanlar
+_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+# Banner'ı tek bir WebDriver çağrısıyla kapatır. Banner açıksa önce platformun
+# kendi API'si denenir; yoksa close_popups_legacy'deki XPath kurallarıyla aynı
+# sırada her kuraldan görünür ilk element tıklanır.
+DISMISS_CONSENT_SCRIPT = """
+var result = {api: null, clicked: []};
+try {
+    if (window.OneTrust && window.OneTrust.IsAlertBoxClosed && !window.OneTrust.IsAlertBoxClosed()) {
+        window.OneTrust.AllowAll(); result.api = 'onetrust'; return result;
+    }
+    if (window.Cookiebot && window.Cookiebot.submitCustomConsent && !window.Cookiebot.hasResponse) {
+        window.Cookiebot.submitCustomConsent(true, true, true); result.api = 'cookiebot'; return result;
+    }
+    if (window.Didomi && window.Didomi.shouldConsentBeCollected && window.Didomi.shouldConsentBeCollected()) {
+        window.Didomi.setUserAgreeToAll(); result.api = 'didomi'; return result;
+    }
+} catch (e) {}
+function visible(node) { return node.getClientRects && node.getClientRects().length > 0; }
+function ownText(node) {
+    var text = '';
+    for (var i = 0; i < node.childNodes.length; i++) {
+        if (node.childNodes[i].nodeType === 3) { text += node.childNodes[i].nodeValue; }
+    }
+    return text;
+}
+function attr(name, part) { return function (node) { return (node.getAttribute(name) || '').indexOf(part) >= 0; }; }
+function text(part) { return function (node) { return ownText(node).indexOf(part) >= 0; }; }
+var rules = [
+    ['button', text('Kabul')], ['button', text('Accept')], ['button', text('Tümünü kabul')],
+    ['button', attr('class', 'cookie')], ['button', attr('id', 'accept')],
+    ['a', attr('class', 'close')], ['button', attr('class', 'close')]
+];
+for (var i = 0; i < rules.length; i++) {
+    var nodes = document.getElementsByTagName(rules[i][0]);
+    for (var j = 0; j < nodes.length; j++) {
+        if (rules[i][1](nodes[j]) && visible(nodes[j]) && result.clicked.indexOf(nodes[j]) < 0) {
+            try { nodes[j].click(); result.clicked.push(nodes[j]); } catch (e) {}
+            break;
+        }
+    }
+}
+return result;
+"""
+
+# Sitenin onay anahtarlarını localStorage'dan okur
+READ_CONSENT_STORAGE_SCRIPT = """
+var pattern = new RegExp(arguments[0], 'i'), items = {};
+try {
+    for (var i = 0; i < window.localStorage.length; i++) {
+        var key = window.localStorage.key(i);
+        if (pattern.test(key)) { items[key] = window.localStorage.getItem(key); }
+    }
+} catch (e) {}
+return items;
+"""
+
+# Her yeni dokümanda, sayfanın script'lerinden önce çalışır; yalnızca ilgili
+# sitede ve anahtar yoksa yazar
+SEED_STORAGE_TEMPLATE = """
+(function () {
+    if (location.host !== %s) { return; }
+    var items = %s;
+    try {
+        for (var key in items) {
+            if (window.localStorage.getItem(key) === null) { window.localStorage.setItem(key, items[key]); }
+        }
+    } catch (e) {}
+})();
+"""
+
+
+class ConsentStore:
+    """
+    Site bazında çerez onayı durumu (onay çerezleri ve localStorage kayıtları).
+
+    Banner bir kez kapatıldığında oluşan onay durumu kaydedilir; sonraki
+    sayfalarda ve çalıştırmalarda gezinmeden önce CDP ile tarayıcıya yüklenir,
+    böylece banner hiç çıkmaz. Süresi dolan çerezi olan site kaydı silinir ve
+    bir sonraki banner'da yeniden yakalanır.
+    """
+
+    def __init__(self, filename: str = DEFAULT_CONSENT_FILE):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self.sites = self._load()
+        self._dirty = False
+        # Bu çalıştırmada yakalanan siteler (process worker'larının birleştirmesi için)
+        self._captured = set()
+        self.stats = {'seeded': 0, 'dismissed': 0, 'captured': 0}
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.filename):
+            return {}
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                sites = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Çerez onayı kaydı okunamadı, sıfırdan başlanıyor: {e}")
+            return {}
+
+        now = time.time()
+        fresh = {}
+        for host, state in sites.items():
+            cookies = state.get('cookies', [])
+            if any(0 < cookie.get('expires', -1) < now for cookie in cookies):
+                continue
+            fresh[host] = state
+        return fresh
+
+    def save(self):
+        """Kaydı atomik olarak diske yazar (değişiklik yoksa yazmaz)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self.sites, ensure_ascii=False, indent=2)
+            self._dirty = False
+        directory = os.path.dirname(self.filename)
+        tmp_name = self.filename + '.tmp'
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_name, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_name, self.filename)
+        except OSError as e:
+            print(f"⚠️  Çerez onayı kaydedilemedi: {e}")
+
+    def save_captured(self, filename: str):
+        """
+        Yalnızca bu çalıştırmada yakalanan site kayıtlarını ve istatistikleri
+        yazar. Process worker'ları kendi dosyalarına yazar; ana süreç
+        merge_file ile birleştirip tek seferde kaydeder.
+        """
+        with self._lock:
+            data = {
+                'sites': {host: self.sites[host] for host in self._captured if host in self.sites},
+                'stats': dict(self.stats),
+            }
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️  Worker çerez onayı kaydedilemedi: {e}")
+
+    def merge_file(self, filename: str):
+        """save_captured ile yazılmış worker dosyasını birleştirir ve siler."""
+        try:
+            with open(filename, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Worker çerez onayı okunamadı: {e}")
+            return
+        with self._lock:
+            sites = data.get('sites', {})
+            if sites:
+                self.sites.update(sites)
+                self._captured.update(sites)
+                self._dirty = True
+            for name, count in data.get('stats', {}).items():
+                self.stats[name] = self.stats.get(name, 0) + count
+        os.remove(filename)
+
+    def seed(self, driver, url: str, seeded_hosts: set) -> bool:
+        """
+        Gezinmeden önce sitenin onay çerezlerini yazar. localStorage kayıtları
+        için driver başına bir kez yeni doküman script'i eklenir
+        (`seeded_hosts` driver'ın bu script'i eklediği siteler).
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self.sites.get(host)
+        if not state:
+            return False
+        try:
+            if state.get('cookies'):
+                # Havuz marka değişiminde çerezleri sildiği için her gezinmede yazılır
+                driver.execute_cdp_cmd('Network.setCookies', {'cookies': state['cookies']})
+            if state.get('local_storage') and host not in seeded_hosts:
+                source = SEED_STORAGE_TEMPLATE % (json.dumps(host), json.dumps(state['local_storage']))
+                driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+                seeded_hosts.add(host)
+        except Exception as e:
+            print(f"⚠️  Çerez onayı yüklenemedi: {str(e)[:50]}")
+            return False
+        with self._lock:
+            self.stats['seeded'] += 1
+        return True
+
+    def dismiss(self, driver) -> tuple:
+        """
+        Banner'ı sayfa içi script ile kapatır.
+        (kapatıldı mı, tıklanan elementler) döndürür.
+        """
+        result = driver.execute_script(DISMISS_CONSENT_SCRIPT) or {}
+        clicked = result.get('clicked') or []
+        dismissed = bool(result.get('api') or clicked)
+        if dismissed:
+            with self._lock:
+                self.stats['dismissed'] += 1
+        return dismissed, clicked
+
+    def capture(self, driver, url: str) -> bool:
+        """Banner kapatıldıktan sonra sitenin onay çerezlerini ve localStorage kayıtlarını saklar."""
+        try:
+            cookies = driver.execute_cdp_cmd('Network.getCookies', {'urls': [url]}).get('cookies', [])
+            local_storage = driver.execute_script(READ_CONSENT_STORAGE_SCRIPT, CONSENT_KEY_PATTERN.pattern) or {}
+        except Exception as e:
+            print(f"⚠️  Çerez onayı okunamadı: {str(e)[:50]}")
+            return False
+
+        consent_cookies = []
+        for cookie in cookies:
+            if not CONSENT_KEY_PATTERN.search(cookie.get('name', '')):
+                continue
+            kept = {field: cookie[field] for field in _COOKIE_FIELDS if field in cookie}
+            if cookie.get('session') or kept.get('expires', -1) <= 0:
+                # Oturum çerezi olarak geri yazılır
+                kept.pop('expires', None)
+            consent_cookies.append(kept)
+        if not consent_cookies and not local_storage:
+            return False
+
+        host = urlparse(url).netloc
+        with self._lock:
+            self.sites[host] = {
+                'cookies': consent_cookies,
+                'local_storage': local_storage,
+                'captured': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._dirty = True
+            self._captured.add(host)
+            self.stats['captured'] += 1
+        return True
@@ -0,0 +1,177 @@
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from utils.price_normalize import parse_prices, format_price
+
+PRICE_COLUMN = 'Fiyat'
+
+# changed: eski ve yeni fiyatı içeren satırlar (Fiyat_eski, Fiyat_yeni, Fark (kuruş), Değişim (%))
+# added / removed: listeye eklenen / listeden kaldırılan satırlar
+DiffResult = namedtuple('DiffResult', ['changed', 'added', 'removed'])
+
+
+# Sütun hash'lerini birleştirirken kullanılan çarpan (64 bit altın oran sabiti)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def normalize_frame(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Karşılaştırılacak sütunları metne çevirip kırpar (çağıranın DataFrame'i değişmez)."""
+    return pd.DataFrame({col: df[col].astype(str).str.strip().to_numpy() for col in columns})
+
+
+def row_hashes(df: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Verilen sütunların birleşik anahtarını satır başına tek bir uint64'e indirger.
+    Metne çevirme/kırpma ve hash yalnızca her sütunun farklı değerleri üzerinde
+    yapılır; satırlara kodlar üzerinden dağıtılır.
+    """
+    combined = np.zeros(len(df), dtype=np.uint64)
+    for col in columns:
+        codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+        uniques = pd.Index(uniques).astype(str).str.strip().to_numpy(dtype=object)
+        combined = (combined * _MIX) ^ pd.util.hash_array(uniques)[codes]
+    return combined
+
+
+def price_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Fiyatları sayısal değerleri üzerinden hash'ler; "1.250.000" ile "1250000"
+    aynı fiyat sayılır. Okunamayan değerler metin olarak karşılaştırılır.
+    """
+    kurus = parse_prices(df[PRICE_COLUMN])
+    numeric = pd.util.hash_array(kurus.fillna(-1).to_numpy(dtype=np.int64))
+    return np.where(kurus.isna().to_numpy(), row_hashes(df, [PRICE_COLUMN]), numeric)
+
+
+def snapshot_fingerprint(key_hashes: np.ndarray, price_hashes: np.ndarray) -> str:
+    """Satır sırasından bağımsız, snapshot'ın tamamını temsil eden özet."""
+    combined = np.sort(key_hashes ^ (price_hashes * _MIX))
+    return hashlib.blake2b(combined.tobytes(), digest_size=16).hexdigest()
+
+
+def diff_frames(old_df: pd.DataFrame, new_df: pd.DataFrame, key_columns: list):
+    """
+    İki snapshot'ı birleşik anahtar ve fiyat hash'leri üzerinden karşılaştırır.
+    Snapshot'lar aynıysa None, değilse DiffResult döndürür. Aynı anahtar
+    birden fazla kez geçiyorsa son satır geçerli sayılır.
+    """
+    return StreamingDiff(old_df, key_columns).update(new_df).finish()
+
+
+class StreamingDiff:
+    """
+    Yeni snapshot'ı parçalar halinde (ör. marka marka, scraper'lar bittikçe)
+    alan karşılaştırıcı. Her parçanın hash'leri update() ile geldiği anda
+    hesaplanır; finish() tüm parçalar için diff_frames ile aynı sonucu verir.
+    """
+
+    def __init__(self, old_df: pd.DataFrame, key_columns: list):
+        self.old_df = old_df
+        self.key_columns = key_columns
+        self.old_keys = row_hashes(old_df, key_columns)
+        self.old_prices = price_hashes(old_df)
+        self._frames = []
+        self._keys = []
+        self._prices = []
+
+    def update(self, new_chunk: pd.DataFrame):
+        self._frames.append(new_chunk)
+        self._keys.append(row_hashes(new_chunk, self.key_columns))
+        self._prices.append(price_hashes(new_chunk))
+        return self
+
+    def finish(self):
+        if not self._frames:
+            new_df = self.old_df.iloc[0:0]
+        elif len(self._frames) == 1:
+            new_df = self._frames[0]
+        else:
+            new_df = pd.concat(self._frames, ignore_index=True)
+        new_keys = np.concatenate(self._keys) if self._keys else np.zeros(0, dtype=np.uint64)
+        new_prices = np.concatenate(self._prices) if self._prices else np.zeros(0, dtype=np.uint64)
+        return _diff_hashed(self.old_df, new_df, self.key_columns,
+                            self.old_keys, self.old_prices, new_keys, new_prices)
+
+
+def _diff_hashed(old_df, new_df, key_columns, old_keys, old_prices, new_keys, new_prices):
+    columns = key_columns + [PRICE_COLUMN]
+
+    if snapshot_fingerprint(old_keys, old_prices) == snapshot_fingerprint(new_keys, new_prices):
+        return None
+
+    # Tekrarlanan anahtarlarda son satırı tut; orijinal satır konumlarını sakla
+    old_rows = np.flatnonzero(~pd.Index(old_keys).duplicated(keep='last'))
+    new_rows = np.flatnonzero(~pd.Index(new_keys).duplicated(keep='last'))
+    old_keys, old_prices = old_keys[old_rows], old_prices[old_rows]
+    new_keys, new_prices = new_keys[new_rows], new_prices[new_rows]
+
+    # Yeni satırların eski snapshot'taki konumu (-1: yok)
+    positions = pd.Index(old_keys).get_indexer(new_keys)
+    matched = positions >= 0
+    changed_mask = matched.copy()
+    changed_mask[matched] = old_prices[positions[matched]] != new_prices[matched]
+    removed_mask = ~np.isin(old_keys, new_keys)
+
+    # Yalnızca raporlanacak satırlar metne çevrilir
+    added = normalize_frame(new_df.iloc[new_rows[~matched]], columns)
+    removed = normalize_frame(old_df.iloc[old_rows[removed_mask]], columns)
+    changed = normalize_frame(new_df.iloc[new_rows[changed_mask]], columns)
+    changed = changed.rename(columns={PRICE_COLUMN: PRICE_COLUMN + '_yeni'})
+    old_prices_text = normalize_frame(old_df.iloc[old_rows[positions[changed_mask]]], [PRICE_COLUMN])[PRICE_COLUMN]
+    changed.insert(len(key_columns), PRICE_COLUMN + '_eski', old_prices_text.to_numpy())
+
+    # Sayısal fark ve yüzde değişim (fiyatlardan biri okunamıyorsa <NA>)
+    old_kurus = parse_prices(changed[PRICE_COLUMN + '_eski'])
+    new_kurus = parse_prices(changed[PRICE_COLUMN + '_yeni'])
+    changed['Fark (kuruş)'] = new_kurus - old_kurus
+    changed['Değişim (%)'] = (changed['Fark (kuruş)'] / old_kurus.where(old_kurus != 0) * 100).astype('Float64')
+
+    def sort(df):
+        return df.sort_values(key_columns, kind='stable').reset_index(drop=True)
+
+    # Fiyatı değişenler en büyük yüzde değişimden küçüğe sıralanır
+    changed = sort(changed)
+    order = changed['Değişim (%)'].abs().sort_values(ascending=False, kind='stable', na_position='last').index
+    changed = changed.loc[order].reset_index(drop=True)
+
+    return DiffResult(changed, sort(added), sort(removed))
+
+
+def _labels(df: pd.DataFrame) -> pd.Series:
+    """'- Marka Model (Donanım)' satır başlıklarını toplu olarak üretir."""
+    donanim_col = 'Donanım' if 'Donanım' in df.columns else 'Yakıt/Donanım'
+    donanim = df[donanim_col] if donanim_col in df.columns else pd.Series('None', index=df.index)
+    return '- ' + df['Marka'] + ' ' + df['Model'] + ' (' + donanim + '): '
+
+
+def _change_notes(changed: pd.DataFrame) -> pd.Series:
+    """' (+12.345 TL, %+1,2)' şeklindeki fark notları; fark hesaplanamayan satırlarda boş."""
+    delta = changed['Fark (kuruş)']
+    percent = changed['Değişim (%)']
+    known = delta.notna() & percent.notna()
+    notes = pd.Series('', index=changed.index, dtype=object)
+    if known.any():
+        sign = np.where(delta[known] > 0, '+', '-')
+        amount = delta[known].abs().map(format_price)
+        pct = percent[known].map('{:+.1f}'.format).str.replace('.', ',', regex=False)
+        notes[known] = ' (' + sign + amount + ', %' + pct + ')'
+    return notes
+
+
+def render_summary(diff: DiffResult) -> str:
+    """Değişiklik özetini satır satır döngü kurmadan metne çevirir."""
+    sections = []
+    if not diff.changed.empty:
+        lines = _labels(diff.changed) + diff.changed['Fiyat_eski'] + ' -> ' + diff.changed['Fiyat_yeni']
+        lines = lines + _change_notes(diff.changed)
+        sections.append("FİYATI DEĞİŞEN ARAÇLAR:\n" + '\n'.join(lines.tolist()))
+    if not diff.added.empty:
+        lines = _labels(diff.added) + diff.added[PRICE_COLUMN]
+        sections.append("LİSTEYE YENİ EKLENEN ARAÇLAR:\n" + '\n'.join(lines.tolist()))
+    if not diff.removed.empty:
+        lines = _labels(diff.removed) + diff.removed[PRICE_COLUMN]
+        sections.append("LİSTEDEN KALDIRILAN ARAÇLAR:\n" + '\n'.join(lines.tolist()))
+    return '\n\n'.join(sections)
@@ -0,0 +1,169 @@
+import queue
+import threading
+
+
+class PooledDriver:
+    """Havuzdaki bir WebDriver'ı ve kullanım bilgilerini tutar."""
+
+    def __init__(self, driver, slot: int):
+        self.driver = driver
+        self.slot = slot
+        self.pages = 0
+        self.brand = None
+        self.broken = False
+        # Çerez onayı localStorage script'inin eklendiği siteler (bkz. ConsentStore.seed)
+        self.seeded_hosts = set()
+
+
+class DriverPool:
+    """
+    Uzun ömürlü Chrome WebDriver havuzu.
+
+    Her deneme için yeni bir Chrome açmak yerine birkaç driver oluşturulur ve
+    tekrar tekrar kullanılır. Bir driver yalnızca çöktüğünde ya da
+    `max_pages` sayfa açtıktan sonra yenilenir. Farklı bir markaya geçerken
+    çerezler ve depolama temizlenir.
+
+    Her driver bir slot numarası alır (0..size-1); yenilenen driver boşalan
+    slotu devralır. Aynı anda açık iki driver aynı slotu kullanmaz, böylece
+    slot başına bir tarayıcı profil dizini güvenle kullanılabilir.
+    """
+
+    def __init__(self, driver_factory, size: int = 1, max_pages: int = 20):
+        """
+        Args:
+            driver_factory: Slot numarasını alıp yeni bir WebDriver döndüren fonksiyon
+            size: Aynı anda açık tutulabilecek maksimum driver sayısı
+            max_pages: Bir driver'ın yenilenmeden önce açabileceği sayfa sayısı
+        """
+        if size < 1:
+            raise ValueError("Havuz boyutu en az 1 olmalı.")
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_pages = max_pages
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._free_slots = list(range(size))
+        self._all = []
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0}
+
+    def _new_driver(self, slot: int):
+        try:
+            driver = self.driver_factory(slot)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+                self._free_slots.append(slot)
+            raise
+        pooled = PooledDriver(driver, slot)
+        with self._lock:
+            self._all.append(pooled)
+            self.stats['created'] += 1
+        return pooled
+
+    def _discard(self, pooled):
+        # Slot, eski Chrome kapandıktan sonra serbest kalır (profil dizini kilidi)
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            if pooled in self._all:
+                self._all.remove(pooled)
+            self._created -= 1
+            if pooled.slot not in self._free_slots:
+                self._free_slots.append(pooled.slot)
+            self.stats['recycled'] += 1
+
+    def is_healthy(self, pooled) -> bool:
+        """Driver'ın hâlâ komut kabul edip etmediğini kontrol eder."""
+        if pooled.broken or pooled.pages >= self.max_pages:
+            return False
+        try:
+            return pooled.driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def reset_state(self, pooled):
+        """Çerezleri, localStorage/sessionStorage'ı ve önbelleği temizler."""
+        driver = pooled.driver
+        try:
+            driver.delete_all_cookies()
+        except Exception:
+            pass
+        try:
+            driver.execute_script(
+                'try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}'
+            )
+        except Exception:
+            pass
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        except Exception:
+            pass
+
+    def acquire(self, brand=None) -> PooledDriver:
+        """
+        Sağlıklı bir driver döndürür. Boşta driver yoksa ve havuz dolmamışsa
+        yenisini oluşturur, aksi halde bir driver serbest kalana kadar bekler.
+        """
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        slot = min(self._free_slots)
+                        self._free_slots.remove(slot)
+                        self._created += 1
+                if can_create:
+                    pooled = self._new_driver(slot)
+                    break
+                pooled = self._idle.get()
+
+            if pooled is None:
+                # Bir driver kapatıldı, yerine yenisi oluşturulabilir
+                continue
+            if not self.is_healthy(pooled):
+                self._discard(pooled)
+                continue
+            with self._lock:
+                self.stats['reused'] += 1
+            break
+
+        if brand is not None and pooled.brand not in (None, brand):
+            self.reset_state(pooled)
+        pooled.brand = brand
+        return pooled
+
+    def release(self, pooled, broken: bool = False):
+        """Driver'ı havuza geri verir; bozuksa kapatıp yerine yenisine yer açar."""
+        if broken:
+            pooled.broken = True
+        if pooled.broken or pooled.pages >= self.max_pages:
+            self._discard(pooled)
+            # Bekleyen bir acquire() çağrısını uyandır
+            self._idle.put(None)
+            return
+        self._idle.put(pooled)
+
+    def close_all(self):
+        """Havuzdaki tüm driver'ları kapatır."""
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+            self._created = 0
+            self._free_slots = list(range(self.size))
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for pooled in drivers:
+            try:
+                pooled.driver.quit()
+            except Exception:
+                pass
@@ -1,21 +1,41 @@
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 import os
 
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
+# Yerel bir test sunucusu (ör. python -m aiosmtpd -n -l localhost:8025) için 0 yapılabilir
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "1") != "0"
 EMAIL_SENDER = os.getenv("EMAIL_SENDER")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
 EMAIL_RECEIVER = os.getenv("EMAIL_RECEIVER")
+# Çalıştırma sonunda kuyruğun boşaltılması için beklenecek en uzun süre (sn)
+OUTBOX_DRAIN_TIMEOUT = float(os.getenv("OUTBOX_DRAIN_TIMEOUT", 60))
+
+_sender = None
+
+def _get_sender():
+    """Outbox ve arka plan göndericisini ilk ihtiyaçta oluşturur."""
+    global _sender
+    if _sender is None:
+        from utils.outbox import Outbox, OutboxSender
+
+        _sender = OutboxSender(Outbox(), SMTP_SERVER, SMTP_PORT, EMAIL_SENDER, EMAIL_PASSWORD,
+                               starttls=SMTP_STARTTLS)
+    return _sender
 
 def send_email(subject: str, body: str):
-    """Değişiklikleri içeren bir e-posta gönderir."""
+    """
+    Değişiklikleri içeren e-postayı outbox'a yazar ve arka plan göndericisini
+    başlatır; çağıran SMTP bağlantısını beklemez. Gönderimin tamamlanması için
+    çalıştırma sonunda flush_outbox() çağrılmalıdır.
+    """
     if not all([EMAIL_SENDER, EMAIL_PASSWORD, EMAIL_RECEIVER]):
         print("HATA: Gerekli çevre değişkenleri (EMAIL_SENDER, EMAIL_PASSWORD, EMAIL_RECEIVER) ayarlanmamış.")
         print("Lütfen GitHub repository Secrets ayarlarınızı kontrol edin.")
         return
 
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
     try:
         msg = MIMEMultipart()
         msg['From'] = EMAIL_SENDER
@@ -23,14 +43,30 @@ def send_email(subject: str, body: str):
         msg['Subject'] = subject
         msg.attach(MIMEText(body, 'plain', 'utf-8'))
 
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            server.send_message(msg)
-            print("Değişiklik bildirimi e-postası başarıyla gönderildi.")
+        sender = _get_sender()
+        sender.outbox.put(msg)
+        sender.start()
+        sender.notify()
+        print("Değişiklik bildirimi e-postası gönderim kuyruğuna eklendi.")
 
-    except smtplib.SMTPAuthenticationError:
-        print("HATA: E-posta gönderilemedi. SMTP kimlik doğrulaması başarısız.")
-        print("Lütfen GitHub Secrets'daki EMAIL_SENDER ve EMAIL_PASSWORD bilgilerini kontrol edin.")
     except Exception as e:
-        print(f"HATA: E-posta gönderirken bir sorun oluştu: {e}")
\ No newline at end of file
+        print(f"HATA: E-posta kuyruğa eklenirken bir sorun oluştu: {e}")
+
+def flush_outbox(timeout: float = OUTBOX_DRAIN_TIMEOUT):
+    """
+    Kuyruktaki (önceki çalıştırmalardan kalanlar dahil) e-postaları en fazla
+    `timeout` saniye boyunca göndermeyi dener. Gönderilemeyenler diskte kalır.
+    """
+    if _sender is None:
+        from utils.outbox import DEFAULT_OUTBOX_DIR
+
+        pending_dir = os.path.join(DEFAULT_OUTBOX_DIR, 'pending')
+        if not os.path.isdir(pending_dir) or not any(name.endswith('.json') for name in os.listdir(pending_dir)):
+            return
+        if not all([EMAIL_SENDER, EMAIL_PASSWORD]):
+            return
+
+    sender = _get_sender()
+    remaining = sender.stop(timeout)
+    print(f"📧 E-posta: {sender.stats['sent']} gönderildi | {sender.stats['retried']} ertelendi | "
+          f"{sender.stats['failed']} başarısız | {sender.stats['connections']} SMTP bağlantısı | kuyrukta {remaining}")
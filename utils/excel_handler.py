@@ -1,6 +1,10 @@
 import pandas as pd
 import os
 
+from utils.diff_engine import diff_frames, render_summary
+
+DEFAULT_EXCEL_FILENAME = os.getenv("EXCEL_FILENAME", "otomobil_fiyatlari.xlsx")
+
 def save_to_excel(df: pd.DataFrame, filename: str):
     """DataFrame'i belirtilen Excel dosyasına kaydeder."""
     try:
@@ -28,45 +32,13 @@ def compare_dataframes(old_df: pd.DataFrame, new_df: pd.DataFrame) -> (bool, str
 
     key_columns = [col for col in new_df.columns if col != 'Fiyat']
 
-    for df in [old_df, new_df]:
-        for col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
-
-    merged_df = pd.merge(
-        old_df, new_df,
-        on=key_columns,
-        how='outer',
-        suffixes=('_eski', '_yeni')
-    )
-
-    # Fiyatı değişenler
-    changed_prices = merged_df[merged_df['Fiyat_eski'] != merged_df['Fiyat_yeni']].dropna(subset=['Fiyat_eski', 'Fiyat_yeni'])
-
-    # Eklenen araçlar (eskide olmayıp yenide olanlar)
-    added_cars = merged_df[merged_df['Fiyat_eski'].isna()]
+    # Birleşik anahtar ve fiyat hash'leri ile vektörel karşılaştırma;
+    # snapshot özetleri aynıysa satır bazında hiçbir iş yapılmaz.
+    return summarize_diff(diff_frames(old_df, new_df, key_columns))
 
-    # Kaldırılan araçlar (yenide olmayıp eskide olanlar)
-    removed_cars = merged_df[merged_df['Fiyat_yeni'].isna()]
-
-    if changed_prices.empty and added_cars.empty and removed_cars.empty:
+def summarize_diff(diff) -> (bool, str):
+    """diff_frames / StreamingDiff sonucunu (değişti mi, özet metni) çiftine çevirir."""
+    if diff is None or (diff.changed.empty and diff.added.empty and diff.removed.empty):
         return False, ""
 
-    summary = ""
-    if not changed_prices.empty:
-        summary += "FİYATI DEĞİŞEN ARAÇLAR:\n"
-        for _, row in changed_prices.iterrows():
-            summary += f"- {row['Marka']} {row['Model']} ({row.get('Donanım', row.get('Yakıt/Donanım'))}): {row['Fiyat_eski']} -> {row['Fiyat_yeni']}\n"
-        summary += "\n"
-
-    if not added_cars.empty:
-        summary += "LİSTEYE YENİ EKLENEN ARAÇLAR:\n"
-        for _, row in added_cars.iterrows():
-            summary += f"- {row['Marka']} {row['Model']} ({row.get('Donanım', row.get('Yakıt/Donanım'))}): {row['Fiyat_yeni']}\n"
-        summary += "\n"
-
-    if not removed_cars.empty:
-        summary += "LİSTEDEN KALDIRILAN ARAÇLAR:\n"
-        for _, row in removed_cars.iterrows():
-            summary += f"- {row['Marka']} {row['Model']} ({row.get('Donanım', row.get('Yakıt/Donanım'))}): {row['Fiyat_eski']}\n"
-
-    return True, summary.strip()
\ No newline at end of file
+    return True, render_summary(diff)
@@ -0,0 +1,153 @@
+import re
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
+
+from utils.rate_limiter import get_rate_limiter
+from utils.price_rules import PRICE_SELECTORS, is_price_text, pick_best_price
+from utils.price_normalize import parse_price
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Görünür metin içermeyen etiketler; bunların içindeki 'TL' eşleşmeleri yok sayılır
+INVISIBLE_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'title', 'meta'}
+
+# Gömülü JSON'daki "price": 1234567 / "price": "1.234.567" alanları
+JSON_PRICE_PATTERN = re.compile(r'"(?:price|lowPrice|vehiclePrice)"\s*:\s*"?(\d[\d.,]*)"?')
+
+# Bir araç fiyatı için makul alt sınır (TL); aksesuar/taksit tutarlarını eler
+MIN_PLAUSIBLE_PRICE = 100_000
+
+# Yaygın CSS çerçevelerinin gizleme sınıfları. Harici stil dosyaları okunmadığından
+# görünürlük tahminidir; HTTP sonucu bu yüzden tarayıcıyla doğrulanmadan kullanılmaz.
+HIDDEN_CLASSES = {'hidden', 'hide', 'd-none', 'is-hidden', 'invisible', 'visually-hidden', 'sr-only'}
+# Sayfa içi <style> bloklarındaki ".sinif { display: none }" kuralları
+HIDDEN_RULE_PATTERN = re.compile(r'([^{}]+)\{[^}]*(?:display\s*:\s*none|visibility\s*:\s*hidden)', re.IGNORECASE)
+CLASS_SELECTOR_PATTERN = re.compile(r'^\.([\w-]+)$')
+
+
+def is_plausible_price(text: str) -> bool:
+    """Metin fiyat gibi görünüyor ve bir araç fiyatı için makul mü?"""
+    if not is_price_text(text):
+        return False
+    kurus = parse_price(text)
+    return kurus is not None and kurus >= MIN_PLAUSIBLE_PRICE * 100
+
+
+@lru_cache(maxsize=256)
+def compiled_xpath(selector: str):
+    """Selector'ı bir kez derler; geçersizse None."""
+    try:
+        return etree.XPath(selector)
+    except etree.XPathError:
+        return None
+
+
+class HttpPriceFetcher:
+    """
+    Selenium'dan önce denenen hızlı katman.
+
+    Sayfayı havuzlanmış bir `requests.Session` ile indirir, lxml ile ayrıştırır ve
+    tarayıcı yolundaki fiyat kurallarını uygular. Fiyat sunucu tarafında
+    render edilmemişse gömülü JSON (JSON-LD, __NEXT_DATA__ vb.) taranır.
+    """
+
+    def __init__(self, pool_size: int = 4, timeout: float = 15):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Language': 'tr-TR,tr;q=0.9',
+        })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def fetch_price(self, url: str, selectors=None):
+        """
+        Fiyatı HTTP + lxml ile bulmaya çalışır.
+        (fiyat_metni, eşleşen_selector) döndürür; bulunamazsa (None, None).
+        """
+        limiter = get_rate_limiter()
+        limiter.acquire(url)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except Exception:
+            limiter.record(url, error=True)
+            raise
+        limiter.record_response(url, response)
+        response.raise_for_status()
+        return self.extract_price(response.content, selectors)
+
+    def extract_price(self, content: bytes, selectors=None):
+        tree = lxml_html.fromstring(content)
+        hidden_classes = HIDDEN_CLASSES | self._hidden_classes_from_styles(tree)
+
+        for selector in selectors or PRICE_SELECTORS:
+            xpath = compiled_xpath(selector)
+            if xpath is None:
+                continue
+            try:
+                elements = xpath(tree)
+            except Exception:
+                continue
+            found_prices = []
+            for elem in elements:
+                if not hasattr(elem, 'tag') or self._is_invisible(elem, hidden_classes):
+                    continue
+                text = ' '.join(elem.text_content().split())
+                if is_plausible_price(text):
+                    found_prices.append(text)
+            if found_prices:
+                return pick_best_price(found_prices), selector
+
+        price = self._price_from_embedded_json(tree)
+        if price:
+            return price, None
+        return None, None
+
+    @staticmethod
+    def _hidden_classes_from_styles(tree) -> set:
+        """Sayfa içi stillerde gizlenen basit sınıf seçicileri (.sinif)"""
+        classes = set()
+        for style in tree.iter('style'):
+            for match in HIDDEN_RULE_PATTERN.finditer(style.text or ''):
+                for selector in match.group(1).split(','):
+                    simple = CLASS_SELECTOR_PATTERN.match(selector.strip())
+                    if simple:
+                        classes.add(simple.group(1))
+        return classes
+
+    @staticmethod
+    def _is_invisible(elem, hidden_classes=HIDDEN_CLASSES) -> bool:
+        """Element ya da atalarından biri görünmez mi (etiket, stil, hidden, aria-hidden, sınıf)?"""
+        for node in [elem, *elem.iterancestors()]:
+            if node.tag in INVISIBLE_TAGS:
+                return True
+            style = (node.get('style') or '').replace(' ', '').lower()
+            if 'display:none' in style or 'visibility:hidden' in style:
+                return True
+            if node.get('hidden') is not None or node.get('aria-hidden') == 'true':
+                return True
+            if hidden_classes.intersection((node.get('class') or '').split()):
+                return True
+        return False
+
+    @staticmethod
+    def _price_from_embedded_json(tree):
+        for script in tree.xpath('//script[@type="application/ld+json" or @type="application/json"]'):
+            for match in JSON_PRICE_PATTERN.finditer(script.text or ''):
+                digits = re.sub(r'[.,]\d{2}$', '', match.group(1))
+                digits = re.sub(r'\D', '', digits)
+                if not digits:
+                    continue
+                text = "{:,}".format(int(digits)).replace(',', '.') + ' TL'
+                if is_plausible_price(text):
+                    return text
+        return None
+
+    def close(self):
+        self.session.close()
+
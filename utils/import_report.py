@@ -0,0 +1,49 @@
+import re
+import subprocess
+import sys
+
+# "import time: self [us] | cumulative | imported package" satırları
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    `python -X importtime` çıktısını (modül, kendi süresi, toplam süre, derinlik)
+    kayıtlarına çevirir; süreler mikrosaniyedir.
+    """
+    records = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def measure_imports(args: list) -> list:
+    """Verilen komutu `-X importtime` ile ayrı bir Python sürecinde çalıştırıp ölçer."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + list(args),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def package_totals(records: list) -> list:
+    """Kendi sürelerini kök paket bazında toplar (ör. pandas.core.* -> pandas)."""
+    totals = {}
+    for module, self_us, _, _ in records:
+        root = module.split('.')[0]
+        count, total = totals.get(root, (0, 0))
+        totals[root] = (count + 1, total + self_us)
+    return sorted(((root, count, total) for root, (count, total) in totals.items()),
+                  key=lambda item: item[2], reverse=True)
+
+
+def print_import_report(records: list, top: int = 15):
+    """Toplam başlangıç süresini ve en pahalı paketleri yazdırır."""
+    total_ms = sum(r[2] for r in records if r[3] == 0) / 1000
+    print(f"⏱️  Import süresi: {total_ms:.0f} ms ({len(records)} modül)")
+    print(f"   {'süre (ms)':>10} {'modül':>6}  paket")
+    for root, count, self_us in package_totals(records)[:top]:
+        print(f"   {self_us / 1000:>10.1f} {count:>6}  {root}")
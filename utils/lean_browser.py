@@ -0,0 +1,91 @@
+import threading
+
+# Fiyatı okumak için gerekmeyen ağır kaynaklar
+HEAVY_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+]
+
+# Bilinen üçüncü parti analitik / reklam / takip alan adları
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googleadservices.com*', '*googlesyndication.com*', '*facebook.net*',
+    '*facebook.com/tr*', '*connect.facebook.net*', '*hotjar.com*', '*clarity.ms*',
+    '*criteo.com*', '*criteo.net*', '*analytics.tiktok.com*', '*mc.yandex.ru*',
+    '*adform.net*', '*bing.com/bat*', '*linkedin.com/px*', '*useinsider.com*',
+    '*youtube.com/embed*', '*ytimg.com*',
+]
+
+# Hafif modda engellenen tüm desenler. Fiyatı render etmek için bunlardan birine
+# ihtiyaç duyan site, model_catalog.json'daki sites[host].lean_allow listesiyle
+# o deseni kendisi için engellemeden çıkarır.
+BLOCKED_PATTERNS = HEAVY_RESOURCE_PATTERNS + TRACKER_PATTERNS
+
+# Sayfanın indirdiği toplam bayt (Resource Timing API). Timing-Allow-Origin
+# göndermeyen üçüncü parti kaynaklar 0 bayt raporlar; bu yüzden değer bir alt sınırdır.
+TRANSFER_SIZE_SCRIPT = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var total = 0;
+for (var i = 0; i < entries.length; i++) { total += entries[i].transferSize || 0; }
+return {bytes: total, requests: entries.length};
+"""
+
+
+def configure_lean_options(chrome_options):
+    """Chrome seçeneklerini hafif moda çevirir: eager yükleme, resimsiz, bildirimsiz."""
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--autoplay-policy=user-gesture-required')
+    chrome_options.add_argument('--disable-remote-fonts')
+    chrome_options.add_argument('--mute-audio')
+
+
+def blocked_patterns(allowed=()) -> list:
+    """Engellenecek desenler; sitenin izin listesindekiler hariç."""
+    return [pattern for pattern in BLOCKED_PATTERNS if pattern not in allowed]
+
+
+def apply_lean_rules(driver, allowed=()):
+    """
+    Gezinmeden önce CDP üzerinden URL engelleme listesini ayarlar.
+    `allowed`: açılacak sitenin engellenmemesi gereken desenleri.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_patterns(allowed)})
+    except Exception as e:
+        print(f"⚠️  Hafif mod kuralları uygulanamadı: {str(e)[:50]}")
+
+
+class PageLoadStats:
+    """Sayfa başına yükleme süresi ve aktarılan baytları mod bazında toplar."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = {}
+
+    def record(self, driver, mode: str, elapsed: float):
+        try:
+            transfer = driver.execute_script(TRANSFER_SIZE_SCRIPT) or {}
+        except Exception:
+            transfer = {}
+        with self._lock:
+            self.records.setdefault(mode, []).append(
+                (elapsed, transfer.get('bytes', 0), transfer.get('requests', 0))
+            )
+
+    def summary(self) -> dict:
+        with self._lock:
+            records = {mode: list(values) for mode, values in self.records.items()}
+        stats = {}
+        for mode, values in records.items():
+            count = len(values)
+            stats[mode] = {
+                'pages': count,
+                'avg_seconds': sum(v[0] for v in values) / count,
+                'avg_kb': sum(v[1] for v in values) / count / 1024,
+                'total_mb': sum(v[1] for v in values) / 1024 / 1024,
+                'avg_requests': sum(v[2] for v in values) / count,
+            }
+        return stats
@@ -0,0 +1,197 @@
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Prometheus metrik adlarının ön eki
+METRIC_PREFIX = "car_price"
+
+
+def _escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in sorted(labels.items())) + '}'
+
+
+class Metrics:
+    """
+    Çalıştırmanın iç içe zaman aralıklarını (span) ve sayaçlarını toplar.
+
+    Span'ler thread başına bir yığında tutulur; bir span içinde açılan span
+    onun çocuğu olur. Sonuçlar JSON Lines ve Prometheus metin formatında
+    rapor dosyasının yanına yazılabilir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+        self.spans = []
+        self.counters = {}
+        self.started = time.time()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """
+        `with metrics.span('driver.get', host=...) as span:` bloğunun süresini
+        ölçer. Blok içinde `span['labels']` güncellenebilir (ör. sonuç).
+        Hata fırlatılırsa span 'error' olarak işaretlenir.
+        """
+        stack = self._stack()
+        span = {
+            'id': next(self._ids),
+            'parent': stack[-1]['id'] if stack else None,
+            'name': name,
+            'labels': labels,
+            'start': time.time(),
+            'thread': threading.current_thread().name,
+        }
+        stack.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span['error'] = True
+            raise
+        finally:
+            span['duration'] = time.perf_counter() - start
+            # asyncio görevleri aynı thread'de iç içe geçebilir; sıradaki eleman olmayabilir
+            stack.remove(span)
+            with self._lock:
+                self.spans.append(span)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def phase_totals(self) -> dict:
+        """Span adı -> {'count', 'total', 'max'} (saniye)"""
+        totals = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += span['duration']
+            entry['max'] = max(entry['max'], span['duration'])
+        return totals
+
+    def slowest(self, name: str = 'model', key_labels=('brand', 'model'), limit: int = 10) -> list:
+        """
+        `name` span'lerini `key_labels` değerlerine göre toplar (tüm denemeler)
+        ve toplam süreye göre en yavaş `limit` tanesini döndürür.
+        """
+        grouped = {}
+        with self._lock:
+            spans = [span for span in self.spans if span['name'] == name]
+        for span in sorted(spans, key=lambda s: s['start']):
+            key = tuple(span['labels'].get(label) for label in key_labels)
+            entry = grouped.setdefault(key, {'labels': dict(zip(key_labels, key)), 'attempts': 0,
+                                             'total': 0.0, 'max': 0.0, 'outcome': None})
+            entry['attempts'] += 1
+            entry['total'] += span['duration']
+            entry['max'] = max(entry['max'], span['duration'])
+            # Son denemenin sonucu modelin sonucudur
+            entry['outcome'] = span['labels'].get('outcome', 'error' if span.get('error') else None)
+        return sorted(grouped.values(), key=lambda e: e['total'], reverse=True)[:limit]
+
+    def write_jsonl(self, filename: str):
+        """Her span ve sayacı bir JSON satırı olarak yazar."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s['start'])
+            counters = dict(self.counters)
+        with open(filename, 'w', encoding='utf-8') as f:
+            for span in spans:
+                f.write(json.dumps(dict(span, type='span'), ensure_ascii=False) + '\n')
+            for (name, labels), value in sorted(counters.items()):
+                f.write(json.dumps({'type': 'counter', 'name': name, 'labels': dict(labels), 'value': value},
+                                   ensure_ascii=False) + '\n')
+
+    def write_prometheus(self, filename: str):
+        """
+        Span sürelerini ad bazında summary (_sum/_count), sayaçları counter
+        olarak Prometheus metin formatında yazar (node_exporter textfile vb.).
+        """
+        lines = []
+        span_metric = f'{METRIC_PREFIX}_span_seconds'
+        lines.append(f'# HELP {span_metric} Çalıştırma aşamalarının süresi')
+        lines.append(f'# TYPE {span_metric} summary')
+        for name, entry in sorted(self.phase_totals().items()):
+            labels = _format_labels({'span': name})
+            lines.append(f'{span_metric}_sum{labels} {entry["total"]:.6f}')
+            lines.append(f'{span_metric}_count{labels} {entry["count"]}')
+
+        with self._lock:
+            counters = dict(self.counters)
+        for name in sorted({name for name, _ in counters}):
+            metric = f'{METRIC_PREFIX}_{name}_total'
+            lines.append(f'# TYPE {metric} counter')
+            for (counter_name, labels), value in sorted(counters.items()):
+                if counter_name == name:
+                    lines.append(f'{metric}{_format_labels(dict(labels))} {value:g}')
+
+        lines.append(f'# TYPE {METRIC_PREFIX}_run_start_timestamp_seconds gauge')
+        lines.append(f'{METRIC_PREFIX}_run_start_timestamp_seconds {self.started:.0f}')
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def export(self, report_filename: str) -> tuple:
+        """
+        Metrikleri rapor dosyasının yanına yazar:
+        rapor.xlsx -> rapor.metrics.jsonl ve rapor.prom
+        """
+        base = os.path.splitext(report_filename)[0]
+        jsonl_path, prom_path = f'{base}.metrics.jsonl', f'{base}.prom'
+        self.write_jsonl(jsonl_path)
+        self.write_prometheus(prom_path)
+        return jsonl_path, prom_path
+
+    def print_summary(self, limit: int = 5, name: str = 'model', key_labels=('brand', 'model')):
+        """Aşama toplamlarını ve en yavaş `name` span'lerini tablo olarak yazdırır."""
+        totals = self.phase_totals()
+        if not totals:
+            return
+        print("📈 Aşama süreleri:")
+        print(f"   {'Aşama':<18}{'Adet':>6}{'Toplam (s)':>12}{'Ort (s)':>9}{'Max (s)':>9}")
+        for phase, entry in sorted(totals.items(), key=lambda item: item[1]['total'], reverse=True):
+            print(f"   {phase:<18}{entry['count']:>6}{entry['total']:>12.1f}"
+                  f"{entry['total'] / entry['count']:>9.2f}{entry['max']:>9.2f}")
+
+        slowest = self.slowest(name, key_labels, limit)
+        if slowest:
+            print(f"🐢 En yavaş {len(slowest)} '{name}':")
+            print(f"   {'':<26}{'Deneme':>7}{'Toplam (s)':>12}{'Max (s)':>9}  Sonuç")
+            for entry in slowest:
+                label = ' / '.join(str(value) for value in entry['labels'].values())
+                print(f"   {label:<26}{entry['attempts']:>7}"
+                      f"{entry['total']:>12.1f}{entry['max']:>9.2f}  {entry['outcome'] or '-'}")
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    """Süreç içindeki tüm bileşenlerin paylaştığı metrik toplayıcı."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,127 @@
+import json
+import os
+import re
+from urllib.parse import urlparse
+
+DEFAULT_CATALOG_FILE = os.getenv(
+    "MODEL_CATALOG_FILE", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "model_catalog.json")
+)
+# Geçmiş maliyeti bilinmeyen model için varsayılan sayfa maliyeti (sn)
+DEFAULT_PAGE_COST = 10.0
+# Parça (--shard i/N) sonuçlarının yazıldığı dizin
+DEFAULT_SHARD_DIR = os.getenv("SHARD_OUTPUT_DIR", "shards")
+
+_SHARD_PATTERN = re.compile(r'^\s*(\d+)\s*/\s*(\d+)\s*$')
+
+
+class ModelCatalog:
+    """
+    Taranacak markalar/modeller ve site bazında ipuçları (fiyat selector'ları,
+    bekleme üst sınırı, hafif modda engellenmeyecek desenler). Sıra
+    dosyadaki sıradır; rapor ve birleştirme bu sırayı kullanır.
+    """
+
+    def __init__(self, brands: dict, sites: dict = None):
+        self.brands = brands
+        self.sites = sites or {}
+        self._site_selectors = {host: list(site.get('selectors', [])) for host, site in self.sites.items()}
+
+    @classmethod
+    def load(cls, filename: str = DEFAULT_CATALOG_FILE) -> 'ModelCatalog':
+        with open(filename, encoding='utf-8') as f:
+            data = json.load(f)
+        brands = {}
+        for brand, models in data.get('brands', {}).items():
+            for model in models:
+                if not model.get('name') or not model.get('url'):
+                    raise ValueError(f"Katalogda eksik model bilgisi ({brand}): {model}")
+            brands[brand] = models
+        if not brands:
+            raise ValueError(f"Katalogda hiç marka yok: {filename}")
+        return cls(brands, data.get('sites', {}))
+
+    def models(self, brand: str) -> list:
+        return self.brands.get(brand, [])
+
+    def jobs(self, brands=None) -> list:
+        """(model_info, marka) çiftleri, katalog sırasıyla"""
+        return [(model, brand) for brand in (brands or self.brands) for model in self.models(brand)]
+
+    def site_timeouts(self) -> dict:
+        return {host: site['timeout'] for host, site in self.sites.items() if 'timeout' in site}
+
+    def selector_hints(self, url: str) -> list:
+        return self._site_selectors.get(urlparse(url).netloc, [])
+
+    def lean_allowlist(self, url: str) -> list:
+        """Sitenin hafif modda engellenmemesi gereken desenleri (sites[host].lean_allow)."""
+        return self.sites.get(urlparse(url).netloc, {}).get('lean_allow', [])
+
+    def order_selectors(self, url: str, selectors: list) -> list:
+        """Sitenin ipucu selector'larını listenin başına alır."""
+        hints = self.selector_hints(url)
+        if not hints:
+            return list(selectors)
+        return hints + [s for s in selectors if s not in hints]
+
+
+def parse_shard(value: str) -> tuple:
+    """'2/4' -> (2, 4); parça numarası 1'den başlar."""
+    match = _SHARD_PATTERN.match(value or '')
+    if not match:
+        raise ValueError(f"Parça 'i/N' biçiminde olmalı: {value!r}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Geçersiz parça: {value!r} (1 <= i <= N olmalı)")
+    return index, count
+
+
+def shard_jobs(jobs: list, index: int, count: int, cost_of) -> list:
+    """
+    İşleri `count` parçaya geçmiş sayfa maliyetine göre dengeli böler ve
+    `index`. parçayı (1'den başlar) katalog sırasıyla döndürür.
+
+    LPT (longest processing time first): işler maliyete göre azalan sırada,
+    o ana kadarki toplam maliyeti en düşük parçaya atanır. Eşitlikler URL ve
+    parça numarasıyla çözülür; aynı katalog ve maliyetlerle her makine aynı
+    bölmeyi hesaplar.
+    """
+    loads = [0.0] * count
+    assigned = {}
+    ranked = sorted(enumerate(jobs), key=lambda item: (-cost_of(item[1]), item[1][1], item[1][0]['url']))
+    for position, job in ranked:
+        shard = min(range(count), key=lambda i: (loads[i], i))
+        loads[shard] += cost_of(job)
+        assigned[position] = shard
+    return [job for position, job in enumerate(jobs) if assigned[position] == index - 1]
+
+
+_SHARD_FILE_PATTERN = re.compile(r'^shard-(\d+)-of-(\d+)\.jsonl$')
+
+
+def shard_filename(index: int, count: int, directory: str = DEFAULT_SHARD_DIR) -> str:
+    return os.path.join(directory, f'shard-{index}-of-{count}.jsonl')
+
+
+def shard_cache_filename(journal_filename: str) -> str:
+    """Parçanın bu çalıştırmada güncellediği önbellek kayıtlarının dosyası (günlüğün yanında)."""
+    return os.path.splitext(journal_filename)[0] + '.cache.json'
+
+
+def find_shard_files(directory: str = DEFAULT_SHARD_DIR) -> tuple:
+    """
+    Dizindeki (alt dizinler dahil) parça dosyalarını bulur.
+    ({parça no: yol}, N) döndürür; farklı N'ler karışmışsa ValueError.
+    """
+    found = {}
+    counts = set()
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            match = _SHARD_FILE_PATTERN.match(name)
+            if match:
+                index, count = int(match.group(1)), int(match.group(2))
+                found[index] = os.path.join(root, name)
+                counts.add(count)
+    if len(counts) > 1:
+        raise ValueError(f"Farklı parça sayılarına ait sonuçlar karışmış: {sorted(counts)}")
+    return found, (counts.pop() if counts else 0)
@@ -0,0 +1,285 @@
+import json
+import os
+import threading
+import time
+import uuid
+from email import message_from_bytes
+from email import policy
+
+DEFAULT_OUTBOX_DIR = os.getenv("OUTBOX_DIR", ".outbox")
+# Bu süreden uzun boşta kalan bağlantı tekrar kullanılmadan önce NOOP ile yoklanır
+NOOP_AFTER = 5.0
+# Kimlik doğrulama hatasında gösterilen ipucu
+AUTH_HINT = "SMTP giriş hatası! Kullanıcı adını ve App Password'ü kontrol edin."
+
+
+class Outbox:
+    """
+    Gönderilecek e-postaları diskte tutan kuyruk.
+
+    Her mesaj `pending/` altında bir .eml dosyası ve yanında deneme sayısını
+    ve bir sonraki deneme zamanını tutan bir .json dosyasıdır. Yazma işlemleri
+    atomiktir; süreç yarıda kesilse de mesaj kaybolmaz ve bir sonraki
+    çalıştırmada gönderilir. Deneme hakkı biten mesajlar `failed/` altına taşınır.
+    """
+
+    def __init__(self, directory: str = DEFAULT_OUTBOX_DIR, max_attempts: int = 5,
+                 base_delay: float = 30, max_delay: float = 3600):
+        self.directory = directory
+        self.pending_dir = os.path.join(directory, 'pending')
+        self.failed_dir = os.path.join(directory, 'failed')
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        os.makedirs(self.pending_dir, exist_ok=True)
+        os.makedirs(self.failed_dir, exist_ok=True)
+
+    def _paths(self, message_id: str, directory: str = None):
+        base = os.path.join(directory or self.pending_dir, message_id)
+        return base + '.eml', base + '.json'
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def put(self, message) -> str:
+        """Mesajı kuyruğa ekler ve kimliğini döndürür."""
+        # Zaman önekli ad sayesinde kuyruk eklenme sırasıyla işlenir
+        message_id = f"{time.time_ns():020d}_{uuid.uuid4().hex[:8]}"
+        eml_path, meta_path = self._paths(message_id)
+        self._write_atomic(eml_path, message.as_bytes())
+        # Meta dosyası en son yazılır; .json'u olmayan mesaj henüz hazır değildir
+        self._write_atomic(meta_path, json.dumps({'attempts': 0, 'next_attempt': 0, 'last_error': None}).encode())
+        return message_id
+
+    def _read_meta(self, message_id: str):
+        try:
+            with open(self._paths(message_id)[1], encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def due(self, now: float = None) -> list:
+        """Gönderim zamanı gelmiş mesaj kimlikleri (eskiden yeniye)."""
+        now = time.time() if now is None else now
+        due = []
+        for name in sorted(os.listdir(self.pending_dir)):
+            if not name.endswith('.json'):
+                continue
+            message_id = name[:-len('.json')]
+            meta = self._read_meta(message_id)
+            if meta is not None and meta['next_attempt'] <= now:
+                due.append(message_id)
+        return due
+
+    def pending_count(self) -> int:
+        return sum(1 for name in os.listdir(self.pending_dir) if name.endswith('.json'))
+
+    def load(self, message_id: str):
+        with open(self._paths(message_id)[0], 'rb') as f:
+            return message_from_bytes(f.read(), policy=policy.SMTP)
+
+    def mark_sent(self, message_id: str):
+        with self._lock:
+            for path in self._paths(message_id):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def mark_failed(self, message_id: str, error: str, permanent: bool = False) -> bool:
+        """
+        Başarısız denemeyi kaydeder ve üstel bekleme ile yeniden planlar.
+        Deneme hakkı bittiyse (ya da hata kalıcıysa) mesajı `failed/` altına
+        taşır ve False döndürür.
+        """
+        with self._lock:
+            meta = self._read_meta(message_id) or {'attempts': 0}
+            meta['attempts'] += 1
+            meta['last_error'] = error
+            if permanent or meta['attempts'] >= self.max_attempts:
+                self._write_atomic(self._paths(message_id)[1], json.dumps(meta).encode())
+                for source, target in zip(self._paths(message_id), self._paths(message_id, self.failed_dir)):
+                    os.replace(source, target)
+                return False
+            delay = min(self.base_delay * 2 ** (meta['attempts'] - 1), self.max_delay)
+            meta['next_attempt'] = time.time() + delay
+            self._write_atomic(self._paths(message_id)[1], json.dumps(meta).encode())
+            return True
+
+
+class OutboxSender:
+    """
+    Outbox'taki mesajları arka planda tek bir kimliği doğrulanmış SMTP
+    bağlantısı üzerinden gönderir.
+
+    Bağlantı kuyruk boşalana kadar (ve `idle_timeout` boyunca) açık tutulur;
+    tekrar kullanmadan önce NOOP ile kontrol edilir. Bağlantı kurulamazsa
+    zamanı gelen mesajların deneme sayısı artar ve üstel bekleme ile yeniden
+    planlanır; mesajlar diskte kalır. Kimlik doğrulama hatası kalıcıdır:
+    gönderici durur, mesajlar bir sonraki çalıştırmaya kalır.
+    starttls=False ve kimlik bilgisi verilmeden yerel bir SMTP sunucusuna
+    (ör. `python -m aiosmtpd -n`) gönderim yapılabilir.
+    """
+
+    def __init__(self, outbox: Outbox, host: str, port: int, user: str = None, password: str = None,
+                 starttls: bool = True, timeout: float = 30, idle_timeout: float = 30,
+                 poll_interval: float = 1.0):
+        self.outbox = outbox
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.poll_interval = poll_interval
+        self.stats = {'sent': 0, 'retried': 0, 'failed': 0, 'connections': 0}
+        self._server = None
+        self._last_used = 0.0
+        self.auth_error = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def _connect(self):
+        import smtplib
+
+        if self._server is not None:
+            # Az önce kullanılan bağlantı doğrudan, bekleyen bağlantı NOOP ile kontrol edilip kullanılır
+            if time.time() - self._last_used < NOOP_AFTER:
+                return self._server
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._disconnect()
+
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.ehlo()
+            if self.starttls:
+                server.starttls()
+                server.ehlo()
+            if self.user and self.password and server.has_extn('auth'):
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        self._last_used = time.time()
+        self.stats['connections'] += 1
+        return server
+
+    def _disconnect(self):
+        import smtplib
+
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def flush(self) -> int:
+        """Zamanı gelen tüm mesajları gönderir; gönderilen mesaj sayısını döndürür."""
+        import smtplib
+
+        if self.auth_error is not None:
+            return 0
+        due = self.outbox.due()
+        if not due:
+            return 0
+
+        sent = 0
+        for index, message_id in enumerate(due):
+            try:
+                server = self._connect()
+            except smtplib.SMTPAuthenticationError as e:
+                # Tekrar denemek sonucu değiştirmez; mesajlar diskte bekler
+                self.auth_error = e
+                print(f"❌ {AUTH_HINT} ({e.smtp_code} {e.smtp_error!r})")
+                break
+            except (smtplib.SMTPException, OSError) as e:
+                # Sunucuya ulaşılamıyor: kalan mesajlar deneme sayısı artırılarak ertelenir
+                print(f"⚠️  SMTP bağlantısı kurulamadı: {e}")
+                for pending_id in due[index:]:
+                    self._requeue(pending_id, f"Bağlantı kurulamadı: {e}")
+                break
+
+            try:
+                server.send_message(self.outbox.load(message_id))
+            except smtplib.SMTPServerDisconnected as e:
+                self._disconnect()
+                self._requeue(message_id, str(e))
+                continue
+            except smtplib.SMTPRecipientsRefused as e:
+                # Alıcıların hepsi reddedildi; 4xx ret geçicidir
+                codes = [code for code, _ in e.recipients.values()]
+                self._requeue(message_id, str(e), permanent=all(code >= 500 for code in codes))
+                continue
+            except smtplib.SMTPResponseException as e:
+                # 5xx kalıcı, 4xx geçici hatadır
+                self._requeue(message_id, f"{e.smtp_code} {e.smtp_error!r}", permanent=e.smtp_code >= 500)
+                continue
+            except (smtplib.SMTPException, OSError) as e:
+                self._disconnect()
+                self._requeue(message_id, str(e))
+                continue
+
+            self.outbox.mark_sent(message_id)
+            self.stats['sent'] += 1
+            sent += 1
+            self._last_used = time.time()
+        return sent
+
+    def _requeue(self, message_id: str, error: str, permanent: bool = False):
+        if self.outbox.mark_failed(message_id, error, permanent=permanent):
+            self.stats['retried'] += 1
+            print(f"⚠️  E-posta gönderilemedi, tekrar denenecek: {error}")
+        else:
+            self.stats['failed'] += 1
+            print(f"❌ E-posta kalıcı olarak gönderilemedi ({self.outbox.failed_dir}): {error}")
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.flush()
+            if self._server is not None and time.time() - self._last_used > self.idle_timeout:
+                self._disconnect()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def start(self):
+        """Arka plan göndericisini başlatır (zaten çalışıyorsa bir şey yapmaz)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name='outbox-sender', daemon=True)
+            self._thread.start()
+
+    def notify(self):
+        """Kuyruğa yeni mesaj eklendiğini bildirir; gönderici beklemeden uyanır."""
+        self._wake.set()
+
+    def stop(self, timeout: float = 60) -> int:
+        """
+        Göndericiyi durdurur; `timeout` süresince zamanı gelmiş mesajları
+        göndermeyi dener. Kuyrukta kalan mesaj sayısını döndürür.
+        """
+        deadline = time.time() + timeout
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(max(0, deadline - time.time()))
+            if self._thread.is_alive():
+                # Gönderim hâlâ sürüyor; bağlantıyı iki iş parçacığından kullanma
+                return self.outbox.pending_count()
+            self._thread = None
+        while self.outbox.due() and time.time() < deadline:
+            if self.flush() == 0:
+                break
+        self._disconnect()
+        return self.outbox.pending_count()
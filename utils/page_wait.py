@@ -0,0 +1,92 @@
+import time
+import threading
+from urllib.parse import urlparse
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+# Sayfada fiyat benzeri bir metin ya da fiyat elementi göründüğünde true döner
+PRICE_READY_SCRIPT = """
+if (document.readyState === 'loading' || !document.body) { return false; }
+if (document.querySelector('[data-price], [data-vehicle-price]')) { return true; }
+var text = document.body.innerText || '';
+return /\\d{1,3}(\\.\\d{3})+(,\\d+)?\\s*(TL|₺)|₺\\s*\\d{1,3}(\\.\\d{3})+/.test(text);
+"""
+
+DEFAULT_SITE_TIMEOUTS = {
+    'www.hyundai.com': 15,
+    'www.kia.com': 15,
+}
+
+
+class PageWaiter:
+    """
+    Sabit `time.sleep` yerine olay tabanlı bekleme.
+
+    Sayfada fiyat benzeri bir element/metin belirdiği anda döner; her site için
+    tek bir üst süre sınırı vardır. Her beklemenin gerçekte ne kadar sürdüğü
+    kaydedilir, böylece zaman aşımları gerçek verilere göre ayarlanabilir.
+    """
+
+    def __init__(self, site_timeouts=None, default_timeout: float = 15, poll_frequency: float = 0.2):
+        self.site_timeouts = dict(DEFAULT_SITE_TIMEOUTS)
+        if site_timeouts:
+            self.site_timeouts.update(site_timeouts)
+        self.default_timeout = default_timeout
+        self.poll_frequency = poll_frequency
+        self._lock = threading.Lock()
+        self.records = {}
+
+    def timeout_for(self, url: str) -> float:
+        return self.site_timeouts.get(urlparse(url).netloc, self.default_timeout)
+
+    def _record(self, host: str, elapsed: float, ready: bool):
+        with self._lock:
+            self.records.setdefault(host, []).append((elapsed, ready))
+
+    def wait_for_price(self, driver, url: str) -> bool:
+        """Fiyat sinyali görünene ya da site üst sınırı dolana kadar bekler."""
+        host = urlparse(url).netloc
+        start = time.perf_counter()
+        try:
+            WebDriverWait(driver, self.timeout_for(url), poll_frequency=self.poll_frequency).until(
+                lambda d: d.execute_script(PRICE_READY_SCRIPT)
+            )
+            ready = True
+        except TimeoutException:
+            ready = False
+        self._record(host, time.perf_counter() - start, ready)
+        return ready
+
+    def wait_until_gone(self, driver, element, timeout: float = 1.0):
+        """Tıklanan popup'ın kaybolmasını bekler (en fazla `timeout` saniye)."""
+        def gone(_):
+            try:
+                return not element.is_displayed()
+            except Exception:
+                # Element DOM'dan kaldırıldı
+                return True
+
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(gone)
+        except TimeoutException:
+            pass
+
+    def summary(self) -> dict:
+        """Site bazında bekleme istatistikleri: adet, ortalama, p95, max, zaman aşımı."""
+        with self._lock:
+            records = {host: list(values) for host, values in self.records.items()}
+
+        stats = {}
+        for host, values in records.items():
+            durations = sorted(elapsed for elapsed, _ in values)
+            p95_index = min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))
+            stats[host] = {
+                'count': len(durations),
+                'avg': sum(durations) / len(durations),
+                'p95': durations[p95_index],
+                'max': durations[-1],
+                'timeouts': sum(1 for _, ready in values if not ready),
+                'limit': self.site_timeouts.get(host, self.default_timeout),
+            }
+        return stats
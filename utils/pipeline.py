@@ -0,0 +1,73 @@
+import queue
+import threading
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error):
+        self.error = error
+
+
+def bounded(items, maxsize: int = 1, name: str = 'pipeline'):
+    """
+    `items` iterable'ını arka plandaki bir thread'de tüketip elemanları
+    sınırlı bir kuyruk üzerinden üreten generator.
+
+    Üretici tüketiciden en fazla `maxsize` eleman önde olabilir; kuyruk
+    dolunca üretici bekler (backpressure). Üreticideki hata tüketicide
+    yeniden fırlatılır. Tüketici erken bırakırsa üretici de durur.
+    """
+    buffer = queue.Queue(maxsize)
+    stopped = threading.Event()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def in_order(indexed):
+    """
+    (sıra, eleman) çiftlerini tamamlanma sırasıyla alıp elemanları 0'dan
+    başlayan sıraya göre üretir. Önündeki eleman henüz gelmemiş olanlar
+    tamponda bekler; sıra kesintisiz ilerledikçe tampon boşaltılır.
+    """
+    waiting = {}
+    next_index = 0
+    for index, item in indexed:
+        waiting[index] = item
+        while next_index in waiting:
+            yield waiting.pop(next_index)
+            next_index += 1
+    # Sıralarda boşluk varsa kalanlar yine sırayla verilir
+    for index in sorted(waiting):
+        yield waiting[index]
@@ -0,0 +1,104 @@
+import math
+import re
+
+PRICE_KURUS_COLUMN = 'Fiyat (kuruş)'
+PRICE_INVALID_COLUMN = 'Fiyat Okunamadı'
+
+# 1.234.567 / 1.234.567,89 (TR), 1,234,567.89 (EN) ya da düz 1234567 / 1234567.0
+_NUMBER = r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|\d{1,3}(?:,\d{3})+(?:\.\d{1,2})?|\d+(?:[.,]\d{1,2})?'
+# Para birimine bitişik sayı: "... 1.234.567 TL'den başlayan" ya da "₺1.234.567"
+_CURRENCY_PATTERN = rf'(?P<after>{_NUMBER})\s*(?:TL|TRY|₺)|₺\s*(?P<before>{_NUMBER})'
+# Para birimi yoksa metnin tamamı sayı olmalı
+_BARE_PATTERN = rf'^(?P<bare>{_NUMBER})$'
+_TR_FORMAT = r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?'
+_EN_FORMAT = r'\d{1,3}(?:,\d{3})+(?:\.\d{1,2})?'
+_PARTS_PATTERN = r'^(?P<lira>\d+)(?:\.(?P<kurus>\d{1,2}))?$'
+
+# parse_price'ın tek değer yolu aynı desenlerin derlenmiş halini kullanır
+_CURRENCY_RE = re.compile(_CURRENCY_PATTERN)
+_BARE_RE = re.compile(_BARE_PATTERN)
+_TR_FORMAT_RE = re.compile(_TR_FORMAT)
+_EN_FORMAT_RE = re.compile(_EN_FORMAT)
+_PARTS_RE = re.compile(_PARTS_PATTERN)
+
+
+def _parse_unique(values):
+    """Farklı fiyat metinlerini (pandas Series) kuruş cinsinden Int64'e çevirir (okunamayanlar <NA>)."""
+    import pandas as pd
+
+    text = values.astype(str).str.strip()
+
+    currency = text.str.extract(_CURRENCY_PATTERN)
+    token = currency['after'].fillna(currency['before'])
+    token = token.fillna(text.str.extract(_BARE_PATTERN)['bare'])
+
+    # Binlik/ondalık ayırıcıları '.' ondalık olacak şekilde tekleştir
+    tr_format = token.str.fullmatch(_TR_FORMAT).fillna(False).astype(bool)
+    en_format = token.str.fullmatch(_EN_FORMAT).fillna(False).astype(bool)
+    normalized = token.str.replace(',', '.', regex=False)
+    normalized = normalized.mask(en_format, token.str.replace(',', '', regex=False))
+    normalized = normalized.mask(tr_format, token.str.replace('.', '', regex=False).str.replace(',', '.', regex=False))
+
+    parts = normalized.str.extract(_PARTS_PATTERN)
+    lira = pd.to_numeric(parts['lira'], errors='coerce').astype('Int64')
+    kurus = pd.to_numeric(parts['kurus'].fillna('0').str.ljust(2, '0'), errors='coerce').astype('Int64')
+    return lira * 100 + kurus
+
+
+def parse_prices(values):
+    """
+    Ham fiyat metinlerini kuruş cinsinden Int64 pandas serisine çevirir.
+    Çözümleme yalnızca farklı değerler üzerinde yapılır; okunamayan değerler <NA>.
+    """
+    # pandas/numpy yalnızca toplu çözümlemede yüklenir; parse_price onlarsız çalışır
+    import numpy as np
+    import pandas as pd
+
+    values = pd.Series(values)
+    if values.empty:
+        return pd.Series(dtype='Int64', index=values.index)
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    parsed = _parse_unique(pd.Series(uniques, dtype=object)).to_numpy(dtype=object, na_value=pd.NA)
+    result = np.full(len(values), pd.NA, dtype=object)
+    known = codes >= 0
+    result[known] = parsed[codes[known]]
+    return pd.Series(result, index=values.index, dtype='Int64')
+
+
+def parse_price(text):
+    """
+    Tek bir fiyat metnini kuruşa çevirir; okunamazsa None. parse_prices ile
+    aynı kurallar, pandas'a girmeden derlenmiş regex'lerle uygulanır.
+    """
+    if text is None or (isinstance(text, float) and math.isnan(text)):
+        return None
+    text = str(text).strip()
+
+    match = _CURRENCY_RE.search(text)
+    token = (match.group('after') or match.group('before')) if match else None
+    if token is None:
+        match = _BARE_RE.search(text)
+        token = match.group('bare') if match else None
+    if token is None:
+        return None
+
+    if _TR_FORMAT_RE.fullmatch(token):
+        normalized = token.replace('.', '').replace(',', '.')
+    elif _EN_FORMAT_RE.fullmatch(token):
+        normalized = token.replace(',', '')
+    else:
+        normalized = token.replace(',', '.')
+
+    parts = _PARTS_RE.match(normalized)
+    if not parts:
+        return None
+    return int(parts.group('lira')) * 100 + int((parts.group('kurus') or '0').ljust(2, '0'))
+
+
+def format_price(kurus) -> str:
+    """Kuruş değerini '1.234.567 TL' (kuruş varsa '1.234.567,50 TL') biçiminde yazar."""
+    lira, remainder = divmod(int(kurus), 100)
+    text = "{:,}".format(lira).replace(',', '.')
+    if remainder:
+        text += f",{remainder:02d}"
+    return text + ' TL'
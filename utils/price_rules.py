@@ -0,0 +1,46 @@
+"""Tarayıcı ve HTTP yolunun ortak kullandığı fiyat bulma kuralları."""
+
+PRICE_SELECTORS = [
+    # Fiyat div/span'leri
+    "//div[contains(@class, 'price') and contains(text(), 'TL')]",
+    "//span[contains(@class, 'price') and contains(text(), 'TL')]",
+    "//p[contains(@class, 'price') and contains(text(), 'TL')]",
+
+    # TL içeren elementler
+    "//*[contains(text(), 'TL') and not(contains(text(), 'İletişim'))]",
+    "//*[contains(text(), '₺')]",
+
+    # Binlik ayraç olanlar
+    "//*[contains(text(), '.000')]",
+    "//*[contains(text(), '.500')]",
+    "//*[contains(text(), '.999')]",
+
+    # Model price class'ları
+    "//div[contains(@class, 'model-price')]",
+    "//div[contains(@class, 'vehicle-price')]",
+    "//div[contains(@class, 'car-price')]",
+
+    # Data attribute'lar
+    "//*[@data-price]",
+    "//*[@data-vehicle-price]",
+]
+
+# İstenmeyen (taksit, kredi vb.) metinler
+EXCLUDED_PRICE_WORDS = ['ödeme', 'taksit', 'ay', 'kredi', 'iletişim']
+
+
+def is_price_text(text: str) -> bool:
+    """Metin fiyat gibi görünüyor mu? (rakam + TL/₺/.000, taksit/kredi vb. hariç)"""
+    if not text or not any(c.isdigit() for c in text):
+        return False
+    if 'TL' not in text and '₺' not in text and '.000' not in text:
+        return False
+    lower = text.lower()
+    return not any(word in lower for word in EXCLUDED_PRICE_WORDS)
+
+
+def pick_best_price(candidates: list):
+    """En uzun ve en bilgilendirici adayı seçer (100 karakterden uzunlar elenir)."""
+    if not candidates:
+        return None
+    return max(candidates, key=lambda x: len(x) if len(x) < 100 else 0)
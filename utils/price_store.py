@@ -0,0 +1,208 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+from utils.excel_handler import read_from_excel
+from utils.diff_engine import diff_frames
+from utils.price_normalize import parse_prices
+
+# Excel çıktısındaki sayfa sütunları
+HISTORY_COLUMNS = ['Tarih', 'Marka', 'Model', 'Donanım', 'Fiyat', 'Fiyat (kuruş)']
+CHANGE_COLUMNS = ['Marka', 'Model', 'Donanım', 'Fiyat_eski', 'Fiyat_yeni', 'Fark (kuruş)', 'Değişim (%)']
+REPORT_WIDTHS = {'Tarih': 20, 'Marka': 12, 'Model': 18, 'Donanım': 40, 'Fiyat': 18,
+                 'Fiyat_eski': 18, 'Fiyat_yeni': 18, 'Fiyat (kuruş)': 16, 'Fark (kuruş)': 16}
+
+DEFAULT_DB_FILENAME = os.getenv("PRICE_DB_FILENAME", "fiyat_gecmisi.db")
+
+# Scraper'ların ürettiği sütun sırası
+SNAPSHOT_COLUMNS = ['Model', 'Donanım', 'Fiyat', 'Marka']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    source TEXT NOT NULL,
+    row_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prices (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    marka TEXT NOT NULL,
+    model TEXT NOT NULL,
+    donanim TEXT NOT NULL,
+    fiyat TEXT,
+    fiyat_kurus INTEGER,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_prices_key_time ON prices (marka, model, donanim, created_at);
+CREATE INDEX IF NOT EXISTS idx_prices_run ON prices (run_id);
+"""
+
+
+class PriceStore:
+    """
+    Fiyat geçmişini SQLite'ta tutan, yalnızca ekleme yapılan depo.
+
+    Her çalıştırmanın verisi ayrı bir snapshot olarak eklenir; hiçbir satır
+    silinmez ya da güncellenmez. (Marka, Model, Donanım, zaman) üzerindeki
+    indeks sayesinde "son snapshot" ve "tek bir donanımın geçmişi" sorguları
+    tablo taraması yapmaz. Excel dosyası bu depodan üretilen bir çıktıdır.
+    """
+
+    def __init__(self, filename: str = DEFAULT_DB_FILENAME):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Eski veritabanlarına sonradan eklenen sütunları ekler."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(prices)")}
+        if 'fiyat_kurus' not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE prices ADD COLUMN fiyat_kurus INTEGER")
+                # Mevcut satırların sayısal fiyatı bir kez doldurulur
+                existing = pd.read_sql_query("SELECT rowid, fiyat FROM prices", self.conn)
+                kurus = parse_prices(existing['fiyat'])
+                known = kurus.notna()
+                self.conn.executemany(
+                    "UPDATE prices SET fiyat_kurus = ? WHERE rowid = ?",
+                    zip(kurus[known].astype(int).tolist(), existing.loc[known, 'rowid'].tolist()),
+                )
+
+    def close(self):
+        self.conn.close()
+
+    def is_empty(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM runs LIMIT 1").fetchone() is None
+
+    def append_snapshot(self, df: pd.DataFrame, source: str = 'scrape', created_at: str = None) -> int:
+        """DataFrame'i yeni bir snapshot olarak ekler ve run id'sini döndürür."""
+        created_at = created_at or datetime.now().isoformat(timespec='seconds')
+        rows = df.reindex(columns=['Marka', 'Model', 'Donanım', 'Fiyat']).astype(str)
+        kurus = parse_prices(df['Fiyat']) if 'Fiyat' in df else pd.Series(pd.NA, index=df.index, dtype='Int64')
+        rows['kurus'] = kurus.astype(object).where(kurus.notna(), None).to_numpy()
+        rows = rows.itertuples(index=False, name=None)
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (created_at, source, row_count) VALUES (?, ?, ?)",
+                (created_at, source, len(df)),
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO prices (run_id, marka, model, donanim, fiyat, fiyat_kurus, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((run_id, marka, model, donanim, fiyat, kurus, created_at) for marka, model, donanim, fiyat, kurus in rows),
+            )
+        return run_id
+
+    def latest_run_id(self):
+        row = self.conn.execute("SELECT MAX(id) FROM runs WHERE row_count > 0").fetchone()
+        return row[0] if row else None
+
+    def recent_run_ids(self, limit: int = 2) -> list:
+        """Boş olmayan son `limit` snapshot'ın id'leri (yeniden eskiye)."""
+        rows = self.conn.execute(
+            "SELECT id FROM runs WHERE row_count > 0 ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def previous_run_id(self, run_id: int):
+        """Verilen snapshot'tan önceki boş olmayan snapshot'ın id'si."""
+        row = self.conn.execute(
+            "SELECT MAX(id) FROM runs WHERE row_count > 0 AND id < ?", (run_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def snapshot(self, run_id: int) -> pd.DataFrame:
+        rows = self.conn.execute(
+            "SELECT model, donanim, fiyat, marka FROM prices WHERE run_id = ? ORDER BY rowid",
+            (run_id,),
+        ).fetchall()
+        return pd.DataFrame(rows, columns=SNAPSHOT_COLUMNS)
+
+    def latest_snapshot(self) -> pd.DataFrame:
+        """En son snapshot'ı döndürür; depo boşsa boş DataFrame."""
+        run_id = self.latest_run_id()
+        if run_id is None:
+            return pd.DataFrame()
+        return self.snapshot(run_id)
+
+    def history(self, marka: str, model: str, donanim: str) -> pd.DataFrame:
+        """Tek bir donanımın zaman içindeki fiyatları (eskiden yeniye)."""
+        rows = self.conn.execute(
+            "SELECT created_at, fiyat, fiyat_kurus FROM prices WHERE marka = ? AND model = ? AND donanim = ? ORDER BY created_at",
+            (marka, model, donanim),
+        ).fetchall()
+        df = pd.DataFrame(rows, columns=['Tarih', 'Fiyat', 'Fiyat (kuruş)'])
+        df['Fiyat (kuruş)'] = df['Fiyat (kuruş)'].astype('Int64')
+        return df
+
+    def import_excel(self, filename: str):
+        """
+        Eski Excel durum dosyasını bir snapshot olarak içe aktarır.
+        Depo boş değilse ya da dosya yoksa hiçbir şey yapmaz.
+        """
+        if not self.is_empty() or not os.path.exists(filename):
+            return None
+        df = read_from_excel(filename)
+        if df.empty:
+            return None
+        created_at = datetime.fromtimestamp(os.path.getmtime(filename)).isoformat(timespec='seconds')
+        run_id = self.append_snapshot(df, source=f'excel:{os.path.basename(filename)}', created_at=created_at)
+        print(f"'{filename}' dosyasından {len(df)} satır fiyat geçmişine aktarıldı.")
+        return run_id
+
+    def export_excel(self, filename: str, run_id: int = None, include_history: bool = True):
+        """
+        Son (ya da verilen) snapshot'ı Excel dosyası olarak dışa aktarır.
+
+        İlk sayfa snapshot'ın kendisidir (marka, model ve sayısal fiyata göre
+        sıralı; import_excel bu sayfayı okur). Ardından marka sayfaları, bir
+        önceki snapshot'a göre değişiklikler ve isteğe bağlı tüm fiyat geçmişi
+        gelir. Satırlar doğrudan SQLite cursor'ından akıtılır.
+        """
+        # openpyxl yalnızca dışa aktarırken yüklenir (diff ve değişiklik olmayan taramalar yüklemez)
+        from utils.report_writer import StreamingReportWriter
+
+        run_id = run_id if run_id is not None else self.latest_run_id()
+        order = "ORDER BY marka, model, fiyat_kurus IS NULL, fiyat_kurus, rowid"
+
+        with StreamingReportWriter(filename) as writer:
+            writer.add_sheet('Fiyatlar', SNAPSHOT_COLUMNS, REPORT_WIDTHS)
+            if run_id is None:
+                return
+
+            writer.write_rows('Fiyatlar', self.conn.execute(
+                f"SELECT model, donanim, fiyat, marka FROM prices WHERE run_id = ? {order}", (run_id,)))
+
+            brands = [row[0] for row in self.conn.execute(
+                "SELECT DISTINCT marka FROM prices WHERE run_id = ? ORDER BY marka", (run_id,))]
+            for brand in brands:
+                writer.add_sheet(brand, SNAPSHOT_COLUMNS, REPORT_WIDTHS)
+                writer.write_rows(brand, self.conn.execute(
+                    f"SELECT model, donanim, fiyat, marka FROM prices WHERE run_id = ? AND marka = ? {order}",
+                    (run_id, brand)))
+
+            previous_id = self.previous_run_id(run_id)
+            if previous_id is not None:
+                self._write_changes(writer, previous_id, run_id)
+
+            if include_history:
+                writer.add_sheet('Geçmiş', HISTORY_COLUMNS, REPORT_WIDTHS)
+                writer.write_rows('Geçmiş', self.conn.execute(
+                    "SELECT created_at, marka, model, donanim, fiyat, fiyat_kurus FROM prices "
+                    "ORDER BY marka, model, donanim, created_at"))
+
+        print(f"Veriler başarıyla '{filename}' dosyasına kaydedildi.")
+
+    def _write_changes(self, writer, old_run_id: int, new_run_id: int):
+        """İki snapshot arasındaki fiyat değişikliklerini 'Değişiklikler' sayfasına yazar."""
+        writer.add_sheet('Değişiklikler', CHANGE_COLUMNS, REPORT_WIDTHS)
+        writer.highlight_sign('Değişiklikler', 'Fark (kuruş)')
+        diff = diff_frames(self.snapshot(old_run_id), self.snapshot(new_run_id), ['Model', 'Donanım', 'Marka'])
+        if diff is None or diff.changed.empty:
+            return
+        changed = diff.changed.reindex(columns=CHANGE_COLUMNS).astype(object)
+        writer.write_rows('Değişiklikler', changed.where(changed.notna(), None).itertuples(index=False, name=None))
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# İstek/sn cinsinden host başına başlangıç, en düşük ve en yüksek hız
+DEFAULT_HOST_RATE = float(os.getenv("HOST_RATE", 1.0))
+MIN_HOST_RATE = float(os.getenv("HOST_MIN_RATE", 0.1))
+MAX_HOST_RATE = float(os.getenv("HOST_MAX_RATE", 4.0))
+# Bu süreden (sn) uzun süren yanıtlar host'un zorlandığı işareti sayılır
+SLOW_RESPONSE_SECONDS = float(os.getenv("HOST_SLOW_SECONDS", 8.0))
+# 429/503'te Retry-After yoksa host'un duraklatılacağı süre (sn)
+DEFAULT_BACKOFF_SECONDS = 5.0
+
+
+def host_of(url_or_host: str) -> str:
+    return urlparse(url_or_host).netloc or url_or_host
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını (saniye ya da HTTP tarihi) saniyeye çevirir."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """`rate` jeton/sn dolan, en fazla `burst` jeton biriktiren kova."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        # Bu zamana kadar (429 / Retry-After) hiç jeton verilmez
+        self.paused_until = 0.0
+
+    def reserve(self, now: float) -> float:
+        """Bir jeton ayırır ve kullanılabilmesi için beklenecek süreyi döndürür."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+        return max(wait, self.paused_until - now)
+
+
+class HostRateLimiter:
+    """
+    Host başına jeton kovası ile istekleri sınırlayan, HTTP scraper'ları ve
+    Selenium sayfa yüklemeleri tarafından paylaşılan zamanlayıcı.
+
+    Hız AIMD ile uyarlanır: 429/5xx ya da ağ hatasında yarıya, yavaş
+    yanıtta %25 düşer; sağlıklı her yanıtta küçük adımlarla geri yükselir.
+    Retry-After başlığı varsa host o süre boyunca tamamen duraklatılır.
+    """
+
+    def __init__(self, rate: float = DEFAULT_HOST_RATE, burst: float = 2, min_rate: float = MIN_HOST_RATE,
+                 max_rate: float = MAX_HOST_RATE, slow_seconds: float = SLOW_RESPONSE_SECONDS,
+                 increase_step: float = 0.1):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.slow_seconds = slow_seconds
+        self.increase_step = increase_step
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.stats = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            self.stats[host] = {'requests': 0, 'waited': 0.0, 'throttled': 0, 'slow': 0}
+        return bucket
+
+    def acquire(self, url_or_host: str) -> float:
+        """Host için sıra gelene kadar bekler; beklenen süreyi döndürür."""
+        host = host_of(url_or_host)
+        with self._lock:
+            bucket = self._bucket(host)
+            wait = bucket.reserve(time.monotonic())
+            self.stats[host]['requests'] += 1
+            self.stats[host]['waited'] += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(self, url_or_host: str, status: int = None, elapsed: float = None, error: bool = False,
+               retry_after: float = None):
+        """Yanıtın sonucuna göre host'un hızını uyarlar."""
+        host = host_of(url_or_host)
+        with self._lock:
+            bucket = self._bucket(host)
+            stats = self.stats[host]
+            if error or status == 429 or (status is not None and status >= 500):
+                stats['throttled'] += 1
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+                if status in (429, 503):
+                    pause = retry_after if retry_after is not None else DEFAULT_BACKOFF_SECONDS
+                    bucket.paused_until = max(bucket.paused_until, time.monotonic() + pause)
+                    # Kuyrukta biriken jetonlar duraklamadan sonra patlama yapmasın
+                    bucket.tokens = min(bucket.tokens, 0)
+            elif elapsed is not None and elapsed > self.slow_seconds:
+                stats['slow'] += 1
+                bucket.rate = max(self.min_rate, bucket.rate * 0.75)
+            else:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+    def record_response(self, url: str, response, elapsed: float = None):
+        """requests.Response için record kısayolu (Retry-After dahil)."""
+        self.record(url, status=response.status_code,
+                    elapsed=elapsed if elapsed is not None else response.elapsed.total_seconds(),
+                    retry_after=parse_retry_after(response.headers.get('Retry-After')))
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {host: dict(stats, rate=self._buckets[host].rate) for host, stats in self.stats.items()}
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Süreç içindeki tüm istemcilerin paylaştığı rate limiter."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = HostRateLimiter()
+    return _limiter
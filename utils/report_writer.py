@@ -0,0 +1,99 @@
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule, FormulaRule
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+SUCCESS_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", bgColor="C6EFCE", fill_type="solid")
+FAILURE_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", bgColor="FFC7CE", fill_type="solid")
+
+# Koşullu biçimlendirme satır sayısı bilinmeden tüm sütuna uygulanır
+MAX_EXCEL_ROW = 1048576
+
+
+class StreamingReportWriter:
+    """
+    openpyxl'in write-only modunda satırları geldikçe diske yazan rapor yazıcı.
+
+    Satırlar bellekte biriktirilmez; her sayfa kendi geçici dosyasına akar ve
+    sayfalara sırayla ya da karışık olarak yazılabilir. Renklendirme hücre
+    hücre değil, koşullu biçimlendirme kuralları ile yapılır.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.workbook = Workbook(write_only=True)
+        self._sheets = {}
+        self.row_counts = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def add_sheet(self, name: str, columns: list, widths: dict = None):
+        """Başlık satırı biçimlendirilmiş yeni bir sayfa ekler."""
+        worksheet = self.workbook.create_sheet(title=name)
+        widths = widths or {}
+        for index, column in enumerate(columns, 1):
+            if column in widths:
+                worksheet.column_dimensions[get_column_letter(index)].width = widths[column]
+        worksheet.freeze_panes = 'A2'
+
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.fill = HEADER_FILL
+            cell.font = HEADER_FONT
+            cell.alignment = HEADER_ALIGNMENT
+            header.append(cell)
+        worksheet.append(header)
+
+        self._sheets[name] = (worksheet, list(columns))
+        self.row_counts[name] = 0
+        return worksheet
+
+    def write_rows(self, name: str, rows):
+        """Herhangi bir iterable'dan (ör. SQLite cursor) satırları akıtır."""
+        worksheet = self._sheets[name][0]
+        count = 0
+        for row in rows:
+            worksheet.append(list(row))
+            count += 1
+        self.row_counts[name] += count
+        return count
+
+    def write_records(self, name: str, records):
+        """Sözlük kayıtlarını sayfanın sütun sırasına göre yazar."""
+        columns = self._sheets[name][1]
+        return self.write_rows(name, ([record.get(column) for column in columns] for record in records))
+
+    def _column_range(self, name: str, column: str):
+        letter = get_column_letter(self._sheets[name][1].index(column) + 1)
+        return letter, f"{letter}2:{letter}{MAX_EXCEL_ROW}"
+
+    def highlight_text(self, name: str, column: str, text: str, fill: PatternFill):
+        """Sütunda `text` geçen hücreleri tek bir kural ile renklendirir."""
+        letter, cell_range = self._column_range(name, column)
+        rule = FormulaRule(formula=[f'ISNUMBER(SEARCH("{text}",{letter}2))'], fill=fill)
+        self._sheets[name][0].conditional_formatting.add(cell_range, rule)
+
+    def highlight_sign(self, name: str, column: str, positive: PatternFill = FAILURE_FILL,
+                       negative: PatternFill = SUCCESS_FILL):
+        """Sayısal sütunda artışları ve azalışları farklı renklendirir (varsayılan: zam kırmızı)."""
+        _, cell_range = self._column_range(name, column)
+        conditional = self._sheets[name][0].conditional_formatting
+        conditional.add(cell_range, CellIsRule(operator='greaterThan', formula=['0'], fill=positive))
+        conditional.add(cell_range, CellIsRule(operator='lessThan', formula=['0'], fill=negative))
+
+    def close(self):
+        if not self._sheets:
+            # Boş çalışma kitabı kaydedilemez; en azından boş bir sayfa olsun
+            self.workbook.create_sheet()
+        self.workbook.save(self.filename)
@@ -0,0 +1,170 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+def backoff_delay(retry: int, base: float, cap: float, rng=random) -> float:
+    """
+    `retry` numaralı (0'dan başlar) yeniden deneme için üstel bekleme (eşit jitter):
+    üst sınırın yarısı sabit, yarısı rastgele. Aynı anda düşen modellerin
+    aynı saniyede tekrar denenmesini önler.
+    """
+    delay = min(cap, base * 2 ** retry)
+    return delay / 2 + rng.uniform(0, delay / 2)
+
+
+class CircuitBreaker:
+    """
+    Host bazında devre kesici.
+
+    Bir host'ta art arda `failure_threshold` bağlantı/zaman aşımı hatası
+    olursa devre açılır ve `reset_timeout` saniye boyunca o host'a sayfa
+    açılmaz. Süre dolunca tek bir deneme (half-open) yapılır; başarılıysa
+    devre kapanır, değilse tekrar açılır.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened_at = {}
+        self._probing = set()
+        self.opened = 0
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at < self.reset_timeout or host in self._probing:
+                return False
+            # Half-open: yalnızca bir deneme geçer
+            self._probing.add(host)
+            return True
+
+    def record_success(self, host: str):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._probing.discard(host)
+
+    def record_failure(self, host: str):
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            probing = host in self._probing
+            self._probing.discard(host)
+            if probing or failures >= self.failure_threshold:
+                if host not in self._opened_at:
+                    self.opened += 1
+                self._opened_at[host] = time.monotonic()
+
+    def release_probe(self, host: str):
+        """
+        Half-open denemesi host hakkında bilgi vermeden bittiğinde (ör. beklenmedik
+        hata) devrenin durumunu değiştirmeden bir sonraki denemeye yer açar.
+        """
+        with self._lock:
+            self._probing.discard(host)
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            return host in self._opened_at
+
+    def open_hosts(self) -> list:
+        with self._lock:
+            return sorted(self._opened_at)
+
+
+class RetryScheduler:
+    """
+    Başarısız işleri yerinde beklemek yerine kuyruğun sonuna, üstel bekleme
+    ve jitter ile hesaplanan bir zamana erteleyen iş zamanlayıcısı.
+
+    Bekleme süresince diğer işler çalışmaya devam eder. Host'u devre kesicide
+    açık olan işler sayfa açılmadan hemen başarısız sayılır.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 30.0,
+                 breaker: CircuitBreaker = None, rng=None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.rng = rng or random.Random()
+        self.stats = {'attempts': 0, 'retries': 0, 'short_circuited': 0}
+
+    def run(self, jobs, executor, attempt, host_of, give_up, workers: int = 1, on_attempt=None):
+        """
+        İşleri `executor` üzerinde çalıştırır ve her işin nihai sonucunu
+        hazır olduğu sırayla (işin `jobs` içindeki sırası, sonuç) olarak üretir;
+        girdi sırası gerekiyorsa pipeline.in_order ile geri kurulur.
+
+        attempt(job, attempt_no) -> (sonuç, hata): sonuç None değilse iş
+            biter. hata 'host' ise host erişilemiyor sayılır (devre kesiciye
+            yazılır), 'not_found' ise sayfa açılmış ama veri yoktur (host
+            sağlıklı), diğer hatalar host durumunu değiştirmez.
+        host_of(job) -> host adı
+        give_up(job, hata) -> deneme hakkı biten ya da devresi açık işin sonucu
+        workers: aynı anda çalışacak en fazla iş (executor'ın boyutu)
+        on_attempt(job, süre): her deneme bittiğinde çağrılır (sayfa maliyeti için)
+        """
+        counter = itertools.count()
+        # (hazır olma zamanı, sıra, işin sırası, iş, deneme no)
+        queue = [(0.0, next(counter), index, job, 0) for index, job in enumerate(jobs)]
+        heapq.heapify(queue)
+        running = {}
+
+        while queue or running:
+            now = time.monotonic()
+            while queue and queue[0][0] <= now and len(running) < workers:
+                _, _, index, job, attempt_no = heapq.heappop(queue)
+                host = host_of(job)
+                if not self.breaker.allow(host):
+                    self.stats['short_circuited'] += 1
+                    yield index, give_up(job, 'circuit_open')
+                    continue
+                self.stats['attempts'] += 1
+                running[executor.submit(attempt, job, attempt_no)] = (index, job, attempt_no, host, time.monotonic())
+
+            if not running:
+                if queue:
+                    # Yalnızca ertelenmiş işler var; ilki hazır olana kadar bekle
+                    time.sleep(max(0.0, queue[0][0] - time.monotonic()))
+                continue
+
+            timeout = max(0.0, queue[0][0] - time.monotonic()) if queue and len(running) < workers else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, job, attempt_no, host, started = running.pop(future)
+                if on_attempt is not None:
+                    on_attempt(job, time.monotonic() - started)
+                try:
+                    result, error = future.result()
+                except Exception:
+                    result, error = None, 'error'
+
+                if result is not None:
+                    self.breaker.record_success(host)
+                    yield index, result
+                    continue
+
+                if error == 'host':
+                    self.breaker.record_failure(host)
+                elif error == 'not_found':
+                    # Sayfa açıldı ama fiyat yok: host sağlıklı
+                    self.breaker.record_success(host)
+                else:
+                    # Host durumu bilinmiyor; half-open denemesiyse devre kilitli kalmasın
+                    self.breaker.release_probe(host)
+
+                if attempt_no + 1 < self.max_attempts and not self.breaker.is_open(host):
+                    self.stats['retries'] += 1
+                    ready_at = time.monotonic() + backoff_delay(attempt_no, self.base_delay, self.max_delay, self.rng)
+                    heapq.heappush(queue, (ready_at, next(counter), index, job, attempt_no + 1))
+                else:
+                    yield index, give_up(job, error)
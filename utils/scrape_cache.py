@@ -0,0 +1,196 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+DEFAULT_CACHE_FILE = os.getenv("SCRAPE_CACHE_FILE", ".scrape_cache.json")
+
+
+class ScrapeCache:
+    """
+    URL bazında kalıcı küçük önbellek.
+
+    Her model sayfasında hangi fiyat selector'ının eşleştiğini saklar; bir
+    sonraki çalıştırmada önce o selector denenir. Selector artık eşleşmediğinde
+    ya da `max_age_days` boyunca kullanılmadığında kayıt silinir.
+    """
+
+    def __init__(self, filename: str = DEFAULT_CACHE_FILE, max_age_days: int = 30):
+        self.filename = filename
+        self.max_age = timedelta(days=max_age_days)
+        self._lock = threading.Lock()
+        self.entries = self._load()
+        # Bu çalıştırmada güncellenen URL'ler (process worker'larının birleştirmesi için)
+        self._touched = set()
+        self.hits = 0
+        self.misses = 0
+        self.cold = 0
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.filename):
+            return {}
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Önbellek okunamadı, sıfırdan başlanıyor: {e}")
+            return {}
+
+        now = datetime.now()
+        fresh = {}
+        for url, entry in entries.items():
+            try:
+                last_used = datetime.fromisoformat(entry['last_used'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if now - last_used <= self.max_age:
+                fresh[url] = entry
+        return fresh
+
+    def save(self):
+        """Önbelleği atomik olarak diske yazar."""
+        with self._lock:
+            data = json.dumps(self.entries, ensure_ascii=False, indent=2)
+        tmp_name = self.filename + '.tmp'
+        try:
+            with open(tmp_name, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_name, self.filename)
+        except OSError as e:
+            print(f"⚠️  Önbellek kaydedilemedi: {e}")
+
+    def save_touched(self, filename: str):
+        """
+        Yalnızca bu çalıştırmada güncellenen kayıtları ve istatistikleri yazar.
+        Process worker'ları ve parçalar kendi dosyalarına yazar; ana süreç ya da
+        birleştirme adımı merge_file ile birleştirir.
+        """
+        with self._lock:
+            data = {
+                'entries': {url: self.entries.get(url) for url in self._touched},
+                'stats': {'hits': self.hits, 'misses': self.misses, 'cold': self.cold},
+            }
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️  Worker önbelleği kaydedilemedi: {e}")
+
+    def merge_file(self, filename: str):
+        """
+        save_touched ile yazılmış worker/parça dosyasını birleştirir ve siler.
+        Sayfa maliyeti ana süreçte tutulduğu için korunur; diğer alanlar
+        worker'daki haliyle değiştirilir (None: kayıt silinmiş).
+        """
+        try:
+            with open(filename, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Worker önbelleği okunamadı: {e}")
+            return
+        with self._lock:
+            for url, entry in data.get('entries', {}).items():
+                cost = self.entries.get(url, {}).get('cost')
+                merged = dict(entry or {})
+                merged.pop('cost', None)
+                if cost is not None:
+                    merged['cost'] = cost
+                    merged.setdefault('last_used', datetime.now().isoformat(timespec='seconds'))
+                if set(merged) - {'last_used'}:
+                    self.entries[url] = merged
+                else:
+                    self.entries.pop(url, None)
+                self._touched.add(url)
+            stats = data.get('stats', {})
+            self.hits += stats.get('hits', 0)
+            self.misses += stats.get('misses', 0)
+            self.cold += stats.get('cold', 0)
+        os.remove(filename)
+
+    def get_selector(self, url: str):
+        with self._lock:
+            return self.entries.get(url, {}).get('selector')
+
+    def order_selectors(self, url: str, selectors: list) -> list:
+        """Önbellekteki selector'ı listenin başına alır."""
+        cached = self.get_selector(url)
+        if cached is None:
+            return list(selectors)
+        return [cached] + [s for s in selectors if s != cached]
+
+    def record_selector(self, url: str, selector):
+        """
+        Eşleşen selector'ı kaydeder ve isabet istatistiğini günceller.
+        `selector` None ise hiçbir selector eşleşmemiştir.
+        """
+        with self._lock:
+            self._touched.add(url)
+            entry = self.entries.get(url, {})
+            cached = entry.get('selector')
+            if cached is not None:
+                if cached == selector:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            else:
+                self.cold += 1
+            if selector is None:
+                # Artık eşleşmeyen kayıt geçersiz
+                if 'selector' in entry:
+                    del entry['selector']
+            else:
+                entry['selector'] = selector
+            if set(entry) - {'last_used'}:
+                entry['last_used'] = datetime.now().isoformat(timespec='seconds')
+                self.entries[url] = entry
+            else:
+                self.entries.pop(url, None)
+
+    def get_tier(self, url: str, recheck_days: int = 7):
+        """
+        URL için en son işe yarayan katmanı ('http' / 'browser') döndürür.
+        Kayıt `recheck_days` günden eskiyse None döner: 'browser' için HTTP yolu
+        tekrar denenir, 'http' için HTTP sonucu tekrar tarayıcıyla doğrulanır.
+        """
+        with self._lock:
+            entry = self.entries.get(url, {})
+            tier = entry.get('tier')
+            checked = entry.get('tier_checked')
+        if tier and checked:
+            try:
+                if datetime.now() - datetime.fromisoformat(checked) > timedelta(days=recheck_days):
+                    return None
+            except ValueError:
+                return None
+        return tier
+
+    def record_tier(self, url: str, tier: str, http_probed: bool = True):
+        """Çalışan katmanı kaydeder; HTTP yolu denendiyse kontrol tarihini yeniler."""
+        with self._lock:
+            self._touched.add(url)
+            entry = self.entries.setdefault(url, {})
+            now = datetime.now().isoformat(timespec='seconds')
+            if http_probed or entry.get('tier') != tier:
+                entry['tier_checked'] = now
+            entry['tier'] = tier
+            entry['last_used'] = now
+
+    def record_cost(self, url: str, seconds: float, weight: float = 0.3):
+        """Sayfanın maliyetini (tüm denemelerin süresi) üstel hareketli ortalamayla günceller."""
+        with self._lock:
+            self._touched.add(url)
+            entry = self.entries.setdefault(url, {})
+            previous = entry.get('cost')
+            cost = seconds if previous is None else previous + weight * (seconds - previous)
+            # Yuvarlanır: parçalara bölme her makinede aynı sonucu vermeli
+            entry['cost'] = round(cost, 1)
+            entry['last_used'] = datetime.now().isoformat(timespec='seconds')
+
+    def get_cost(self, url: str, default: float = None):
+        with self._lock:
+            return self.entries.get(url, {}).get('cost', default)
+
+    def hit_rate(self):
+        """Önbellekte kaydı olan URL'ler için isabet oranı (kayıt yoksa None)."""
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total else None